@@ -87,7 +87,7 @@ class IAuthService(ABC):
         pass
 
     @abstractmethod
-    def is_authorized_by_role(self, access_token, roles):
+    def is_authorized_by_role(self, access_token, roles, principal=None):
         """
         Determine if the provided access token is valid and authorized for at least
         one of the specified roles
@@ -96,6 +96,8 @@ class IAuthService(ABC):
         :type access_token: str
         :param roles: roles to check for
         :type roles: {str}
+        :param principal: caller resolved by AuthMiddleware; if given, the token is not verified again
+        :type principal: AuthenticatedPrincipal
         :return: true if token valid and authorized, false otherwise
         :rtype: bool
         """
@@ -32,6 +32,19 @@ class IUserService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_user_by_auth_id(self, auth_id):
+        """
+        Get user, with their role loaded, associated with auth_id
+
+        :param auth_id: user's auth_id
+        :type auth_id: str
+        :return: the user
+        :rtype: User
+        :raises ValueError: if no user has this auth_id
+        """
+        pass
+
     @abstractmethod
     def get_user_role_by_auth_id(self, auth_id):
         """
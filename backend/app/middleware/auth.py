@@ -36,8 +36,9 @@ def has_roles(required_roles: List[str]):
         # Get the token from authorization header
         token = credentials.credentials
 
-        # Use the auth service to check if the user has the required role
-        is_authorized = auth_service.is_authorized_by_role(token, set(required_roles))
+        # Use the caller AuthMiddleware already resolved; the token is only verified again without one
+        principal = getattr(request.state, "principal", None)
+        is_authorized = auth_service.is_authorized_by_role(token, set(required_roles), principal=principal)
 
         if not is_authorized:
             logger.warning(f"Access denied: user doesn't have required roles: {required_roles}")
@@ -1,20 +1,50 @@
+"""
+Authentication middleware.
+
+A pure ASGI middleware: the blocking parts of authenticating a request (Firebase token
+verification and the users lookup) run on a bounded thread pool of ``AUTH_VERIFY_WORKERS``
+(default 8) threads, so the event loop keeps serving other requests while a check is in flight.
+"""
+
+import asyncio
+import contextvars
+import hashlib
 import logging
-from typing import List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 import firebase_admin.auth
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.models import Role, User
+from app.schemas.auth import AuthenticatedPrincipal
 from app.utilities.constants import LOGGER_NAME
+from app.utilities.db_utils import SessionLocal
+from app.utilities.token_cache import VerifiedToken, token_cache
+
+AUTH_VERIFY_WORKERS = int(os.getenv("AUTH_VERIFY_WORKERS", "8"))
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp, public_paths: List[str] = None):
-        super().__init__(app)
+class AuthMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        public_paths: List[str] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_workers: int = AUTH_VERIFY_WORKERS,
+    ):
+        self.app = app
         self.public_paths = public_paths or []
+        self.session_factory = session_factory
         self.logger = logging.getLogger(LOGGER_NAME("auth_middleware"))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="auth-verify")
+        # Verifications in flight on this event loop, keyed by token hash
+        self._in_flight: Dict[str, asyncio.Future] = {}
 
     def is_public_path(self, path: str) -> bool:
         for public_path in self.public_paths:
@@ -26,15 +56,84 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 return True
         return False
 
-    async def dispatch(self, request: Request, call_next):
+    def resolve_principal(self, auth_id: str, email: str, email_verified: bool) -> AuthenticatedPrincipal:
+        """Look up the internal user id and role for a verified Firebase user in one query."""
+        with self.session_factory() as db:
+            row = (
+                db.query(User.id, Role.name)
+                .outerjoin(Role, User.role_id == Role.id)
+                .filter(User.auth_id == auth_id)
+                .first()
+            )
+        return AuthenticatedPrincipal(
+            auth_id=auth_id,
+            user_id=row[0] if row else None,
+            role=row[1] if row else None,
+            email=email,
+            email_verified=email_verified,
+        )
+
+    async def authenticate(self, token: str) -> Tuple[VerifiedToken, Optional[AuthenticatedPrincipal]]:
+        """
+        Verify a token and resolve its principal on the worker pool, without blocking the event loop.
+        Concurrent requests carrying the same token share a single verification.
+        """
+        key = hashlib.sha256(token.encode()).hexdigest()
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            loop = asyncio.get_running_loop()
+            # In this request's context, so its Firebase and database time count towards it
+            context = contextvars.copy_context()
+            in_flight = loop.run_in_executor(self._executor, context.run, self._authenticate_blocking, token)
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one client disconnecting does not cancel the check for the others waiting on it
+        return await asyncio.shield(in_flight)
+
+    def _authenticate_blocking(self, token: str) -> Tuple[VerifiedToken, Optional[AuthenticatedPrincipal]]:
+        # Verify the token with Firebase (served from the token cache while it is fresh)
+        verified = token_cache.verify(token)
+        try:
+            principal = self.resolve_principal(verified.uid, verified.claims.get("email"), verified.email_verified)
+        except Exception as e:
+            # Without a principal, authorization checks fall back to resolving the token themselves
+            self.logger.error(f"Failed to resolve principal for {verified.uid}: {str(e)}")
+            principal = None
+        return verified, principal
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Allow preflight CORS requests to pass through without auth
         if request.method.upper() == "OPTIONS":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         if self.is_public_path(request.url.path):
             self.logger.info(f"Skipping auth for public path: {request.url.path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        response = await self._authenticate_request(request)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        user_id = request.state.user_id
 
+        async def send_with_user_header(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Auth-User-ID", user_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_user_header)
+
+    async def _authenticate_request(self, request: Request) -> Optional[Response]:
+        """Populate request.state for an authenticated request, or return the error response."""
         # Get authentication token from header
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
@@ -43,34 +142,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         token = auth_header.split(" ")[1]
         try:
-            # Verify the token with Firebase
-            self.logger.info(f"Verifying token for request to {request.url.path}")
-            decoded_token = firebase_admin.auth.verify_id_token(token, check_revoked=True)
-
-            # Get Firebase user information
-            firebase_user = firebase_admin.auth.get_user(decoded_token["uid"])
-
-            request.state.user_id = decoded_token["uid"]
-            request.state.user_email = decoded_token.get("email")
-            request.state.email_verified = firebase_user.email_verified
-            request.state.user_claims = decoded_token.get("claims", {})
-
-            # Add complete user info for convenience
-            request.state.user_info = {
-                "uid": decoded_token["uid"],
-                "email": decoded_token.get("email"),
-                "name": decoded_token.get("name", ""),
-                "picture": decoded_token.get("picture", ""),
-                "email_verified": firebase_user.email_verified,
-            }
-
-            response = await call_next(request)
-
-            if isinstance(response, Response):
-                response.headers["X-Auth-User-ID"] = decoded_token["uid"]
-
-            return response
-
+            self.logger.debug(f"Verifying token for request to {request.url.path}")
+            verified, principal = await self.authenticate(token)
         except firebase_admin.auth.RevokedIdTokenError:
             self.logger.warning(f"Token has been revoked: {request.url.path}")
             return JSONResponse(
@@ -89,3 +162,22 @@ class AuthMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             self.logger.error(f"Authentication error for {request.url.path}: {str(e)}")
             return JSONResponse(status_code=401, content={"detail": f"Authentication failed: {str(e)}"})
+
+        decoded_token = verified.claims
+        request.state.user_id = decoded_token["uid"]
+        request.state.user_email = decoded_token.get("email")
+        request.state.email_verified = verified.email_verified
+        request.state.user_claims = decoded_token.get("claims", {})
+
+        # Add complete user info for convenience
+        request.state.user_info = {
+            "uid": decoded_token["uid"],
+            "email": decoded_token.get("email"),
+            "name": decoded_token.get("name", ""),
+            "picture": decoded_token.get("picture", ""),
+            "email_verified": verified.email_verified,
+        }
+
+        # The caller resolved once; has_roles and the AuthService checks read it from here
+        request.state.principal = principal
+        return None
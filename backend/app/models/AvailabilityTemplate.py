@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Time
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, Time
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -14,6 +14,7 @@ class AvailabilityTemplate(Base):
     """
 
     __tablename__ = "availability_templates"
+    __table_args__ = (Index("ix_availability_templates_user_id_is_active", "user_id", "is_active"),)
 
     id = Column(Integer, primary_key=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
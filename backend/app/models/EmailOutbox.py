@@ -0,0 +1,57 @@
+import uuid
+from datetime import datetime, timezone
+from enum import Enum as PyEnum
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+
+from .Base import Base
+
+
+class EmailOutboxStatus(str, PyEnum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EmailOutbox(Base):
+    """
+    An email waiting to be sent, written in the same transaction as the change it announces.
+    ``EmailOutboxDispatcher`` sends it in the background.
+    """
+
+    __tablename__ = "email_outbox"
+    # The dispatcher's poll: due pending rows, and expired leases of rows being sent
+    __table_args__ = (Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # The same key is never enqueued twice, so a retried request does not send a second email
+    idempotency_key = Column(Text, nullable=False, unique=True)
+    to_email = Column(Text, nullable=False)
+    source_email = Column(Text, nullable=False)
+    template_name = Column(Text, nullable=False)
+    template_data = Column(JSON, nullable=False)
+    status = Column(
+        SQLEnum(
+            EmailOutboxStatus,
+            name="email_outbox_status_enum",
+            create_type=False,
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+        ),
+        nullable=False,
+        default=EmailOutboxStatus.PENDING,
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    # While sending: when another dispatcher may assume this one died and take the row over
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    message_id = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
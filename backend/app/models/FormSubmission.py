@@ -1,7 +1,7 @@
 import uuid
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -18,6 +18,7 @@ class FormSubmissionStatus(str, PyEnum):
 
 class FormSubmission(Base):
     __tablename__ = "form_submissions"
+    __table_args__ = (Index("ix_form_submissions_user_id_form_id", "user_id", "form_id"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -8,11 +8,21 @@ from .Base import Base
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        # Partial indexes over active (not soft-deleted) matches
+        Index(
+            "ix_matches_active_volunteer_id_status",
+            "volunteer_id",
+            "match_status_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_matches_active_status", "match_status_id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id = Column(Integer, primary_key=True)
 
-    participant_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    volunteer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    participant_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    volunteer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
 
     # the chosen time block
     chosen_time_block_id = Column(Integer, ForeignKey("time_blocks.id"), nullable=True)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Text
+
+from .Base import Base
+
+
+class TokenRevocation(Base):
+    """
+    When a Firebase user's tokens were last revoked. With local token verification every process
+    reloads these, so ID tokens issued before a revocation are rejected by all of them.
+    """
+
+    __tablename__ = "token_revocations"
+
+    auth_id = Column(Text, primary_key=True)
+    # Whole seconds, like Firebase's tokensValidAfterTime
+    revoked_at = Column(DateTime(timezone=True), nullable=False, index=True)
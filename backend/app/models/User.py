@@ -33,7 +33,7 @@ class User(Base):
     last_name = Column(Text, nullable=True)
     email = Column(Text, unique=True, nullable=False)
     role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
-    auth_id = Column(Text, nullable=False)
+    auth_id = Column(Text, nullable=False, index=True)
     approved = Column(Boolean, default=False)
     active = Column(Boolean, nullable=False, default=True)
     pending_volunteer_request = Column(Boolean, nullable=False, default=False)
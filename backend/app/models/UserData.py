@@ -41,7 +41,7 @@ class UserData(Base):
     __tablename__ = "user_data"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
 
     # Personal Information
     first_name = Column(Text, nullable=True)
@@ -9,6 +9,7 @@ from app.utilities.constants import LOGGER_NAME
 # when autogenerating new migration
 from .AvailabilityTemplate import AvailabilityTemplate
 from .Base import Base
+from .EmailOutbox import EmailOutbox, EmailOutboxStatus
 from .Experience import Experience
 from .Form import Form
 from .FormSubmission import FormSubmission, FormSubmissionStatus
@@ -20,6 +21,7 @@ from .Role import Role
 from .SuggestedTime import suggested_times
 from .Task import Task, TaskPriority, TaskStatus, TaskType
 from .TimeBlock import TimeBlock
+from .TokenRevocation import TokenRevocation
 from .Treatment import Treatment
 from .User import FormStatus, Language, User
 from .UserData import UserData
@@ -51,13 +53,16 @@ __all__ = [
     "TaskPriority",
     "TaskStatus",
     "VolunteerData",
+    "EmailOutbox",
+    "EmailOutboxStatus",
+    "TokenRevocation",
 ]
 
 log = logging.getLogger(LOGGER_NAME("models"))
 
 
 def run_migrations():
-    log.info("Running run_migrations in models/__init__ on server startup")
+    log.info("Running run_migrations in models/__init__")
 
     alembic_cfg = Config("alembic.ini")
     # Emulates `alembic upgrade head` to migrate up to latest revision
@@ -0,0 +1,52 @@
+import logging
+import time
+from dataclasses import asdict
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from app.middleware.auth import has_roles
+from app.schemas.user import UserRole
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.db_pool import pool_status
+from app.utilities.db_utils import async_engine, engine, pool_settings
+
+log = logging.getLogger(LOGGER_NAME("health"))
+
+router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+)
+
+
+@router.get("")
+async def health():
+    """Liveness check for the API process."""
+    return {"status": "ok"}
+
+
+@router.get("/db")
+async def db_health(_authorized: bool = has_roles([UserRole.ADMIN])):
+    """
+    Database reachability plus connection pool telemetry for this worker process: pool settings,
+    checked-out and overflow connections, checkout wait times and connection churn per engine.
+    Admin only, since the telemetry describes the deployment.
+    """
+    body = {
+        "status": "ok",
+        "settings": asdict(pool_settings),
+        "engines": {"sync": pool_status(engine), "async": pool_status(async_engine)},
+    }
+    started = time.perf_counter()
+    try:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        body["ping_ms"] = round(1000 * (time.perf_counter() - started), 3)
+        return body
+    except Exception as e:
+        # Driver errors can name the host, database and user, so they are only logged
+        log.error(f"Database health check failed: {str(e)}")
+        body["status"] = "unavailable"
+        body["error"] = "Database unavailable"
+        return JSONResponse(status_code=503, content=body)
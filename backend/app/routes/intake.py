@@ -12,8 +12,9 @@ from app.models import Experience, Form, FormSubmission, Task, TaskType, Treatme
 from app.models.User import FormStatus, Language
 from app.schemas.user import UserRole
 from app.services.implementations.form_processor import FormProcessor
-from app.utilities.db_utils import get_db
-from app.utilities.ses_email_service import SESEmailService
+from app.utilities.db_utils import get_db, get_read_db
+from app.utilities.email_outbox import OutboxEmailService
+from app.utilities.volunteer_index import volunteer_index
 
 # ===== Schemas =====
 
@@ -266,24 +267,29 @@ async def create_form_submission(
         # NOTE: IntakeFormProcessor is NOT called here anymore.
         # Full processing happens when admin approves the form.
 
-        # Commit everything together
-        db.commit()
-        db.refresh(db_submission)
-
-        # Send intake form confirmation email for intake forms
+        # Queue the intake form confirmation email; it is sent once the submission is committed
         if form and form.type == "intake":
             try:
-                ses_service = SESEmailService()
-                # Get language (enum values are already "en" or "fr")
-                language = target_user.language.value if target_user.language else "en"
-
-                first_name = target_user.first_name if target_user.first_name else None
-                ses_service.send_intake_form_confirmation_email(
-                    to_email=target_user.email, first_name=first_name, language=language
-                )
+                with db.begin_nested():
+                    # Resubmissions reuse the submission row, so its submission time tells them apart
+                    submitted_at = int(db_submission.submitted_at.timestamp())
+                    ses_service = OutboxEmailService(db, event_key=f"intake-{db_submission.id}-{submitted_at}")
+                    # Get language (enum values are already "en" or "fr")
+                    language = target_user.language.value if target_user.language else "en"
+
+                    first_name = target_user.first_name if target_user.first_name else None
+                    ses_service.send_intake_form_confirmation_email(
+                        to_email=target_user.email, first_name=first_name, language=language
+                    )
             except Exception as e:
                 # Log error but don't fail the request
-                print(f"Failed to send intake form confirmation email: {str(e)}")
+                print(f"Failed to queue intake form confirmation email: {str(e)}")
+
+        # Commit everything together
+        db.commit()
+        db.refresh(db_submission)
+        # Intake submissions can change the user's language
+        volunteer_index.refresh_user(db, target_user.id)
 
         # Create INTAKE_FORM_REVIEW task for intake forms and role change forms
         if form and form.type in ("intake", "become_participant", "become_volunteer"):
@@ -338,7 +344,7 @@ async def get_form_submissions(
     user_id: Optional[UUID] = Query(None, description="Filter by user ID (admin only)"),
     form_id: Optional[UUID] = Query(None, description="Filter by form ID"),
     request: Request = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     authorized: bool = has_roles([UserRole.ADMIN, UserRole.PARTICIPANT, UserRole.VOLUNTEER]),
 ):
     """
@@ -1,13 +1,23 @@
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.middleware.auth import has_roles
-from app.schemas.matching import AdminMatchesResponse, RelevantUsersResponse
+from app.schemas.matching import (
+    AdminMatchesResponse,
+    AssignmentProposalResponse,
+    AssignmentRequest,
+    BatchMatchRequest,
+    BatchMatchResult,
+    RelevantUsersResponse,
+)
 from app.schemas.user import UserRole
 from app.services.implementations.matching_service import MatchingService
-from app.utilities.db_utils import get_db
+from app.utilities.db_utils import get_read_db
 
 router = APIRouter(
     prefix="/matching",
@@ -15,7 +25,8 @@ router = APIRouter(
 )
 
 
-def get_matching_service(db: Session = Depends(get_db)):
+def get_matching_service(db: Session = Depends(get_read_db)):
+    # Matching only reads, so it can be served by the read replica
     return MatchingService(db)
 
 
@@ -35,20 +46,80 @@ async def get_matches(user_id: UUID, matching_service: MatchingService = Depends
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/admin/batch")
+async def get_batch_matches(
+    request: BatchMatchRequest,
+    matching_service: MatchingService = Depends(get_matching_service),
+    _authorized: bool = has_roles([UserRole.ADMIN]),
+):
+    """
+    Rank volunteers for many participants at once (explicit ids, or all with a pending volunteer request).
+    The volunteer pool is loaded once and the response streams newline-delimited JSON, one
+    BatchMatchResult per participant, in request order.
+    """
+    try:
+        # The batch is loaded from the database in the threadpool; the stream is iterated there too
+        results = await run_in_threadpool(
+            matching_service.get_batch_matches,
+            participant_ids=None if request.all_pending else request.participant_ids,
+            limit=request.limit,
+            min_score=request.min_score,
+            use_process_pool=request.use_process_pool,
+        )
+        lines = (BatchMatchResult(**result).model_dump_json() + "\n" for result in results)
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/admin/assignments", response_model=AssignmentProposalResponse)
+async def propose_assignments(
+    request: AssignmentRequest,
+    matching_service: MatchingService = Depends(get_matching_service),
+    _authorized: bool = has_roles([UserRole.ADMIN]),
+):
+    """
+    Propose one volunteer per participant, maximizing the total match score across all selected
+    participants while keeping every volunteer within the capacity limit. Nothing is saved;
+    approve proposals by submitting their match_requests to POST /matches.
+    """
+    try:
+        proposal = await matching_service.propose_assignments(
+            participant_ids=None if request.all_pending else request.participant_ids,
+            capacity=request.capacity,
+            candidates_per_participant=request.candidates_per_participant,
+            min_score=request.min_score,
+            use_process_pool=request.use_process_pool,
+        )
+        return AssignmentProposalResponse(**proposal)
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/admin/{participant_id}", response_model=AdminMatchesResponse)
 async def get_admin_matches(
     participant_id: UUID,
+    page_size: Optional[int] = Query(None, ge=1, le=500, description="Maximum number of candidates to return"),
+    min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum match score (0-100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     matching_service: MatchingService = Depends(get_matching_service),
     _authorized: bool = has_roles([UserRole.ADMIN]),
 ):
     """
     Get potential volunteer matches for a participant with full volunteer details for admin view.
-    Returns all volunteers with their complete information (timezone, age, diagnosis, treatments,
-    experiences) and match scores, sorted by score (highest first).
+    Returns volunteers with their complete information (timezone, age, diagnosis, treatments,
+    experiences) and match scores, sorted by score (highest first). Without page_size all
+    volunteers are returned; with it, pass next_cursor back as cursor to fetch the next page.
     """
     try:
-        matched_data = await matching_service.get_admin_matches(participant_id)
-        return AdminMatchesResponse(matches=matched_data)
+        page = await matching_service.get_admin_matches(
+            participant_id, page_size=page_size, min_score=min_score, cursor=cursor
+        )
+        return AdminMatchesResponse(**page)
     except ValueError as ve:
         raise HTTPException(status_code=404, detail=str(ve))
     except HTTPException as http_ex:
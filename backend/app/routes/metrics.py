@@ -0,0 +1,34 @@
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+router = APIRouter(tags=["metrics"])
+
+
+def require_metrics_token(authorization: Optional[str] = Header(default=None)) -> None:
+    """
+    Scrapers authenticate with ``Authorization: Bearer <METRICS_TOKEN>``, not a Firebase token.
+    Without METRICS_TOKEN the endpoint does not exist.
+    """
+    metrics_token = os.getenv("METRICS_TOKEN")
+    if not metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), metrics_token.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(_: None = Depends(require_metrics_token)):
+    """
+    Request, database and external call metrics in Prometheus text format.
+    With several worker processes, set PROMETHEUS_MULTIPROC_DIR so every worker's metrics are reported.
+    """
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
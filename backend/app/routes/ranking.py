@@ -12,6 +12,7 @@ from app.schemas.user import UserRole
 from app.services.implementations.ranking_service import RankingService
 from app.services.implementations.user_service import UserService
 from app.utilities.db_utils import get_db
+from app.utilities.reference_data import reference_data
 from app.utilities.service_utils import get_user_service
 from app.utilities.task_utils import create_volunteer_app_review_task
 
@@ -152,17 +153,17 @@ async def get_ranking_preferences(
             name = None
             if pref.kind == "quality" and pref.quality_id:
                 item_id = pref.quality_id
-                quality = db.query(Quality).filter(Quality.id == pref.quality_id).first()
+                quality = reference_data.get_by_id(db, Quality, pref.quality_id)
                 if quality:
                     name = quality.label
             elif pref.kind == "treatment" and pref.treatment_id:
                 item_id = pref.treatment_id
-                treatment = db.query(Treatment).filter(Treatment.id == pref.treatment_id).first()
+                treatment = reference_data.get_by_id(db, Treatment, pref.treatment_id)
                 if treatment:
                     name = treatment.name
             elif pref.kind == "experience" and pref.experience_id:
                 item_id = pref.experience_id
-                experience = db.query(Experience).filter(Experience.id == pref.experience_id).first()
+                experience = reference_data.get_by_id(db, Experience, pref.experience_id)
                 if experience:
                     name = experience.name
 
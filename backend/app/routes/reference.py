@@ -0,0 +1,29 @@
+from typing import Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.middleware.auth import has_roles
+from app.schemas.user import UserRole
+from app.utilities.db_utils import get_db
+from app.utilities.reference_data import reference_data
+
+router = APIRouter(
+    prefix="/reference-data",
+    tags=["reference-data"],
+)
+
+
+@router.post("/refresh", response_model=Dict[str, int])
+async def refresh_reference_data(
+    db: Session = Depends(get_db),
+    _authorized: bool = has_roles([UserRole.ADMIN]),
+):
+    """
+    Reload the cached qualities, treatments, experiences, roles and match statuses in this
+    server process (e.g. after re-running the seeds). Returns the number of rows per table.
+    """
+    try:
+        return reference_data.refresh(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
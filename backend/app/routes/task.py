@@ -13,7 +13,7 @@ from app.schemas.task import (
 )
 from app.schemas.user import UserRole
 from app.services.implementations.task_service import TaskService
-from app.utilities.service_utils import get_task_service
+from app.utilities.service_utils import get_read_task_service, get_task_service
 
 router = APIRouter(
     prefix="/tasks",
@@ -45,7 +45,7 @@ async def get_tasks(
     priority: Optional[str] = Query(None, description="Filter by task priority"),
     task_type: Optional[str] = Query(None, description="Filter by task type"),
     assignee_id: Optional[str] = Query(None, description="Filter by assignee ID"),
-    task_service: TaskService = Depends(get_task_service),
+    task_service: TaskService = Depends(get_read_task_service),
     authorized: bool = has_roles([UserRole.ADMIN]),
 ):
     """
@@ -16,7 +16,7 @@ from app.schemas.user import (
 from app.schemas.user_data import UserDataUpdateRequest
 from app.services.implementations.user_service import UserService
 from app.utilities.db_utils import get_db
-from app.utilities.service_utils import get_user_service
+from app.utilities.service_utils import get_read_user_service, get_user_service
 
 router = APIRouter(
     prefix="/users",
@@ -47,7 +47,7 @@ async def create_user(
 @router.get("/", response_model=UserListResponse)
 async def get_users(
     admin: Optional[bool] = Query(False, description="If true, returns admin users only"),
-    user_service: UserService = Depends(get_user_service),
+    user_service: UserService = Depends(get_read_user_service),
     authorized: bool = has_roles([UserRole.ADMIN]),
 ):
     try:
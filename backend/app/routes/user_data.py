@@ -9,11 +9,13 @@ from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session, joinedload
 
 from app.middleware.auth import has_roles
-from app.models import Experience, Task, TaskType, Treatment, User, UserData
+from app.models import Task, TaskType, User, UserData
 from app.models.User import Language
 from app.models.VolunteerData import VolunteerData
 from app.schemas.user import UserRole
 from app.utilities.db_utils import get_db
+from app.utilities.user_data_links import REFERENCE_LINKS, replace_links
+from app.utilities.volunteer_index import volunteer_index
 
 router = APIRouter(
     prefix="/user-data",
@@ -336,37 +338,10 @@ async def update_my_user_data(
                 except ValueError:
                     pass
 
-        # Update treatments (many-to-many)
-        if "treatments" in update_data:
-            user_data.treatments.clear()
-            for treatment_name in update_data["treatments"]:
-                treatment = db.query(Treatment).filter(Treatment.name == treatment_name).first()
-                if treatment:
-                    user_data.treatments.append(treatment)
-
-        # Update experiences (many-to-many)
-        if "experiences" in update_data:
-            user_data.experiences.clear()
-            for experience_name in update_data["experiences"]:
-                experience = db.query(Experience).filter(Experience.name == experience_name).first()
-                if experience:
-                    user_data.experiences.append(experience)
-
-        # Update loved one treatments
-        if "loved_one_treatments" in update_data:
-            user_data.loved_one_treatments.clear()
-            for treatment_name in update_data["loved_one_treatments"]:
-                treatment = db.query(Treatment).filter(Treatment.name == treatment_name).first()
-                if treatment:
-                    user_data.loved_one_treatments.append(treatment)
-
-        # Update loved one experiences
-        if "loved_one_experiences" in update_data:
-            user_data.loved_one_experiences.clear()
-            for experience_name in update_data["loved_one_experiences"]:
-                experience = db.query(Experience).filter(Experience.name == experience_name).first()
-                if experience:
-                    user_data.loved_one_experiences.append(experience)
+        # Update treatments and experiences (many-to-many): only changed links are written
+        for field in REFERENCE_LINKS:
+            if field in update_data:
+                replace_links(db, user_data, field, update_data[field])
 
         # Update user language (stored on User model, not UserData)
         if "language" in update_data:
@@ -397,6 +372,7 @@ async def update_my_user_data(
         # Commit the main profile update first
         db.commit()
         db.refresh(user_data)
+        volunteer_index.refresh_user(db, current_user.id)
 
         # Create PROFILE_UPDATE task if user is not an admin (after main commit to avoid rollback)
         if current_user.role and current_user.role.name != "admin":
@@ -1,3 +1,6 @@
+from typing import Optional
+from uuid import UUID
+
 from pydantic import BaseModel, ConfigDict
 
 from .user import UserCreateResponse
@@ -33,3 +36,17 @@ class AuthResponse(Token):
     user: UserCreateResponse
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AuthenticatedPrincipal(BaseModel):
+    """
+    The authenticated caller of a request, resolved once by AuthMiddleware
+    from the verified ID token and the matching users row
+    """
+
+    auth_id: str
+    # None when the Firebase user has no users row yet (e.g. during sign-up)
+    user_id: Optional[UUID] = None
+    role: Optional[str] = None
+    email: Optional[str] = None
+    email_verified: bool = False
@@ -5,8 +5,9 @@ Pydantic schemas for matching-related data validation and serialization.
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
+from .match import MatchCreateRequest
 from .user import UserBase
 
 
@@ -60,6 +61,96 @@ class AdminMatchCandidate(BaseModel):
 class AdminMatchesResponse(BaseModel):
     """
     Response schema for admin matching endpoint containing a list of match candidates with full details.
+    next_cursor is set when more candidates are available for the requested page size.
     """
 
     matches: List[AdminMatchCandidate]
+    next_cursor: Optional[str] = None
+
+
+class ParticipantSelection(BaseModel):
+    """
+    Participants for a batch operation: either explicit participant ids or all participants
+    with a pending volunteer request.
+    """
+
+    participant_ids: Optional[List[UUID]] = None
+    all_pending: bool = False
+
+    @model_validator(mode="after")
+    def check_participants(self):
+        if self.all_pending == (self.participant_ids is not None):
+            raise ValueError("Provide either participant_ids or all_pending")
+        if self.participant_ids is not None and not 1 <= len(self.participant_ids) <= 1000:
+            raise ValueError("participant_ids must contain between 1 and 1000 ids")
+        return self
+
+
+class BatchMatchRequest(ParticipantSelection):
+    """
+    Request schema for batch matching.
+    """
+
+    limit: int = Field(10, ge=1, le=100)  # Candidates per participant
+    min_score: Optional[float] = Field(None, ge=0, le=100)
+    use_process_pool: bool = False
+
+
+class BatchMatchCandidate(BaseModel):
+    """
+    Schema for a ranked volunteer in a batch matching result.
+    """
+
+    volunteer_id: UUID
+    first_name: Optional[str]
+    last_name: Optional[str]
+    email: str
+    match_score: float  # 0-100 scale
+    match_count: int = 0  # Number of active matches for this volunteer
+
+
+class BatchMatchResult(BaseModel):
+    """
+    One line of the batch matching stream: a participant's ranked candidates, or why they could not be matched.
+    """
+
+    participant_id: UUID
+    matches: List[BatchMatchCandidate] = []
+    error: Optional[str] = None
+
+
+class AssignmentRequest(ParticipantSelection):
+    """
+    Request schema for the global assignment solver.
+    """
+
+    capacity: int = Field(3, ge=1, le=20)  # Maximum active matches per volunteer, including existing ones
+    candidates_per_participant: int = Field(50, ge=1, le=500)
+    min_score: Optional[float] = Field(None, ge=0, le=100)
+    use_process_pool: bool = False
+
+
+class AssignmentProposal(BaseModel):
+    """
+    Schema for a proposed participant-volunteer match from the assignment solver.
+    """
+
+    participant_id: UUID
+    volunteer_id: UUID
+    first_name: Optional[str]
+    last_name: Optional[str]
+    email: str
+    match_score: float  # 0-100 scale
+    match_count: int = 0  # Active matches the volunteer already has
+
+
+class AssignmentProposalResponse(BaseModel):
+    """
+    Response schema for the assignment solver. Proposals are not saved; each entry of
+    match_requests can be submitted as-is to create the proposed match.
+    """
+
+    proposals: List[AssignmentProposal]
+    match_requests: List[MatchCreateRequest]
+    unassigned_participant_ids: List[UUID]
+    total_score: float  # Sum of proposed match scores (0-100 scale each)
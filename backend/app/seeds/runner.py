@@ -4,12 +4,12 @@ import argparse
 import logging
 import os
 import sys
+import time
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.utilities.constants import LOGGER_NAME
+from app.utilities.db_utils import SessionLocal
 
 # Import all seed functions
 from .experiences import seed_experiences
@@ -18,6 +18,7 @@ from .match_status import seed_match_status
 from .qualities import seed_qualities
 from .ranking_preferences import seed_ranking_preferences
 from .roles import seed_roles
+from .synthetic import seed_synthetic_users
 from .treatments import seed_treatments
 from .users import seed_users
 
@@ -28,26 +29,24 @@ log = logging.getLogger(LOGGER_NAME("seeds"))
 
 
 def get_database_session():
-    """Create a database session for seeding."""
-    database_url = os.getenv("POSTGRES_DATABASE_URL")
-    if not database_url:
-        raise ValueError("POSTGRES_DATABASE_URL environment variable is required")
-
-    engine = create_engine(database_url)
-    SessionLocal = sessionmaker(bind=engine)
+    """Create a database session for seeding, from the application's configured engine and pool."""
     return SessionLocal()
 
 
-def seed_database(verbose: bool = True) -> None:
+def seed_database(verbose: bool = True, scale: int = 0, batch_size: int = 5000) -> None:
     """
     Run all database seeding functions.
 
     Args:
         verbose: Whether to print detailed output
+        scale: Number of synthetic users to generate for performance testing (0 to skip)
+        batch_size: Rows per COPY/INSERT batch when generating synthetic users
     """
     # Check environment to determine if we should seed test data
     env = os.getenv("ENV", "development").lower()
     is_production = env == "production"
+    if scale and is_production:
+        raise ValueError("Synthetic users (--scale) cannot be seeded in production")
 
     if verbose:
         print("🌱 Starting database seeding...")
@@ -91,6 +90,14 @@ def seed_database(verbose: bool = True) -> None:
                 log.error(f"Error seeding {name}: {str(e)}")
                 raise
 
+        if scale:
+            if verbose:
+                print(f"\n📦 Seeding {scale} synthetic users...")
+            started = time.perf_counter()
+            seed_synthetic_users(session, scale, batch_size=batch_size, verbose=verbose)
+            if verbose:
+                print(f"✅ Synthetic users seeded in {time.perf_counter() - started:.1f}s")
+
         if verbose:
             print("\n🎉 Database seeding completed successfully!")
 
@@ -109,11 +116,19 @@ def main():
     parser = argparse.ArgumentParser(description="Seed the LLSC database with reference data")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress output")
     parser.add_argument("--env", help="Environment (currently unused but for future extension)")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also generate N synthetic users with related data for performance testing",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk insert batch with --scale")
 
     args = parser.parse_args()
 
     try:
-        seed_database(verbose=not args.quiet)
+        seed_database(verbose=not args.quiet, scale=args.scale, batch_size=args.batch_size)
         sys.exit(0)
     except Exception as e:
         print(f"Seeding failed: {str(e)}")
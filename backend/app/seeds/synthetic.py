@@ -0,0 +1,386 @@
+"""
+Seed a large synthetic dataset for performance testing.
+
+``python -m app.seeds.runner --scale 50000`` generates that many users (participants, volunteers
+and a few admins) with user data, treatments and experiences, volunteer data, ranking preferences,
+availability templates, intake form submissions, matches in every status and tasks. Rows are
+generated up front and bulk loaded with COPY (psycopg2) or batched multi-row INSERTs, so a 100k
+user dataset loads in seconds rather than the hours the ORM would take.
+
+Synthetic users have ``@synthetic.example.com`` emails. Seeding again first deletes every
+synthetic user and everything that references them, so ``--scale`` can be re-run with a new size.
+"""
+
+import csv
+import io
+import json
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum as PyEnum
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Table, delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.AvailabilityTemplate import AvailabilityTemplate
+from app.models.Experience import Experience
+from app.models.Form import Form
+from app.models.FormSubmission import FormSubmission
+from app.models.Match import Match
+from app.models.MatchStatus import MatchStatus
+from app.models.Quality import Quality
+from app.models.RankingPreference import RankingPreference
+from app.models.SuggestedTime import suggested_times
+from app.models.Task import Task, TaskPriority, TaskStatus, TaskType
+from app.models.Treatment import Treatment
+from app.models.User import FormStatus, Language, User
+from app.models.UserData import (
+    UserData,
+    user_experiences,
+    user_loved_one_experiences,
+    user_loved_one_treatments,
+    user_treatments,
+)
+from app.models.VolunteerData import VolunteerData
+
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.example.com"
+# LIKE pattern matching synthetic users' emails
+SYNTHETIC_EMAIL_PATTERN = f"%@{SYNTHETIC_EMAIL_DOMAIN}"
+
+FIRST_NAMES = ["Sarah", "Michael", "Priya", "James", "Aisha", "Wei", "Maria", "David", "Fatima", "Liam", "Noah", "Emma"]
+LAST_NAMES = ["Johnson", "Chen", "Patel", "Smith", "Khan", "Nguyen", "Garcia", "Brown", "Tremblay", "Roy", "Wilson"]
+LOCATIONS = [
+    ("Toronto", "Ontario", "EST"),
+    ("Ottawa", "Ontario", "EST"),
+    ("Montreal", "Quebec", "EST"),
+    ("Halifax", "Nova Scotia", "AST"),
+    ("Winnipeg", "Manitoba", "CST"),
+    ("Calgary", "Alberta", "MST"),
+    ("Vancouver", "British Columbia", "PST"),
+]
+GENDER_IDENTITIES = [("Woman", ["she", "her"]), ("Man", ["he", "him"]), ("Non-binary", ["they", "them"])]
+ETHNIC_GROUPS = ["White/Caucasian", "Asian", "Black/African", "Hispanic/Latino", "South Asian", "Indigenous"]
+MARITAL_STATUSES = ["Single", "Married/Common Law", "Divorced", "Widowed"]
+DIAGNOSES = [
+    "Acute Lymphoblastic Leukemia",
+    "Acute Myeloid Leukemia",
+    "Chronic Lymphocytic Leukemia",
+    "Chronic Myeloid Leukemia",
+    "Hodgkin Lymphoma",
+    "Non-Hodgkin Lymphoma",
+    "Multiple Myeloma",
+]
+# Unquoted NULL marker for COPY, so empty strings stay empty strings
+COPY_NULL = "\\N"
+
+VOLUNTEER_EXPERIENCE = (
+    "I was diagnosed a few years ago and went through treatment with a lot of support. "
+    "I would like to be that support for someone else going through the same thing."
+)
+
+
+@dataclass
+class ReferenceIds:
+    """Ids of the reference data synthetic rows point at."""
+
+    treatments: List[int]
+    experiences: List[int]
+    qualities: List[int]
+    match_statuses: List[int]
+    participant_form_id: uuid.UUID
+    volunteer_form_id: uuid.UUID
+
+
+def load_reference_ids(session: Session) -> ReferenceIds:
+    """Read the reference data ids; the runner's reference seeds must have run first."""
+    intake_forms = dict(session.execute(select(Form.name, Form.id).where(Form.type == "intake")).all())
+    refs = ReferenceIds(
+        treatments=list(session.scalars(select(Treatment.id).order_by(Treatment.id))),
+        experiences=list(session.scalars(select(Experience.id).order_by(Experience.id))),
+        qualities=list(session.scalars(select(Quality.id).order_by(Quality.id))),
+        match_statuses=list(session.scalars(select(MatchStatus.id).order_by(MatchStatus.id))),
+        participant_form_id=intake_forms.get("First Connection Participant Form"),
+        volunteer_form_id=intake_forms.get("First Connection Volunteer Form"),
+    )
+    if not (refs.treatments and refs.experiences and refs.qualities and refs.match_statuses):
+        raise ValueError("Reference data is missing; seed the reference tables before synthetic users")
+    if refs.participant_form_id is None or refs.volunteer_form_id is None:
+        raise ValueError("Intake forms are missing; seed forms before synthetic users")
+    return refs
+
+
+def generate_synthetic_data(
+    count: int, refs: ReferenceIds, seed: int = 0, now: Optional[datetime] = None
+) -> Dict[Table, List[Dict[str, Any]]]:
+    """
+    Rows for ``count`` synthetic users and their related data, keyed by table in insert order.
+
+    Timestamps fall in the year before ``now``; the same ``seed`` and ``now`` always generate the
+    same rows. Every row of a table has the same keys.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    rows: Dict[Table, List[Dict[str, Any]]] = {
+        table: []
+        for table in (
+            User.__table__,
+            UserData.__table__,
+            user_treatments,
+            user_experiences,
+            user_loved_one_treatments,
+            user_loved_one_experiences,
+            VolunteerData.__table__,
+            AvailabilityTemplate.__table__,
+            RankingPreference.__table__,
+            FormSubmission.__table__,
+            Match.__table__,
+            Task.__table__,
+        )
+    }
+
+    def new_uuid() -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    def days_ago(max_days: int) -> datetime:
+        return now - timedelta(days=rng.randint(0, max_days), minutes=rng.randint(0, 24 * 60))
+
+    admin_count = max(1, count // 500)
+    participants, volunteers, admins = [], [], []
+    for i in range(count):
+        if i < admin_count:
+            role_id, group = 3, admins
+        elif rng.random() < 0.6:
+            role_id, group = 1, participants
+        else:
+            role_id, group = 2, volunteers
+        user_id = new_uuid()
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f"{first_name.lower()}.{last_name.lower()}.{i}@{SYNTHETIC_EMAIL_DOMAIN}"
+        group.append(user_id)
+        rows[User.__table__].append(
+            {
+                "id": user_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "role_id": role_id,
+                "auth_id": f"synthetic_{i}",
+                "approved": True,
+                "active": rng.random() > 0.02,
+                "pending_volunteer_request": False,
+                "form_status": FormStatus.COMPLETED if rng.random() < 0.8 else rng.choice(list(FormStatus)),
+                "language": Language.FRENCH if rng.random() < 0.15 else Language.ENGLISH,
+            }
+        )
+        if role_id == 3:
+            continue
+
+        user_data_id = new_uuid()
+        city, province, tz = rng.choice(LOCATIONS)
+        gender_identity, pronouns = rng.choice(GENDER_IDENTITIES)
+        caring = rng.random() < 0.3
+        rows[UserData.__table__].append(
+            {
+                "id": user_data_id,
+                "user_id": user_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "date_of_birth": date(rng.randint(1945, 2005), rng.randint(1, 12), rng.randint(1, 28)),
+                "phone": f"555-{rng.randint(0, 9999):04d}",
+                "city": city,
+                "province": province,
+                "gender_identity": gender_identity,
+                "pronouns": pronouns,
+                "ethnic_group": rng.sample(ETHNIC_GROUPS, rng.randint(1, 2)),
+                "marital_status": rng.choice(MARITAL_STATUSES),
+                "has_kids": rng.choice(["Yes", "No"]),
+                "timezone": tz,
+                "diagnosis": rng.choice(DIAGNOSES),
+                "date_of_diagnosis": date(rng.randint(2010, 2025), rng.randint(1, 12), rng.randint(1, 28)),
+                "has_blood_cancer": "no" if caring and rng.random() < 0.7 else "yes",
+                "caring_for_someone": "yes" if caring else "no",
+                "loved_one_gender_identity": rng.choice(GENDER_IDENTITIES)[0] if caring else None,
+                "loved_one_age": str(rng.randint(5, 85)) if caring else None,
+                "loved_one_diagnosis": rng.choice(DIAGNOSES) if caring else None,
+            }
+        )
+        for treatment_id in rng.sample(refs.treatments, rng.randint(1, 3)):
+            rows[user_treatments].append({"user_data_id": user_data_id, "treatment_id": treatment_id})
+        for experience_id in rng.sample(refs.experiences, rng.randint(1, 4)):
+            rows[user_experiences].append({"user_data_id": user_data_id, "experience_id": experience_id})
+        if caring:
+            for treatment_id in rng.sample(refs.treatments, rng.randint(1, 2)):
+                rows[user_loved_one_treatments].append({"user_data_id": user_data_id, "treatment_id": treatment_id})
+            for experience_id in rng.sample(refs.experiences, rng.randint(1, 2)):
+                rows[user_loved_one_experiences].append({"user_data_id": user_data_id, "experience_id": experience_id})
+
+        submitted_at = days_ago(365)
+        rows[FormSubmission.__table__].append(
+            {
+                "id": new_uuid(),
+                "form_id": refs.participant_form_id if role_id == 1 else refs.volunteer_form_id,
+                "user_id": user_id,
+                "submitted_at": submitted_at,
+                "answers": {"synthetic": True},
+                "status": "approved" if rng.random() < 0.9 else "pending_approval",
+            }
+        )
+
+        if role_id == 2:
+            rows[VolunteerData.__table__].append(
+                {
+                    "id": new_uuid(),
+                    "user_id": user_id,
+                    "experience": VOLUNTEER_EXPERIENCE,
+                    "references_json": None,
+                    "additional_comments": None,
+                    "submitted_at": submitted_at,
+                }
+            )
+            for day_of_week in sorted(rng.sample(range(7), rng.randint(1, 4))):
+                start_hour = rng.randint(9, 18)
+                rows[AvailabilityTemplate.__table__].append(
+                    {
+                        "user_id": user_id,
+                        "day_of_week": day_of_week,
+                        "start_time": time(start_hour),
+                        "end_time": time(start_hour + 2),
+                        "is_active": rng.random() > 0.1,
+                    }
+                )
+        else:
+            target_role = "caregiver" if caring and rng.random() < 0.5 else "patient"
+            ranked = [("quality", quality_id) for quality_id in rng.sample(refs.qualities, 3)]
+            ranked.append(("treatment", rng.choice(refs.treatments)))
+            ranked.append(("experience", rng.choice(refs.experiences)))
+            for rank, (kind, item_id) in enumerate(ranked, start=1):
+                rows[RankingPreference.__table__].append(
+                    {
+                        "user_id": user_id,
+                        "target_role": target_role,
+                        "kind": kind,
+                        "quality_id": item_id if kind == "quality" else None,
+                        "treatment_id": item_id if kind == "treatment" else None,
+                        "experience_id": item_id if kind == "experience" else None,
+                        "scope": "loved_one" if kind != "quality" and target_role == "caregiver" else "self",
+                        "rank": rank,
+                    }
+                )
+
+    # Matches cycle through every status; about a tenth are soft-deleted
+    for participant_id in participants:
+        for _ in range(rng.randint(0, 3) if volunteers else 0):
+            created_at = days_ago(180)
+            rows[Match.__table__].append(
+                {
+                    "participant_id": participant_id,
+                    "volunteer_id": rng.choice(volunteers),
+                    "chosen_time_block_id": None,
+                    "match_status_id": refs.match_statuses[len(rows[Match.__table__]) % len(refs.match_statuses)],
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "deleted_at": created_at + timedelta(days=1) if rng.random() < 0.1 else None,
+                }
+            )
+        if rng.random() < 0.3:
+            start_date = days_ago(60)
+            status = rng.choice(list(TaskStatus))
+            rows[Task.__table__].append(
+                {
+                    "id": new_uuid(),
+                    "participant_id": participant_id,
+                    "type": rng.choice(list(TaskType)),
+                    "priority": rng.choice(list(TaskPriority)),
+                    "status": status,
+                    "assignee_id": rng.choice(admins) if rng.random() < 0.7 else None,
+                    "start_date": start_date,
+                    "end_date": start_date + timedelta(days=3) if status == TaskStatus.COMPLETED else None,
+                    "created_at": start_date,
+                    "updated_at": start_date,
+                    "description": None,
+                }
+            )
+
+    return rows
+
+
+def clear_synthetic_data(session: Session) -> None:
+    """Delete every synthetic user and the rows that reference them."""
+    user_ids = select(User.id).where(User.email.like(SYNTHETIC_EMAIL_PATTERN)).scalar_subquery()
+    user_data_ids = select(UserData.id).where(UserData.user_id.in_(user_ids)).scalar_subquery()
+    match_ids = (
+        select(Match.id)
+        .where(or_(Match.participant_id.in_(user_ids), Match.volunteer_id.in_(user_ids)))
+        .scalar_subquery()
+    )
+    statements = [
+        delete(suggested_times).where(suggested_times.c.match_id.in_(match_ids)),
+        delete(Match.__table__).where(or_(Match.participant_id.in_(user_ids), Match.volunteer_id.in_(user_ids))),
+        delete(Task.__table__).where(or_(Task.participant_id.in_(user_ids), Task.assignee_id.in_(user_ids))),
+        delete(FormSubmission.__table__).where(FormSubmission.user_id.in_(user_ids)),
+        delete(RankingPreference.__table__).where(RankingPreference.user_id.in_(user_ids)),
+        delete(AvailabilityTemplate.__table__).where(AvailabilityTemplate.user_id.in_(user_ids)),
+        delete(VolunteerData.__table__).where(VolunteerData.user_id.in_(user_ids)),
+    ]
+    for link_table in (user_treatments, user_experiences, user_loved_one_treatments, user_loved_one_experiences):
+        statements.append(delete(link_table).where(link_table.c.user_data_id.in_(user_data_ids)))
+    statements.append(delete(UserData.__table__).where(UserData.user_id.in_(user_ids)))
+    statements.append(delete(User.__table__).where(User.email.like(SYNTHETIC_EMAIL_PATTERN)))
+    for statement in statements:
+        session.execute(statement)
+
+
+def copy_csv(rows: List[Dict[str, Any]], columns: List[str]) -> io.StringIO:
+    """CSV of ``rows`` for ``COPY ... FROM STDIN WITH (FORMAT csv, NULL '\\N')``."""
+    converted = []
+    for column in columns:
+        values = [row[column] for row in rows]
+        sample = next((value for value in values if value is not None), None)
+        if isinstance(sample, PyEnum):
+            values = [COPY_NULL if value is None else value.value for value in values]
+        elif isinstance(sample, (list, dict)):
+            values = [COPY_NULL if value is None else json.dumps(value) for value in values]
+        else:
+            # str() of bools, dates, times and UUIDs is valid Postgres input
+            values = [COPY_NULL if value is None else value for value in values]
+        converted.append(values)
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(zip(*converted))
+    buffer.seek(0)
+    return buffer
+
+
+def bulk_insert(session: Session, table: Table, rows: List[Dict[str, Any]], batch_size: int = 5000) -> None:
+    """Insert ``rows`` into ``table`` with COPY on psycopg2, otherwise with batched multi-row INSERTs."""
+    if not rows:
+        return
+    connection = session.connection()
+    columns = list(rows[0])
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        if connection.dialect.driver == "psycopg2":
+            quoted = ", ".join(connection.dialect.identifier_preparer.quote(column) for column in columns)
+            with connection.connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {table.name} ({quoted}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+                    copy_csv(batch, columns),
+                )
+        else:
+            session.execute(insert(table), batch)
+
+
+def seed_synthetic_users(
+    session: Session, count: int, batch_size: int = 5000, seed: int = 0, verbose: bool = True
+) -> Dict[str, int]:
+    """Replace the synthetic dataset with ``count`` users; returns the rows inserted per table."""
+    clear_synthetic_data(session)
+    data = generate_synthetic_data(count, load_reference_ids(session), seed)
+    for table, rows in data.items():
+        bulk_insert(session, table, rows, batch_size)
+        if verbose:
+            print(f"Inserted {len(rows)} rows into {table.name}")
+    session.commit()
+    return {table.name: len(rows) for table, rows in data.items()}
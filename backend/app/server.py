@@ -8,16 +8,18 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from . import models
 from .middleware.auth_middleware import AuthMiddleware
 from .routes import (
     auth,
     availability,
     contact,
+    health,
     intake,
     match,
     matching,
+    metrics,
     ranking,
+    reference,
     send_email,
     suggested_times,
     task,
@@ -26,16 +28,26 @@ from .routes import (
     user_data,
     volunteer_data,
 )
+from .services.implementations.email_outbox_dispatcher import EmailOutboxDispatcher
 from .services.implementations.match_completion_service import MatchCompletionService
+from .services.implementations.matching_service import batch_executor
 from .utilities.constants import LOGGER_NAME
-from .utilities.db_utils import engine
+from .utilities.db_utils import SessionLocal, async_engine, engine
 from .utilities.firebase_init import initialize_firebase
+from .utilities.local_token_verifier import google_public_keys, local_token_verifier, revoked_uids
+from .utilities.migrations import SchemaVersionError, check_schema_version, migrate_once
+from .utilities.query_log import DETECT_N_PLUS_ONE, QueryLogMiddleware
+from .utilities.reference_data import reference_data
+from .utilities.request_metrics import MetricsMiddleware
 from .utilities.ses.ses_init import ensure_ses_templates
 
 load_dotenv()
 
 log = logging.getLogger(LOGGER_NAME("server"))
 
+# "check" (default): verify the schema is at the head revision; "migrate": run migrations; "off"
+MIGRATIONS_ON_STARTUP = os.getenv("MIGRATIONS_ON_STARTUP", "check").lower()
+
 PUBLIC_PATHS = [
     "/",
     "/docs",
@@ -52,14 +64,34 @@ PUBLIC_PATHS = [
     "/matching/{user_id}",
 ]
 
+# Not public: these paths authenticate with their own token (e.g. METRICS_TOKEN) instead of a Firebase ID token
+TOKEN_AUTH_PATHS = [
+    "/metrics",
+]
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     log.info("Starting up...")
-    ensure_ses_templates()
-    models.run_migrations()
+    # Migrations run once per deploy (`pdm run migrate`), not in every worker process
+    try:
+        if MIGRATIONS_ON_STARTUP == "migrate":
+            migrate_once()
+        elif MIGRATIONS_ON_STARTUP == "check":
+            check_schema_version()
+    except SchemaVersionError:
+        raise
+    except Exception as e:
+        log.error(f"Failed to check the database schema version at startup: {str(e)}")
     initialize_firebase()
 
+    # Warm the reference data cache; lookups load it lazily if this fails
+    try:
+        with SessionLocal() as db:
+            reference_data.refresh(db)
+    except Exception as e:
+        log.error(f"Failed to load reference data at startup: {str(e)}")
+
     # Initialize and start the background scheduler for match completion
     # IMPORTANT: This scheduler runs in-process. When using uvicorn with --reload or multiple
     # workers (--workers N), each process will spawn its own scheduler, causing duplicate job
@@ -81,6 +113,70 @@ async def lifespan(_: FastAPI):
         replace_existing=True,
     )
 
+    # Upload changed SES templates in the background, so startup does not wait on AWS. Deploys can
+    # instead run `python -m app.utilities.ses.ses_init` once and set SES_TEMPLATE_SYNC_ON_STARTUP=false
+    if os.getenv("SES_TEMPLATE_SYNC_ON_STARTUP", "true").lower() == "true":
+        scheduler.add_job(
+            ensure_ses_templates,
+            id="sync_ses_templates",
+            name="Sync changed SES templates",
+            replace_existing=True,
+        )
+
+    # Send queued emails in the background; dispatchers in several processes share the outbox safely
+    email_outbox_dispatcher = EmailOutboxDispatcher()
+    scheduler.add_job(
+        email_outbox_dispatcher.dispatch_pending,
+        trigger="interval",
+        seconds=float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "5")),
+        id="dispatch_email_outbox",
+        name="Send queued emails",
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+    )
+
+    # Delete sent and failed emails once they are older than EMAIL_OUTBOX_RETENTION_DAYS
+    scheduler.add_job(
+        email_outbox_dispatcher.purge_expired,
+        trigger="cron",
+        hour=3,
+        minute=30,
+        id="purge_email_outbox",
+        name="Purge old sent and failed emails",
+        replace_existing=True,
+    )
+
+    # With local token verification, refresh Google's signing keys ahead of their expiry, and revocations
+    if local_token_verifier is not None:
+        try:
+            google_public_keys.refresh()
+        except Exception as e:
+            log.error(f"Failed to load Google signing keys at startup: {str(e)}")
+        scheduler.add_job(
+            google_public_keys.refresh,
+            trigger="interval",
+            seconds=float(os.getenv("AUTH_PUBLIC_KEYS_REFRESH_SECONDS", "3600")),
+            id="refresh_google_public_keys",
+            name="Refresh Google ID token signing keys",
+            replace_existing=True,
+        )
+        # Revocations made by other workers and containers, and before a restart
+        try:
+            revoked_uids.refresh()
+        except Exception as e:
+            log.error(f"Failed to load token revocations at startup: {str(e)}")
+        scheduler.add_job(
+            revoked_uids.refresh,
+            trigger="interval",
+            seconds=float(os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", "10")),
+            id="refresh_token_revocations",
+            name="Reload revoked Firebase users",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+
     scheduler.start()
     log.info("Background scheduler started - match auto-completion job runs at :00, :15, :30, :45 every hour")
 
@@ -89,11 +185,15 @@ async def lifespan(_: FastAPI):
     # Shutdown scheduler gracefully
     log.info("Shutting down scheduler...")
     scheduler.shutdown(wait=False)  # Don't wait for running jobs to prevent interpreter shutdown race condition
+    email_outbox_dispatcher.shutdown()
+    # Stop the batch matching worker processes, if a batch started them
+    batch_executor.shutdown()
 
     # Dispose database engine to close all connection pools
     # This prevents async generator cleanup errors during shutdown
     log.info("Disposing database engine...")
     engine.dispose()
+    await async_engine.dispose()
     log.info("Shutting down...")
 
 
@@ -101,7 +201,7 @@ async def lifespan(_: FastAPI):
 # running-alembic-migrations-on-fastapi-startup
 app = FastAPI(lifespan=lifespan)
 
-app.add_middleware(AuthMiddleware, public_paths=PUBLIC_PATHS)
+app.add_middleware(AuthMiddleware, public_paths=PUBLIC_PATHS + TOKEN_AUTH_PATHS)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -116,6 +216,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if DETECT_N_PLUS_ONE:
+    app.add_middleware(QueryLogMiddleware)
+# Outermost, so request timings include authentication
+app.add_middleware(MetricsMiddleware)
 app.include_router(auth.router)
 app.include_router(user.router)
 app.include_router(user_data.router)
@@ -130,6 +234,9 @@ app.include_router(send_email.router)
 app.include_router(task.router)
 app.include_router(test.router)
 app.include_router(contact.router)
+app.include_router(reference.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
@@ -1,10 +1,10 @@
 import os
 
-import boto3
 from botocore.exceptions import ClientError
 
 from app.interfaces.email_service_provider import IEmailServiceProvider
 from app.schemas.email_template import EmailContent, EmailTemplateType
+from app.utilities.ses.ses_clients import ses_clients
 
 
 class AmazonSESEmailProvider(IEmailServiceProvider):
@@ -33,22 +33,15 @@ class AmazonSESEmailProvider(IEmailServiceProvider):
     ):
         self.source_email = source_email
         self.is_sandbox = is_sandbox
-        self.ses_client = boto3.client(
-            "ses",
-            region_name=region,
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-        )
-
-        self.verified_emails = None
-        if self.is_sandbox:
-            response = self.ses_client.list_verified_email_addresses()
-            self.verified_emails = response.get("VerifiedEmailAddresses", [])
+        self.ses_client = ses_clients.client(region, aws_access_key, aws_secret_key)
 
     def _verify_email(self, email: str, templateType: EmailTemplateType) -> None:
         try:
-            if self.is_sandbox and email not in self.verified_emails:
-                self.ses_client.verify_email_identity(EmailAddress=email)
+            if (
+                self.is_sandbox
+                and email not in ses_clients.verified_emails(self.ses_client)
+                and ses_clients.request_verification(self.ses_client, email)
+            ):
                 print(f"Verification email sent to {email}.")
             if self.ses_client.get_template(TemplateName=templateType.value):
                 print(f"Template {templateType.value} exists.")
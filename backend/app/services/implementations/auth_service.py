@@ -1,14 +1,19 @@
+import hashlib
 import logging
 import os
+from typing import Optional
 
 import firebase_admin.auth
 from fastapi import HTTPException
 
 from app.utilities.constants import LOGGER_NAME
-from app.utilities.ses_email_service import SESEmailService
+from app.utilities.email_outbox import OutboxEmailService
+from app.utilities.local_token_verifier import revoked_uids
+from app.utilities.request_metrics import external_call
+from app.utilities.token_cache import token_cache
 
 from ...interfaces.auth_service import IAuthService
-from ...schemas.auth import AuthResponse, Token
+from ...schemas.auth import AuthenticatedPrincipal, AuthResponse, Token
 from ...utilities.firebase_rest_client import FirebaseRestClient
 
 
@@ -17,7 +22,6 @@ class AuthService(IAuthService):
         self.logger = logging.getLogger(LOGGER_NAME("auth_service"))
         self.user_service = user_service
         self.firebase_client = FirebaseRestClient(logger)
-        self.ses_email_service = SESEmailService()
 
     def generate_token(self, email: str, password: str) -> AuthResponse:
         try:
@@ -39,7 +43,10 @@ class AuthService(IAuthService):
     def revoke_tokens(self, user_id: str) -> None:
         try:
             auth_id = self.user_service.get_auth_id_by_user_id(user_id)
-            firebase_admin.auth.revoke_refresh_tokens(auth_id)
+            with external_call("firebase", "revoke_refresh_tokens"):
+                firebase_admin.auth.revoke_refresh_tokens(auth_id)
+            token_cache.invalidate_user(auth_id)
+            revoked_uids.revoke(auth_id)
         except Exception as e:
             self.logger.error(f"Failed to revoke tokens: {str(e)}")
             raise
@@ -68,7 +75,8 @@ class AuthService(IAuthService):
                 # Fall back to Firebase if database didn't have first_name
                 if not first_name:
                     try:
-                        firebase_user = firebase_admin.auth.get_user_by_email(email)
+                        with external_call("firebase", "get_user_by_email"):
+                            firebase_user = firebase_admin.auth.get_user_by_email(email)
                         if firebase_user and firebase_user.display_name:
                             display_name = firebase_user.display_name.strip()
                             first_name = display_name.split()[0] if display_name else None
@@ -83,16 +91,21 @@ class AuthService(IAuthService):
                 handle_code_in_app=True,
             )
 
-            reset_link = firebase_admin.auth.generate_password_reset_link(email, action_code_settings)
+            with external_call("firebase", "generate_password_reset_link"):
+                reset_link = firebase_admin.auth.generate_password_reset_link(email, action_code_settings)
 
-            # Send via SES with language
-            email_sent = self.ses_email_service.send_password_reset_email(email, reset_link, first_name, language)
+            # Queue for sending via SES with language
+            with self.user_service.db.begin_nested():
+                email_sent = self._outbox("password-reset", reset_link).send_password_reset_email(
+                    email, reset_link, first_name, language
+                )
+            self.user_service.db.commit()
 
             if email_sent:
-                self.logger.info(f"Password reset email sent successfully to {email}")
+                self.logger.info(f"Password reset email queued for {email}")
             else:
                 self.logger.warning(
-                    f"Failed to send password reset email to {email}, but link was generated: {reset_link}"
+                    f"Failed to queue password reset email to {email}, but link was generated: {reset_link}"
                 )
                 # Do not raise, avoid revealing if email exists
 
@@ -109,7 +122,8 @@ class AuthService(IAuthService):
             try:
                 # Try to get from Firebase user (display_name)
                 try:
-                    firebase_user = firebase_admin.auth.get_user_by_email(email)
+                    with external_call("firebase", "get_user_by_email"):
+                        firebase_user = firebase_admin.auth.get_user_by_email(email)
                     if firebase_user and firebase_user.display_name:
                         # Extract first name from display_name (e.g., "John Doe" -> "John")
                         display_name = firebase_user.display_name.strip()
@@ -157,17 +171,22 @@ class AuthService(IAuthService):
             )
 
             # Generate the verification link
-            verification_link = firebase_admin.auth.generate_email_verification_link(email, action_code_settings)
+            with external_call("firebase", "generate_email_verification_link"):
+                verification_link = firebase_admin.auth.generate_email_verification_link(email, action_code_settings)
 
-            # Send the verification email via SES (works with any email address)
-            email_sent = self.ses_email_service.send_verification_email(email, verification_link, first_name, language)
+            # Queue the verification email for sending via SES (works with any email address)
+            with self.user_service.db.begin_nested():
+                email_sent = self._outbox("email-verification", verification_link).send_verification_email(
+                    email, verification_link, first_name, language
+                )
+            self.user_service.db.commit()
 
             if email_sent:
-                self.logger.info(f"Email verification sent successfully to {email}")
+                self.logger.info(f"Email verification queued for {email}")
             else:
                 # If SES fails, we can still provide the link for manual verification
                 self.logger.warning(
-                    f"Failed to send verification email to {email}, but link was generated: {verification_link}"
+                    f"Failed to queue verification email to {email}, but link was generated: {verification_link}"
                 )
                 # For development/testing, you could log the link or store it temporarily
                 # In production, you might want to implement a fallback mechanism
@@ -177,36 +196,59 @@ class AuthService(IAuthService):
             # Don't raise exception for security reasons - don't reveal if email exists
             return
 
-    def is_authorized_by_role(self, access_token: str, roles: set[str]) -> bool:
+    def _outbox(self, event: str, link: str) -> OutboxEmailService:
+        """
+        Outbox for the user service's session, where emails are queued and sent in the background.
+        Every generated link is new, so a hash of it identifies the event without storing the link.
+        """
+        link_hash = hashlib.sha256(link.encode("utf-8")).hexdigest()[:16]
+        return OutboxEmailService(self.user_service.db, event_key=f"{event}-{link_hash}")
+
+    def is_authorized_by_role(
+        self, access_token: str, roles: set[str], principal: Optional[AuthenticatedPrincipal] = None
+    ) -> bool:
         try:
-            decoded_token = firebase_admin.auth.verify_id_token(access_token, check_revoked=True)
-            user_role = self.user_service.get_user_role_by_auth_id(decoded_token["uid"])
-            firebase_user = firebase_admin.auth.get_user(decoded_token["uid"])
-            result = firebase_user.email_verified and user_role in roles
-            return result
+            principal = principal or self._resolve_principal(access_token)
+            return principal.email_verified and principal.role in roles
         except Exception as e:
             print(f"Authorization error: {str(e)}")
             return False
 
     def is_authorized_by_user_id(self, access_token: str, requested_user_id: str) -> bool:
         try:
-            decoded_token = firebase_admin.auth.verify_id_token(access_token, check_revoked=True)
-            token_user_id = self.user_service.get_user_id_by_auth_id(decoded_token["uid"])
-            firebase_user = firebase_admin.auth.get_user(decoded_token["uid"])
-            return firebase_user.email_verified and token_user_id == requested_user_id
+            principal = self._resolve_principal(access_token)
+            return (
+                principal.email_verified
+                and principal.user_id is not None
+                and str(principal.user_id) == str(requested_user_id)
+            )
         except Exception as e:
             print(f"Authorization error: {str(e)}")
             return False
 
     def is_authorized_by_email(self, access_token: str, requested_email: str) -> bool:
         try:
-            decoded_token = firebase_admin.auth.verify_id_token(access_token, check_revoked=True)
-            firebase_user = firebase_admin.auth.get_user(decoded_token["uid"])
-            return firebase_user.email_verified and decoded_token["email"] == requested_email
+            principal = self._resolve_principal(access_token)
+            return principal.email_verified and principal.email == requested_email
         except Exception as e:
             print(f"Authorization error: {str(e)}")
             return False
 
+    def _resolve_principal(self, access_token: str) -> AuthenticatedPrincipal:
+        """Verify a token that did not come through AuthMiddleware (e.g. one just issued at login)."""
+        verified = token_cache.verify(access_token)
+        try:
+            user = self.user_service.get_user_by_auth_id(verified.uid)
+        except ValueError:
+            user = None
+        return AuthenticatedPrincipal(
+            auth_id=verified.uid,
+            user_id=user.id if user else None,
+            role=user.role.name if user else None,
+            email=verified.claims.get("email"),
+            email_verified=verified.email_verified,
+        )
+
     def verify_email(self, email: str):
         try:
             user = self.user_service.get_user_by_email(email)
@@ -219,7 +261,10 @@ class AuthService(IAuthService):
                 raise ValueError("User has no auth_id")
 
             self.logger.info(f"Updating email verification for user {user.id} with auth_id {user.auth_id}")
-            firebase_admin.auth.update_user(user.auth_id, email_verified=True)
+            with external_call("firebase", "update_user"):
+                firebase_admin.auth.update_user(user.auth_id, email_verified=True)
+            # Cached tokens still carry email_verified=False; drop them so has_roles sees the change
+            token_cache.invalidate_user(user.auth_id)
             self.logger.info(f"Successfully verified email for user {user.id}")
 
         except ValueError as e:
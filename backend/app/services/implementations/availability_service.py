@@ -15,6 +15,7 @@ from app.schemas.availability import (
     DeleteAvailabilityResponse,
     GetAvailabilityRequest,
 )
+from app.utilities.threadpool import in_threadpool
 
 
 class AvailabilityService:
@@ -22,7 +23,8 @@ class AvailabilityService:
         self.db = db
         self.logger = logging.getLogger(__name__)
 
-    async def get_availability(self, req: GetAvailabilityRequest) -> AvailabilityEntity:
+    @in_threadpool
+    def get_availability(self, req: GetAvailabilityRequest) -> AvailabilityEntity:
         """
         Takes a user_id and returns availability templates.
         """
@@ -50,7 +52,8 @@ class AvailabilityService:
             self.logger.error(f"Error getting availability: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def create_availability(self, availability: CreateAvailabilityRequest) -> CreateAvailabilityResponse:
+    @in_threadpool
+    def create_availability(self, availability: CreateAvailabilityRequest) -> CreateAvailabilityResponse:
         """
         Takes a user_id and template slots (day_of_week + time ranges).
         Converts these to AvailabilityTemplate records.
@@ -118,7 +121,8 @@ class AvailabilityService:
             self.logger.error(f"Error creating availability: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def update_availability(self, req: CreateAvailabilityRequest) -> CreateAvailabilityResponse:
+    @in_threadpool
+    def update_availability(self, req: CreateAvailabilityRequest) -> CreateAvailabilityResponse:
         """
         Completely replaces user's availability with the provided time slots.
         Deletes all existing availability first, then creates new ones.
@@ -187,7 +191,8 @@ class AvailabilityService:
             self.logger.error(f"Error updating availability for user {req.user_id}: {e}")
             raise HTTPException(status_code=500, detail="Failed to update availability")
 
-    async def delete_availability(self, req: DeleteAvailabilityRequest) -> DeleteAvailabilityResponse:
+    @in_threadpool
+    def delete_availability(self, req: DeleteAvailabilityRequest) -> DeleteAvailabilityResponse:
         """
         Takes a DeleteAvailabilityRequest with template slots.
         Deletes matching AvailabilityTemplate records.
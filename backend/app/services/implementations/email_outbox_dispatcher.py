@@ -0,0 +1,211 @@
+"""Background sending of the transactional email outbox (see app/utilities/email_outbox.py)."""
+
+import logging
+import os
+import random
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models import EmailOutbox, EmailOutboxStatus
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.db_utils import SessionLocal
+from app.utilities.ses_email_service import BulkSendResult, SESEmailService, TemplatedEmail
+
+
+@dataclass
+class OutboxEmail(TemplatedEmail):
+    id: Any = None
+    attempts: int = 0
+
+
+class EmailOutboxDispatcher:
+    """
+    Sends due outbox rows with at most ``concurrency`` SES calls in flight, retrying throttling
+    and transient failures with exponential backoff up to ``max_attempts``. Rows with the same
+    template and source address are sent together with SendBulkTemplatedEmail, up to 50 per call.
+
+    Rows are claimed with ``FOR UPDATE SKIP LOCKED`` and a lease, so several processes can run
+    the dispatcher without sending an email twice, and a row whose dispatcher died while sending
+    it is picked up again once its lease expires.
+
+    A sent row's template data, which holds names and links, is cleared when it is recorded;
+    ``purge_expired`` deletes sent and failed rows after ``retention_days``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        email_service_factory: Callable[[], SESEmailService] = SESEmailService,
+        concurrency: int = int(os.getenv("EMAIL_OUTBOX_CONCURRENCY", "4")),
+        batch_size: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "200")),
+        max_attempts: int = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "8")),
+        backoff_seconds: float = 30,
+        max_backoff_seconds: float = 3600,
+        lease_seconds: float = 300,
+        retention_days: float = float(os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", "30")),
+    ):
+        self.session_factory = session_factory
+        self.email_service_factory = email_service_factory
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.retention_days = retention_days
+        self.logger = logging.getLogger(LOGGER_NAME("email_outbox"))
+        self._email_service: Optional[SESEmailService] = None
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="email-outbox")
+        self._dispatch_lock = threading.Lock()
+
+    @property
+    def email_service(self) -> SESEmailService:
+        if self._email_service is None:
+            self._email_service = self.email_service_factory()
+        return self._email_service
+
+    def dispatch_pending(self) -> Dict[str, int]:
+        """
+        Send due emails until none are left. Called periodically by the scheduler; a call made
+        while another is running returns immediately.
+        :return: Number of emails per outcome ("sent", "retry", "failed")
+        """
+        outcomes: Counter = Counter()
+        if not self._dispatch_lock.acquire(blocking=False):
+            return outcomes
+        try:
+            if self.email_service.ses_client is None:
+                # Emails stay in the outbox until SES is configured
+                return outcomes
+            while True:
+                batch = self._claim_batch()
+                if not batch:
+                    break
+                chunks = [[batch[index] for index in group] for group in self.email_service.group_for_bulk_send(batch)]
+                results = [result for chunk in self._executor.map(self._deliver, chunks) for result in chunk]
+                outcomes.update(self._record(results))
+                if len(batch) < self.batch_size:
+                    break
+            if outcomes:
+                self.logger.info(f"Email outbox dispatched: {dict(outcomes)}")
+            return outcomes
+        except Exception as e:
+            self.logger.error(f"Error dispatching email outbox: {str(e)}", exc_info=True)
+            return outcomes
+        finally:
+            self._dispatch_lock.release()
+
+    def purge_expired(self) -> int:
+        """
+        Delete sent and failed rows created more than ``retention_days`` ago. Called daily by the
+        scheduler; their idempotency keys are long past any retry of the request that queued them.
+        :return: Number of rows deleted
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        try:
+            with self.session_factory() as db:
+                deleted = db.execute(
+                    delete(EmailOutbox).where(
+                        EmailOutbox.status.in_([EmailOutboxStatus.SENT, EmailOutboxStatus.FAILED]),
+                        EmailOutbox.created_at < cutoff,
+                    )
+                ).rowcount
+                db.commit()
+        except Exception as e:
+            self.logger.error(f"Error purging email outbox: {str(e)}", exc_info=True)
+            return 0
+        if deleted:
+            self.logger.info(f"Purged {deleted} email outbox row(s) older than {self.retention_days} day(s)")
+        return deleted
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _claim_batch(self) -> List[OutboxEmail]:
+        now = datetime.now(timezone.utc)
+        with self.session_factory() as db:
+            due = (
+                select(EmailOutbox)
+                .where(
+                    or_(
+                        and_(EmailOutbox.status == EmailOutboxStatus.PENDING, EmailOutbox.next_attempt_at <= now),
+                        and_(EmailOutbox.status == EmailOutboxStatus.SENDING, EmailOutbox.locked_until < now),
+                    )
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = db.scalars(due).all()
+            batch = [
+                OutboxEmail(
+                    id=row.id,
+                    to_email=row.to_email,
+                    source_email=row.source_email,
+                    template_name=row.template_name,
+                    template_data=row.template_data,
+                    # A claim counts as an attempt, so a row that keeps killing its dispatcher still runs out
+                    attempts=row.attempts + 1,
+                )
+                for row in rows
+            ]
+            for row in rows:
+                row.status = EmailOutboxStatus.SENDING
+                row.attempts += 1
+                row.locked_until = now + timedelta(seconds=self.lease_seconds)
+            db.commit()
+        return batch
+
+    def _deliver(self, emails: List[OutboxEmail]) -> List[BulkSendResult]:
+        results = self.email_service.deliver_bulk_templated_emails(emails)
+        for result in results:
+            if result.message_id is None and not result.retryable:
+                self.email_service.handle_send_failure(result.email.to_email, result.error_code, result.error_message)
+        return results
+
+    def _record(self, results: List[BulkSendResult]) -> Counter:
+        now = datetime.now(timezone.utc)
+        outcomes: Counter = Counter()
+        updates = []
+        for result in results:
+            email = result.email
+            error = result.error_code
+            if result.error_message and result.error_message != result.error_code:
+                error = f"{error}: {result.error_message}"
+            if result.message_id is not None:
+                outcomes["sent"] += 1
+                # The template data is only needed to send the email
+                values = {
+                    "status": EmailOutboxStatus.SENT,
+                    "message_id": result.message_id,
+                    "sent_at": now,
+                    "template_data": {},
+                }
+            elif result.retryable and email.attempts < self.max_attempts:
+                outcomes["retry"] += 1
+                values = {"status": EmailOutboxStatus.PENDING, "next_attempt_at": now + self._backoff(email.attempts)}
+            else:
+                outcomes["failed"] += 1
+                values = {"status": EmailOutboxStatus.FAILED}
+                self.logger.error(
+                    f"Giving up on email {email.template_name} to {email.to_email} "
+                    f"after {email.attempts} attempt(s): {error}"
+                )
+            updates.append((email.id, {**values, "locked_until": None, "last_error": error}))
+
+        with self.session_factory() as db:
+            for email_id, values in updates:
+                db.execute(update(EmailOutbox).where(EmailOutbox.id == email_id).values(**values))
+            db.commit()
+        return outcomes
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempts - 1))
+        # Jitter, so emails throttled together are not retried together
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
@@ -29,6 +29,7 @@ from app.models.User import FormStatus
 from app.services.implementations.intake_form_processor import IntakeFormProcessor
 from app.services.implementations.volunteer_data_service import VolunteerDataService
 from app.utilities.constants import LOGGER_NAME
+from app.utilities.reference_data import reference_data
 
 
 class FormProcessor:
@@ -262,7 +263,7 @@ class FormProcessor:
 
     def _get_role_by_name(self, role_name: str) -> Role:
         """Lookup helper to avoid hard-coding role IDs."""
-        role: Optional[Role] = self.db.query(Role).filter(Role.name == role_name).first()
+        role: Optional[Role] = reference_data.get_by_name(self.db, Role, role_name)
         if not role:
             raise ValueError(f"Role '{role_name}' not found in database")
         return role
@@ -5,7 +5,9 @@ from typing import Any, Dict, Tuple
 
 from sqlalchemy.orm import Session
 
-from app.models import Experience, Language, Treatment, User, UserData
+from app.models import Language, User, UserData
+from app.utilities.user_data_links import add_links, replace_links
+from app.utilities.volunteer_index import volunteer_index
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +91,7 @@ class IntakeFormProcessor:
             # Commit all changes
             self.db.commit()
             self.db.refresh(user_data)
+            volunteer_index.refresh_user(self.db, user_data.user_id)
 
             logger.info(f"Successfully processed intake form for user {user_id}")
             return user_data
@@ -221,46 +224,24 @@ class IntakeFormProcessor:
     def _process_treatments(self, user_data: UserData, cancer_exp: Dict[str, Any]):
         """
         Process treatments - map frontend names to database records.
-        Handles both predefined options and creates new ones for custom entries.
+        Unknown names are skipped; only links that changed are written.
         """
         treatment_names = cancer_exp.get("treatments", [])
         if not treatment_names:
             return
 
-        # Clear existing treatments
-        user_data.treatments.clear()
-
-        for treatment_name in treatment_names:
-            if not treatment_name:
-                continue
-
-            # Find existing treatment
-            treatment = self.db.query(Treatment).filter(Treatment.name == treatment_name).first()
-
-            if treatment:
-                user_data.treatments.append(treatment)
+        replace_links(self.db, user_data, "treatments", treatment_names)
 
     def _process_experiences(self, user_data: UserData, cancer_exp: Dict[str, Any]):
         """
         Process experiences - map frontend names to database records.
-        Handles both predefined options and creates new ones for custom entries.
+        Unknown names are skipped; only links that changed are written.
         """
         experience_names = cancer_exp.get("experiences", [])
         if not experience_names:
             return
 
-        # Clear existing experiences
-        user_data.experiences.clear()
-
-        for experience_name in experience_names:
-            if not experience_name:
-                continue
-
-            # Find existing experience
-            experience = self.db.query(Experience).filter(Experience.name == experience_name).first()
-
-            if experience:
-                user_data.experiences.append(experience)
+        replace_links(self.db, user_data, "experiences", experience_names)
 
     def _process_caregiver_experience(self, user_data: UserData, caregiver_exp: Dict[str, Any]):
         """
@@ -277,18 +258,7 @@ class IntakeFormProcessor:
 
         # Note: We don't clear existing experiences here in case user has both
         # cancer and caregiver experiences (though that would be in cancerExperience)
-
-        for experience_name in experience_names:
-            if not experience_name:
-                continue
-
-            # Find existing experience
-            experience = self.db.query(Experience).filter(Experience.name == experience_name).first()
-
-            if experience:
-                # Only add if not already present
-                if experience not in user_data.experiences:
-                    user_data.experiences.append(experience)
+        add_links(self.db, user_data, "experiences", experience_names)
 
     def _process_loved_one_data(self, user_data: UserData, loved_one_data: Dict[str, Any]):
         """Process loved one data including demographics and cancer experience."""
@@ -335,18 +305,7 @@ class IntakeFormProcessor:
         if not treatment_names:
             return
 
-        # Clear existing loved one treatments
-        user_data.loved_one_treatments.clear()
-
-        for treatment_name in treatment_names:
-            if not treatment_name:
-                continue
-
-            # Find existing treatment
-            treatment = self.db.query(Treatment).filter(Treatment.name == treatment_name).first()
-
-            if treatment:
-                user_data.loved_one_treatments.append(treatment)
+        replace_links(self.db, user_data, "loved_one_treatments", treatment_names)
 
     def _process_loved_one_experiences(self, user_data: UserData, cancer_exp: Dict[str, Any]):
         """Process loved one experiences - map frontend names to database records."""
@@ -354,18 +313,7 @@ class IntakeFormProcessor:
         if not experience_names:
             return
 
-        # Clear existing loved one experiences
-        user_data.loved_one_experiences.clear()
-
-        for experience_name in experience_names:
-            if not experience_name:
-                continue
-
-            # Find existing experience
-            experience = self.db.query(Experience).filter(Experience.name == experience_name).first()
-
-            if experience:
-                user_data.loved_one_experiences.append(experience)
+        replace_links(self.db, user_data, "loved_one_experiences", experience_names)
 
     def process_ranking_form(self, user_id: str, ranking_data: Dict[str, Any]):
         """
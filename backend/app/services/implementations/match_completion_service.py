@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
+from typing import Callable
 
 from sqlalchemy import select, update
 from sqlalchemy.orm import Session
@@ -11,12 +12,15 @@ from app.models.MatchStatus import MatchStatus
 from app.models.TimeBlock import TimeBlock
 from app.utilities.constants import LOGGER_NAME
 from app.utilities.db_utils import SessionLocal
+from app.utilities.reference_data import reference_data
 
 
 class MatchCompletionService:
     """Service to automatically complete matches after their scheduled call time."""
 
-    def __init__(self):
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        # Sessions come from the shared, configured pool (db_utils) unless a factory is injected
+        self.session_factory = session_factory
         self.logger = logging.getLogger(LOGGER_NAME("match_completion_service"))
 
     def auto_complete_matches(self) -> None:
@@ -28,7 +32,7 @@ class MatchCompletionService:
         This method is designed to be called periodically by the scheduler.
         It is idempotent - safe to run multiple times without side effects.
         """
-        db: Session = SessionLocal()
+        db: Session = self.session_factory()
 
         try:
             self.logger.info("Starting auto-completion job for matches")
@@ -38,10 +42,10 @@ class MatchCompletionService:
             cutoff_time = now - timedelta(minutes=30)
 
             # Get the "completed" and "confirmed" status IDs
-            completed_status = db.query(MatchStatus).filter(MatchStatus.name == "completed").first()
-            confirmed_status = db.query(MatchStatus).filter(MatchStatus.name == "confirmed").first()
+            completed_status_id = reference_data.get_id(db, MatchStatus, "completed")
+            confirmed_status_id = reference_data.get_id(db, MatchStatus, "confirmed")
 
-            if not completed_status or not confirmed_status:
+            if not completed_status_id or not confirmed_status_id:
                 self.logger.error("Required match statuses not found in database")
                 return
 
@@ -53,11 +57,11 @@ class MatchCompletionService:
                 update(Match)
                 .where(
                     Match.deleted_at.is_(None),
-                    Match.match_status_id == confirmed_status.id,
+                    Match.match_status_id == confirmed_status_id,
                     Match.chosen_time_block_id.isnot(None),
                     Match.chosen_time_block_id.in_(timeblock_subquery),
                 )
-                .values(match_status_id=completed_status.id, deleted_at=now)
+                .values(match_status_id=completed_status_id, deleted_at=now)
                 .returning(Match.id, Match.participant_id, Match.volunteer_id)
             )
 
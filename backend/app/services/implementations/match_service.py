@@ -25,7 +25,9 @@ from app.schemas.match import (
 )
 from app.schemas.time_block import TimeBlockEntity, TimeRange
 from app.schemas.user import UserRole
-from app.utilities.ses_email_service import SESEmailService
+from app.utilities.email_outbox import OutboxEmailService
+from app.utilities.reference_data import reference_data
+from app.utilities.threadpool import in_threadpool
 from app.utilities.timezone_utils import get_timezone_from_abbreviation
 
 SCHEDULE_CLEANUP_STATUSES = {
@@ -48,7 +50,8 @@ class MatchService:
         self.db = db
         self.logger = logging.getLogger(__name__)
 
-    async def create_matches(self, req: MatchCreateRequest) -> MatchCreateResponse:
+    @in_threadpool
+    def create_matches(self, req: MatchCreateRequest) -> MatchCreateResponse:
         try:
             participant: User | None = self.db.get(User, req.participant_id)
             if not participant:
@@ -58,7 +61,7 @@ class MatchService:
 
             # Default to awaiting_volunteer_acceptance (volunteers must accept before participants see matches)
             status_name = req.match_status or "awaiting_volunteer_acceptance"
-            status = self.db.query(MatchStatus).filter_by(name=status_name).first()
+            status = reference_data.get_by_name(self.db, MatchStatus, status_name)
             if not status:
                 raise HTTPException(400, f"Invalid match status: {status_name}")
 
@@ -92,32 +95,34 @@ class MatchService:
                 participant.pending_volunteer_request = False
 
             self.db.flush()
-            self.db.commit()
-
-            for match in created_matches:
-                self.db.refresh(match)
 
-            # Send "matches available" email to each volunteer
-            ses_service = SESEmailService()
+            # Queue a "matches available" email to each volunteer, sent once the matches are committed
             for match in created_matches:
                 try:
-                    volunteer = self.db.get(User, match.volunteer_id)
-                    if volunteer and volunteer.email:
-                        # Get volunteer's language (enum values are already "en" or "fr")
-                        language = volunteer.language.value if volunteer.language else "en"
-
-                        first_name = volunteer.first_name if volunteer.first_name else None
-                        matches_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard"
-
-                        ses_service.send_matches_available_email(
-                            to_email=volunteer.email,
-                            first_name=first_name,
-                            matches_url=matches_url,
-                            language=language,
-                        )
+                    with self.db.begin_nested():
+                        volunteer = self.db.get(User, match.volunteer_id)
+                        if volunteer and volunteer.email:
+                            # Get volunteer's language (enum values are already "en" or "fr")
+                            language = volunteer.language.value if volunteer.language else "en"
+
+                            first_name = volunteer.first_name if volunteer.first_name else None
+                            matches_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard"
+
+                            ses_service = OutboxEmailService(self.db, event_key=f"match-{match.id}-created")
+                            ses_service.send_matches_available_email(
+                                to_email=volunteer.email,
+                                first_name=first_name,
+                                matches_url=matches_url,
+                                language=language,
+                            )
                 except Exception as e:
                     # Log error but don't fail the match creation
-                    self.logger.error(f"Failed to send matches available email to volunteer {match.volunteer_id}: {e}")
+                    self.logger.error(f"Failed to queue matches available email to volunteer {match.volunteer_id}: {e}")
+
+            self.db.commit()
+
+            for match in created_matches:
+                self.db.refresh(match)
 
             responses = [self._build_match_response(match) for match in created_matches]
             return MatchCreateResponse(matches=responses)
@@ -130,7 +135,8 @@ class MatchService:
             self.logger.error(f"Error creating matches for participant {req.participant_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to create matches")
 
-    async def update_match(self, match_id: int, req: MatchUpdateRequest) -> MatchResponse:
+    @in_threadpool
+    def update_match(self, match_id: int, req: MatchUpdateRequest) -> MatchResponse:
         try:
             match: Match | None = self.db.get(Match, match_id)
             if not match or match.deleted_at is not None:
@@ -149,12 +155,12 @@ class MatchService:
                 volunteer_changed = True
 
             if req.match_status is not None:
-                status = self.db.query(MatchStatus).filter_by(name=req.match_status).first()
+                status = reference_data.get_by_name(self.db, MatchStatus, req.match_status)
                 if not status:
                     raise HTTPException(400, f"Invalid match status: {req.match_status}")
                 match.match_status = status
             elif volunteer_changed:
-                awaiting_status = self.db.query(MatchStatus).filter_by(name="awaiting_volunteer_acceptance").first()
+                awaiting_status = reference_data.get_by_name(self.db, MatchStatus, "awaiting_volunteer_acceptance")
                 if not awaiting_status:
                     raise HTTPException(500, "Match status 'awaiting_volunteer_acceptance' not configured")
                 match.match_status = awaiting_status
@@ -194,7 +200,8 @@ class MatchService:
             self.logger.error(f"Error updating match {match_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to update match")
 
-    async def schedule_match(
+    @in_threadpool
+    def schedule_match(
         self,
         match_id: int,
         time_block_id: int,
@@ -251,7 +258,7 @@ class MatchService:
             match.chosen_time_block_id = block.id
             match.confirmed_time = block
 
-            confirmed_status = self.db.query(MatchStatus).filter_by(name="confirmed").first()
+            confirmed_status = reference_data.get_by_name(self.db, MatchStatus, "confirmed")
             if not confirmed_status:
                 raise HTTPException(500, "Match status 'confirmed' not configured")
             match.match_status = confirmed_status
@@ -279,92 +286,96 @@ class MatchService:
                     self._delete_match(other)
 
             self.db.flush()
-            self.db.commit()
-            self.db.refresh(match)
 
-            # Send "call scheduled" email to both participant and volunteer
+            # Queue "call scheduled" emails to both participant and volunteer, sent once the schedule is committed
             try:
-                # Load participant and volunteer with their data
-                participant = (
-                    self.db.query(User)
-                    .options(joinedload(User.user_data))
-                    .filter(User.id == match.participant_id)
-                    .first()
-                )
-                volunteer = (
-                    self.db.query(User)
-                    .options(joinedload(User.user_data))
-                    .filter(User.id == match.volunteer_id)
-                    .first()
-                )
-
-                if participant and volunteer and match.confirmed_time:
-                    ses_service = SESEmailService()
-                    confirmed_time_utc = match.confirmed_time.start_time
-
-                    # Get participant's timezone and language
-                    participant_tz = ZoneInfo("America/Toronto")  # Default to EST
-                    if participant.user_data and participant.user_data.timezone:
-                        tz_result = get_timezone_from_abbreviation(participant.user_data.timezone)
-                        if tz_result:
-                            participant_tz = tz_result
-
-                    participant_language = participant.language.value if participant.language else "en"
-
-                    # Get volunteer's timezone and language
-                    volunteer_tz = ZoneInfo("America/Toronto")  # Default to EST
-                    if volunteer.user_data and volunteer.user_data.timezone:
-                        tz_result = get_timezone_from_abbreviation(volunteer.user_data.timezone)
-                        if tz_result:
-                            volunteer_tz = tz_result
-
-                    volunteer_language = volunteer.language.value if volunteer.language else "en"
-
-                    # Convert time to participant's timezone
-                    participant_time = confirmed_time_utc.astimezone(participant_tz)
-                    participant_date = participant_time.strftime("%B %d, %Y")
-                    participant_time_str = participant_time.strftime("%I:%M %p")
-                    participant_tz_abbr = participant_time.strftime("%Z")
-
-                    # Convert time to volunteer's timezone
-                    volunteer_time = confirmed_time_utc.astimezone(volunteer_tz)
-                    volunteer_date = volunteer_time.strftime("%B %d, %Y")
-                    volunteer_time_str = volunteer_time.strftime("%I:%M %p")
-                    volunteer_tz_abbr = volunteer_time.strftime("%Z")
-
-                    # Send to participant
-                    if participant.email:
-                        ses_service.send_call_scheduled_email(
-                            to_email=participant.email,
-                            match_name=f"{volunteer.first_name} {volunteer.last_name}"
-                            if volunteer.first_name and volunteer.last_name
-                            else "Your volunteer",
-                            date=participant_date,
-                            time=participant_time_str,
-                            timezone=participant_tz_abbr,
-                            first_name=participant.first_name,
-                            scheduled_calls_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/participant/dashboard",
-                            language=participant_language,
-                        )
+                with self.db.begin_nested():
+                    # Load participant and volunteer with their data
+                    participant = (
+                        self.db.query(User)
+                        .options(joinedload(User.user_data))
+                        .filter(User.id == match.participant_id)
+                        .first()
+                    )
+                    volunteer = (
+                        self.db.query(User)
+                        .options(joinedload(User.user_data))
+                        .filter(User.id == match.volunteer_id)
+                        .first()
+                    )
 
-                    # Send to volunteer
-                    if volunteer.email:
-                        ses_service.send_call_scheduled_email(
-                            to_email=volunteer.email,
-                            match_name=f"{participant.first_name} {participant.last_name}"
-                            if participant.first_name and participant.last_name
-                            else "Your participant",
-                            date=volunteer_date,
-                            time=volunteer_time_str,
-                            timezone=volunteer_tz_abbr,
-                            first_name=volunteer.first_name,
-                            scheduled_calls_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard",
-                            language=volunteer_language,
+                    if participant and volunteer and match.confirmed_time:
+                        ses_service = OutboxEmailService(
+                            self.db, event_key=f"match-{match.id}-scheduled-{match.chosen_time_block_id}"
                         )
+                        confirmed_time_utc = match.confirmed_time.start_time
+
+                        # Get participant's timezone and language
+                        participant_tz = ZoneInfo("America/Toronto")  # Default to EST
+                        if participant.user_data and participant.user_data.timezone:
+                            tz_result = get_timezone_from_abbreviation(participant.user_data.timezone)
+                            if tz_result:
+                                participant_tz = tz_result
+
+                        participant_language = participant.language.value if participant.language else "en"
+
+                        # Get volunteer's timezone and language
+                        volunteer_tz = ZoneInfo("America/Toronto")  # Default to EST
+                        if volunteer.user_data and volunteer.user_data.timezone:
+                            tz_result = get_timezone_from_abbreviation(volunteer.user_data.timezone)
+                            if tz_result:
+                                volunteer_tz = tz_result
+
+                        volunteer_language = volunteer.language.value if volunteer.language else "en"
+
+                        # Convert time to participant's timezone
+                        participant_time = confirmed_time_utc.astimezone(participant_tz)
+                        participant_date = participant_time.strftime("%B %d, %Y")
+                        participant_time_str = participant_time.strftime("%I:%M %p")
+                        participant_tz_abbr = participant_time.strftime("%Z")
+
+                        # Convert time to volunteer's timezone
+                        volunteer_time = confirmed_time_utc.astimezone(volunteer_tz)
+                        volunteer_date = volunteer_time.strftime("%B %d, %Y")
+                        volunteer_time_str = volunteer_time.strftime("%I:%M %p")
+                        volunteer_tz_abbr = volunteer_time.strftime("%Z")
+
+                        # Send to participant
+                        if participant.email:
+                            ses_service.send_call_scheduled_email(
+                                to_email=participant.email,
+                                match_name=f"{volunteer.first_name} {volunteer.last_name}"
+                                if volunteer.first_name and volunteer.last_name
+                                else "Your volunteer",
+                                date=participant_date,
+                                time=participant_time_str,
+                                timezone=participant_tz_abbr,
+                                first_name=participant.first_name,
+                                scheduled_calls_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/participant/dashboard",
+                                language=participant_language,
+                            )
+
+                        # Send to volunteer
+                        if volunteer.email:
+                            ses_service.send_call_scheduled_email(
+                                to_email=volunteer.email,
+                                match_name=f"{participant.first_name} {participant.last_name}"
+                                if participant.first_name and participant.last_name
+                                else "Your participant",
+                                date=volunteer_date,
+                                time=volunteer_time_str,
+                                timezone=volunteer_tz_abbr,
+                                first_name=volunteer.first_name,
+                                scheduled_calls_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard",
+                                language=volunteer_language,
+                            )
 
             except Exception as e:
                 # Log error but don't fail the scheduling
-                self.logger.error(f"Failed to send call scheduled emails for match {match_id}: {e}")
+                self.logger.error(f"Failed to queue call scheduled emails for match {match_id}: {e}")
+
+            self.db.commit()
+            self.db.refresh(match)
 
             return self._build_match_detail(match)
 
@@ -376,7 +387,8 @@ class MatchService:
             self.logger.error(f"Error scheduling match {match_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to schedule match")
 
-    async def request_new_times(
+    @in_threadpool
+    def request_new_times(
         self,
         match_id: int,
         time_ranges: List[TimeRange],
@@ -415,44 +427,50 @@ class MatchService:
             if added == 0:
                 raise HTTPException(400, "No suggested time blocks generated from provided ranges")
 
-            requesting_status = self.db.query(MatchStatus).filter_by(name="requesting_new_times").first()
+            requesting_status = reference_data.get_by_name(self.db, MatchStatus, "requesting_new_times")
             if not requesting_status:
                 raise HTTPException(500, "Match status 'requesting_new_times' not configured")
 
             match.match_status = requesting_status
 
             self.db.flush()
-            self.db.commit()
-            self.db.refresh(match)
 
-            # Send "participant requested new times" email to volunteer
+            # Queue a "participant requested new times" email to the volunteer
             try:
-                # Load participant and volunteer
-                participant = self.db.get(User, match.participant_id)
-                volunteer = self.db.get(User, match.volunteer_id)
-
-                if participant and volunteer and volunteer.email:
-                    # Get volunteer's language
-                    volunteer_language = volunteer.language.value if volunteer.language else "en"
-
-                    # Get participant's name for email
-                    participant_name = (
-                        f"{participant.first_name} {participant.last_name}"
-                        if participant.first_name and participant.last_name
-                        else "A participant"
-                    )
+                with self.db.begin_nested():
+                    # Load participant and volunteer
+                    participant = self.db.get(User, match.participant_id)
+                    volunteer = self.db.get(User, match.volunteer_id)
 
-                    ses_service = SESEmailService()
-                    ses_service.send_participant_requested_new_times_email(
-                        to_email=volunteer.email,
-                        participant_name=participant_name,
-                        first_name=volunteer.first_name,
-                        matches_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard",
-                        language=volunteer_language,
-                    )
+                    if participant and volunteer and volunteer.email:
+                        # Get volunteer's language
+                        volunteer_language = volunteer.language.value if volunteer.language else "en"
+
+                        # Get participant's name for email
+                        participant_name = (
+                            f"{participant.first_name} {participant.last_name}"
+                            if participant.first_name and participant.last_name
+                            else "A participant"
+                        )
+
+                        # Each request replaces the suggested blocks, so the newest block id names the request
+                        new_times_key = max(block.id for block in match.suggested_time_blocks)
+                        ses_service = OutboxEmailService(
+                            self.db, event_key=f"match-{match.id}-new-times-{new_times_key}"
+                        )
+                        ses_service.send_participant_requested_new_times_email(
+                            to_email=volunteer.email,
+                            participant_name=participant_name,
+                            first_name=volunteer.first_name,
+                            matches_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard",
+                            language=volunteer_language,
+                        )
             except Exception as e:
                 # Log error but don't fail the request
-                self.logger.error(f"Failed to send participant requested new times email for match {match_id}: {e}")
+                self.logger.error(f"Failed to queue participant requested new times email for match {match_id}: {e}")
+
+            self.db.commit()
+            self.db.refresh(match)
 
             return self._build_match_detail(match)
 
@@ -464,7 +482,8 @@ class MatchService:
             self.logger.error(f"Error requesting new times for match {match_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to request new times")
 
-    async def cancel_match_by_participant(
+    @in_threadpool
+    def cancel_match_by_participant(
         self,
         match_id: int,
         acting_participant_id: Optional[UUID] = None,
@@ -486,56 +505,59 @@ class MatchService:
 
             # Send cancellation email to volunteer before deleting match
             try:
-                # Load volunteer with their data before deleting match
-                volunteer = (
-                    self.db.query(User)
-                    .options(joinedload(User.user_data))
-                    .filter(User.id == match.volunteer_id)
-                    .first()
-                )
-                participant = (
-                    self.db.query(User)
-                    .options(joinedload(User.user_data))
-                    .filter(User.id == match.participant_id)
-                    .first()
-                )
-
-                if volunteer and participant and match.confirmed_time:
-                    ses_service = SESEmailService()
-                    confirmed_time_utc = match.confirmed_time.start_time
-
-                    # Get volunteer's timezone and language
-                    volunteer_tz = ZoneInfo("America/Toronto")  # Default to EST
-                    if volunteer.user_data and volunteer.user_data.timezone:
-                        tz_result = get_timezone_from_abbreviation(volunteer.user_data.timezone)
-                        if tz_result:
-                            volunteer_tz = tz_result
-
-                    volunteer_language = volunteer.language.value if volunteer.language else "en"
-
-                    # Convert time to volunteer's timezone
-                    volunteer_time = confirmed_time_utc.astimezone(volunteer_tz)
-                    volunteer_date = volunteer_time.strftime("%B %d, %Y")
-                    volunteer_time_str = volunteer_time.strftime("%I:%M %p")
-                    volunteer_tz_abbr = volunteer_time.strftime("%Z")
+                with self.db.begin_nested():
+                    # Load volunteer with their data before deleting match
+                    volunteer = (
+                        self.db.query(User)
+                        .options(joinedload(User.user_data))
+                        .filter(User.id == match.volunteer_id)
+                        .first()
+                    )
+                    participant = (
+                        self.db.query(User)
+                        .options(joinedload(User.user_data))
+                        .filter(User.id == match.participant_id)
+                        .first()
+                    )
 
-                    # Send to volunteer
-                    if volunteer.email:
-                        participant_name = (
-                            f"{participant.first_name} {participant.last_name}"
-                            if participant.first_name and participant.last_name
-                            else participant.first_name or "The participant"
-                        )
-                        ses_service.send_participant_cancelled_email(
-                            to_email=volunteer.email,
-                            participant_name=participant_name,
-                            date=volunteer_date,
-                            time=volunteer_time_str,
-                            timezone=volunteer_tz_abbr,
-                            first_name=volunteer.first_name,
-                            dashboard_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard",
-                            language=volunteer_language,
+                    if volunteer and participant and match.confirmed_time:
+                        ses_service = OutboxEmailService(
+                            self.db, event_key=f"match-{match.id}-cancelled-by-participant-{match.confirmed_time.id}"
                         )
+                        confirmed_time_utc = match.confirmed_time.start_time
+
+                        # Get volunteer's timezone and language
+                        volunteer_tz = ZoneInfo("America/Toronto")  # Default to EST
+                        if volunteer.user_data and volunteer.user_data.timezone:
+                            tz_result = get_timezone_from_abbreviation(volunteer.user_data.timezone)
+                            if tz_result:
+                                volunteer_tz = tz_result
+
+                        volunteer_language = volunteer.language.value if volunteer.language else "en"
+
+                        # Convert time to volunteer's timezone
+                        volunteer_time = confirmed_time_utc.astimezone(volunteer_tz)
+                        volunteer_date = volunteer_time.strftime("%B %d, %Y")
+                        volunteer_time_str = volunteer_time.strftime("%I:%M %p")
+                        volunteer_tz_abbr = volunteer_time.strftime("%Z")
+
+                        # Send to volunteer
+                        if volunteer.email:
+                            participant_name = (
+                                f"{participant.first_name} {participant.last_name}"
+                                if participant.first_name and participant.last_name
+                                else participant.first_name or "The participant"
+                            )
+                            ses_service.send_participant_cancelled_email(
+                                to_email=volunteer.email,
+                                participant_name=participant_name,
+                                date=volunteer_date,
+                                time=volunteer_time_str,
+                                timezone=volunteer_tz_abbr,
+                                first_name=volunteer.first_name,
+                                dashboard_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/volunteer/dashboard",
+                                language=volunteer_language,
+                            )
             except Exception as e:
                 # Log error but don't fail the cancellation
                 self.logger.error(f"Failed to send participant cancelled email for match {match_id}: {e}")
@@ -557,7 +579,8 @@ class MatchService:
             self.logger.error(f"Error cancelling match {match_id} as participant: {exc}")
             raise HTTPException(status_code=500, detail="Failed to cancel match")
 
-    async def cancel_match_by_volunteer(
+    @in_threadpool
+    def cancel_match_by_volunteer(
         self,
         match_id: int,
         acting_volunteer_id: Optional[UUID] = None,
@@ -577,56 +600,59 @@ class MatchService:
 
             # Send cancellation email to participant before clearing confirmed time
             try:
-                # Load participant and volunteer with their data before clearing time
-                participant = (
-                    self.db.query(User)
-                    .options(joinedload(User.user_data))
-                    .filter(User.id == match.participant_id)
-                    .first()
-                )
-                volunteer = (
-                    self.db.query(User)
-                    .options(joinedload(User.user_data))
-                    .filter(User.id == match.volunteer_id)
-                    .first()
-                )
+                with self.db.begin_nested():
+                    # Load participant and volunteer with their data before clearing time
+                    participant = (
+                        self.db.query(User)
+                        .options(joinedload(User.user_data))
+                        .filter(User.id == match.participant_id)
+                        .first()
+                    )
+                    volunteer = (
+                        self.db.query(User)
+                        .options(joinedload(User.user_data))
+                        .filter(User.id == match.volunteer_id)
+                        .first()
+                    )
 
-                if participant and volunteer and match.confirmed_time:
-                    ses_service = SESEmailService()
-                    confirmed_time_utc = match.confirmed_time.start_time
-
-                    # Get participant's timezone and language
-                    participant_tz = ZoneInfo("America/Toronto")  # Default to EST
-                    if participant.user_data and participant.user_data.timezone:
-                        tz_result = get_timezone_from_abbreviation(participant.user_data.timezone)
-                        if tz_result:
-                            participant_tz = tz_result
-
-                    participant_language = participant.language.value if participant.language else "en"
-
-                    # Convert time to participant's timezone
-                    participant_time = confirmed_time_utc.astimezone(participant_tz)
-                    participant_date = participant_time.strftime("%B %d, %Y")
-                    participant_time_str = participant_time.strftime("%I:%M %p")
-                    participant_tz_abbr = participant_time.strftime("%Z")
-
-                    # Send to participant
-                    if participant.email:
-                        volunteer_name = (
-                            f"{volunteer.first_name} {volunteer.last_name}"
-                            if volunteer.first_name and volunteer.last_name
-                            else volunteer.first_name or "Your volunteer"
-                        )
-                        ses_service.send_volunteer_cancelled_email(
-                            to_email=participant.email,
-                            volunteer_name=volunteer_name,
-                            date=participant_date,
-                            time=participant_time_str,
-                            timezone=participant_tz_abbr,
-                            first_name=participant.first_name,
-                            request_matches_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/participant/dashboard",
-                            language=participant_language,
+                    if participant and volunteer and match.confirmed_time:
+                        ses_service = OutboxEmailService(
+                            self.db, event_key=f"match-{match.id}-cancelled-by-volunteer-{match.confirmed_time.id}"
                         )
+                        confirmed_time_utc = match.confirmed_time.start_time
+
+                        # Get participant's timezone and language
+                        participant_tz = ZoneInfo("America/Toronto")  # Default to EST
+                        if participant.user_data and participant.user_data.timezone:
+                            tz_result = get_timezone_from_abbreviation(participant.user_data.timezone)
+                            if tz_result:
+                                participant_tz = tz_result
+
+                        participant_language = participant.language.value if participant.language else "en"
+
+                        # Convert time to participant's timezone
+                        participant_time = confirmed_time_utc.astimezone(participant_tz)
+                        participant_date = participant_time.strftime("%B %d, %Y")
+                        participant_time_str = participant_time.strftime("%I:%M %p")
+                        participant_tz_abbr = participant_time.strftime("%Z")
+
+                        # Send to participant
+                        if participant.email:
+                            volunteer_name = (
+                                f"{volunteer.first_name} {volunteer.last_name}"
+                                if volunteer.first_name and volunteer.last_name
+                                else volunteer.first_name or "Your volunteer"
+                            )
+                            ses_service.send_volunteer_cancelled_email(
+                                to_email=participant.email,
+                                volunteer_name=volunteer_name,
+                                date=participant_date,
+                                time=participant_time_str,
+                                timezone=participant_tz_abbr,
+                                first_name=participant.first_name,
+                                request_matches_url=f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/participant/dashboard",
+                                language=participant_language,
+                            )
             except Exception as e:
                 # Log error but don't fail the cancellation
                 self.logger.error(f"Failed to send volunteer cancelled email for match {match_id}: {e}")
@@ -648,7 +674,8 @@ class MatchService:
             self.logger.error(f"Error cancelling match {match_id} as volunteer: {exc}")
             raise HTTPException(status_code=500, detail="Failed to cancel match")
 
-    async def get_matches_for_participant(self, participant_id: UUID) -> MatchListResponse:
+    @in_threadpool
+    def get_matches_for_participant(self, participant_id: UUID) -> MatchListResponse:
         try:
             # Get participant to check pending request flag
             participant: User | None = self.db.get(User, participant_id)
@@ -688,7 +715,8 @@ class MatchService:
             self.logger.error(f"Error fetching matches for participant {participant_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to fetch matches")
 
-    async def get_all_matches_for_participant_admin(self, participant_id: UUID) -> MatchListResponse:
+    @in_threadpool
+    def get_all_matches_for_participant_admin(self, participant_id: UUID) -> MatchListResponse:
         """Get all matches for a participant including those awaiting volunteer acceptance (admin only)."""
         try:
             # Get participant to check pending request flag
@@ -728,7 +756,8 @@ class MatchService:
             self.logger.error(f"Error fetching all matches for participant {participant_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to fetch matches")
 
-    async def get_matches_for_volunteer(self, volunteer_id: UUID) -> MatchListForVolunteerResponse:
+    @in_threadpool
+    def get_matches_for_volunteer(self, volunteer_id: UUID) -> MatchListForVolunteerResponse:
         """Get all matches for a volunteer, including those awaiting acceptance."""
         try:
             volunteer: User | None = self.db.get(User, volunteer_id)
@@ -759,7 +788,8 @@ class MatchService:
             self.logger.error(f"Error fetching matches for volunteer {volunteer_id}: {exc}")
             raise HTTPException(status_code=500, detail="Failed to fetch matches")
 
-    async def volunteer_accept_match(
+    @in_threadpool
+    def volunteer_accept_match(
         self,
         match_id: int,
         acting_volunteer_id: Optional[UUID] = None,
@@ -819,29 +849,31 @@ class MatchService:
                 participant.pending_volunteer_request = False
 
             self.db.flush()
-            self.db.commit()
-            self.db.refresh(match)
 
-            # Send "matches available" email to participant
+            # Queue a "matches available" email to the participant, sent once the acceptance is committed
             try:
-                participant = match.participant
-                if participant and participant.email:
-                    # Get participant's language (enum values are already "en" or "fr")
-                    language = participant.language.value if participant.language else "en"
-
-                    first_name = participant.first_name if participant.first_name else None
-                    matches_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/participant/dashboard"
-
-                    ses_service = SESEmailService()
-                    ses_service.send_matches_available_email(
-                        to_email=participant.email,
-                        first_name=first_name,
-                        matches_url=matches_url,
-                        language=language,
-                    )
+                with self.db.begin_nested():
+                    participant = match.participant
+                    if participant and participant.email:
+                        # Get participant's language (enum values are already "en" or "fr")
+                        language = participant.language.value if participant.language else "en"
+
+                        first_name = participant.first_name if participant.first_name else None
+                        matches_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/participant/dashboard"
+
+                        ses_service = OutboxEmailService(self.db, event_key=f"match-{match.id}-accepted")
+                        ses_service.send_matches_available_email(
+                            to_email=participant.email,
+                            first_name=first_name,
+                            matches_url=matches_url,
+                            language=language,
+                        )
             except Exception as e:
                 # Log error but don't fail the match acceptance
-                self.logger.error(f"Failed to send matches available email to participant {match.participant_id}: {e}")
+                self.logger.error(f"Failed to queue matches available email to participant {match.participant_id}: {e}")
+
+            self.db.commit()
+            self.db.refresh(match)
 
             # Return match detail for participant view (includes suggested times)
             return self._build_match_detail(match)
@@ -922,7 +954,8 @@ class MatchService:
             updated_at=match.updated_at,
         )
 
-    async def request_new_volunteers(
+    @in_threadpool
+    def request_new_volunteers(
         self,
         participant_id: UUID,
         acting_participant_id: Optional[UUID] = None,
@@ -1086,7 +1119,7 @@ class MatchService:
             self.db.delete(confirmed_block)
 
     def _set_match_status(self, match: Match, status_name: str) -> None:
-        status = self.db.query(MatchStatus).filter_by(name=status_name).first()
+        status = reference_data.get_by_name(self.db, MatchStatus, status_name)
         if not status:
             raise HTTPException(500, f"Match status '{status_name}' not configured")
         match.match_status = status
@@ -1,11 +1,19 @@
+import heapq
 import logging
 import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import func
 
 from app.interfaces.matching_service import IMatchingService
 from app.models.Experience import Experience
@@ -15,9 +23,69 @@ from app.models.Quality import Quality
 from app.models.RankingPreference import RankingPreference
 from app.models.Role import Role
 from app.models.Treatment import Treatment
-from app.models.User import User
+from app.models.User import Language, User
 from app.models.UserData import UserData
 from app.schemas.user import UserBase, UserRole
+from app.services.implementations.match_service import ACTIVE_MATCH_STATUSES
+from app.utilities.assignment_solver import solve_assignment
+from app.utilities.matching_engine import (
+    CandidatePool,
+    ParticipantProfile,
+    detach_preferences,
+    eligible_volunteer_type,
+    pickle_pool,
+    rank_batch,
+    rank_batch_in_worker,
+)
+from app.utilities.reference_data import reference_data
+from app.utilities.threadpool import in_threadpool
+from app.utilities.volunteer_index import IndexedVolunteer, volunteer_index
+
+# Participants scored per batch chunk (one process pool task each)
+BATCH_CHUNK_SIZE = 25
+# Worker processes used when a batch asks for a process pool
+BATCH_PROCESS_WORKERS = int(os.getenv("MATCHING_BATCH_WORKERS", str(os.cpu_count() or 1)))
+
+
+class BatchExecutor:
+    """
+    The process pool shared by every batch request in this process, started on first use and shut
+    down with the server. Spawn avoids forking a threaded server process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def get(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=BATCH_PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+batch_executor = BatchExecutor()
+
+
+@dataclass
+class _MatchingBatch:
+    """Participants of a batch and the scoring jobs, pools and counts loaded for them."""
+
+    participant_ids: List[UUID]
+    errors: Dict[UUID, str] = field(default_factory=dict)
+    jobs: List[Any] = field(default_factory=list)
+    job_keys: Dict[UUID, Tuple[Language, str]] = field(default_factory=dict)
+    pools: Dict[Tuple[Language, str], CandidatePool] = field(default_factory=dict)
+    volunteers_by_key: Dict[Tuple[Language, str], List[IndexedVolunteer]] = field(default_factory=dict)
+    active_match_counts: Dict[UUID, int] = field(default_factory=dict)
 
 
 class MatchingService(IMatchingService):
@@ -56,34 +124,18 @@ class MatchingService(IMatchingService):
             # Get participant's language preference
             participant_language = user.language
 
-            # Get all active, approved volunteers with their data and matching language
-            volunteers_with_data = (
-                self.db.query(User, UserData)
-                .join(User.role)
-                .join(UserData, User.id == UserData.user_id)
-                .filter(Role.name == UserRole.VOLUNTEER)
-                .filter(User.active)
-                .filter(User.approved)
-                .filter(User.language == participant_language)
-                .all()
+            # Score all active, approved volunteers with matching language from the in-memory index
+            scored_volunteers = self._score_volunteer_pool(
+                participant_data, participant_preferences, participant_language
             )
-
-            if not volunteers_with_data:
+            if not scored_volunteers:
                 return []
 
-            # Calculate scores for each volunteer
-            scored_volunteers = []
-            for volunteer_user, volunteer_data in volunteers_with_data:
-                # print(f"\n=== COMPARING: Participant vs {volunteer_user.first_name} {volunteer_user.last_name} ===")
-                # self._print_comparison_table(participant_data, volunteer_data, volunteer_user.first_name + " " + volunteer_user.last_name, participant_preferences)
-                score = self._calculate_match_score(participant_data, volunteer_data, participant_preferences)
-                # print(f"FINAL SCORE: {score}")
-                scored_volunteers.append((volunteer_user, score))
-
-            # Sort by score (highest first) and apply limit
-            scored_volunteers.sort(key=lambda x: x[1], reverse=True)
+            # Sort by score (highest first); with a limit, select the top K with a bounded heap
             if limit:
-                scored_volunteers = scored_volunteers[:limit]
+                scored_volunteers = heapq.nlargest(limit, scored_volunteers, key=lambda x: x[1])
+            else:
+                scored_volunteers.sort(key=lambda x: x[1], reverse=True)
 
             # Convert to response models with scores
             return [
@@ -92,7 +144,7 @@ class MatchingService(IMatchingService):
                         first_name=volunteer.first_name,
                         last_name=volunteer.last_name,
                         email=volunteer.email,
-                        role=UserRole(volunteer.role.name),
+                        role=UserRole.VOLUNTEER,
                     ),
                     "score": score,
                 }
@@ -105,15 +157,28 @@ class MatchingService(IMatchingService):
             self.logger.error(f"Error finding matches: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Internal server error during matching process: {str(e)}")
 
-    async def get_admin_matches(self, participant_id: UUID) -> List[Dict[str, Any]]:
+    async def get_admin_matches(
+        self,
+        participant_id: UUID,
+        page_size: Optional[int] = None,
+        min_score: Optional[float] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Get potential volunteer matches for a participant with full volunteer details for admin view.
-        Returns all volunteers with their complete information and match scores.
+        Candidates are ordered by score (highest first, ties by volunteer id). Without a page size,
+        all volunteers are returned; details are only loaded for the candidates that are returned.
         :param participant_id: ID of the participant user to find matches for
-        :return: List of dictionaries with full volunteer details and match scores
+        :param page_size: Maximum number of candidates to return (default: all)
+        :param min_score: Only return candidates with a match score (0-100 scale) at or above this value
+        :param cursor: `next_cursor` from a previous page, to continue after its last candidate
+        :return: Dictionary with 'matches' (full volunteer details and match scores) and 'next_cursor'
         :raises ValueError: If user is not found or not a participant
+        :raises HTTPException: 400 if the cursor is malformed
         """
         try:
+            cursor_position = self._decode_score_cursor(cursor) if cursor else None
+
             # Get the participant user
             user = self.db.query(User).filter(User.id == participant_id).first()
             if not user:
@@ -133,33 +198,56 @@ class MatchingService(IMatchingService):
             # Get participant's language preference
             participant_language = user.language
 
-            # Get all active, approved volunteers with their data and relationships
-            # Eagerly load user_data, treatments, and experiences to avoid N+1 queries
-            # Filter by matching language
+            # Score all active, approved volunteers with matching language from the in-memory index
+            scored_volunteers = self._score_volunteer_pool(
+                participant_data, participant_preferences, participant_language
+            )
+
+            # Apply score threshold and cursor before selecting the page
+            if min_score is not None:
+                scored_volunteers = [(v, score) for v, score in scored_volunteers if score * 100 >= min_score]
+            if cursor_position is not None:
+                scored_volunteers = [
+                    (v, score) for v, score in scored_volunteers if self._score_sort_key(v, score) > cursor_position
+                ]
+
+            # Select the page with a bounded heap (one extra row tells us whether another page exists)
+            if page_size:
+                page = heapq.nsmallest(page_size + 1, scored_volunteers, key=lambda x: self._score_sort_key(*x))
+            else:
+                page = sorted(scored_volunteers, key=lambda x: self._score_sort_key(*x))
+            next_cursor = None
+            if page_size and len(page) > page_size:
+                page = page[:page_size]
+                next_cursor = self._encode_score_cursor(*page[-1])
+            if not page:
+                return {"matches": [], "next_cursor": None}
+
+            # Load details with relationships in one query, only for the returned candidates
+            # (collections are select-in loaded to avoid a cartesian product of joins)
             volunteers = (
                 self.db.query(User)
-                .join(User.role)
                 .options(
-                    joinedload(User.user_data).joinedload(UserData.treatments),
-                    joinedload(User.user_data).joinedload(UserData.experiences),
+                    joinedload(User.user_data).selectinload(UserData.treatments),
+                    joinedload(User.user_data).selectinload(UserData.experiences),
+                    joinedload(User.user_data).selectinload(UserData.loved_one_treatments),
+                    joinedload(User.user_data).selectinload(UserData.loved_one_experiences),
                 )
-                .filter(Role.name == UserRole.VOLUNTEER)
-                .filter(User.active)
-                .filter(User.approved)
-                .filter(User.language == participant_language)
+                .filter(User.id.in_([volunteer.user_id for volunteer, _ in page]))
                 .all()
             )
+            volunteers_by_id = {volunteer.id: volunteer for volunteer in volunteers}
 
-            if not volunteers:
-                return []
+            # Count active matches for all volunteers in one grouped query
+            active_match_counts = self._get_active_match_counts(list(volunteers_by_id))
 
-            # Calculate scores and build detailed responses
-            scored_volunteers = []
-            for volunteer_user in volunteers:
-                volunteer_data = volunteer_user.user_data
-                if not volunteer_data:
+            # Build detailed responses
+            match_candidates = []
+            for indexed_volunteer, score in page:
+                volunteer_user = volunteers_by_id.get(indexed_volunteer.user_id)
+                if not volunteer_user or not volunteer_user.user_data:
                     continue
-                score = self._calculate_match_score(participant_data, volunteer_data, participant_preferences)
+                volunteer_data = volunteer_user.user_data
 
                 # Calculate age from date_of_birth
                 age = None
@@ -189,34 +277,8 @@ class MatchingService(IMatchingService):
                     else:
                         ethnic_group_list = [volunteer_data.ethnic_group]
 
-                # Count active matches for this volunteer
-                # Active statuses: pending, requesting_new_times, requesting_new_volunteers, confirmed, awaiting_volunteer_acceptance
-                active_statuses = (
-                    self.db.query(MatchStatus)
-                    .filter(
-                        MatchStatus.name.in_(
-                            [
-                                "pending",
-                                "requesting_new_times",
-                                "requesting_new_volunteers",
-                                "confirmed",
-                                "awaiting_volunteer_acceptance",
-                            ]
-                        )
-                    )
-                    .all()
-                )
-                active_status_ids = [status.id for status in active_statuses]
-
-                match_count = (
-                    self.db.query(Match)
-                    .filter(
-                        Match.volunteer_id == volunteer_user.id,
-                        Match.deleted_at.is_(None),
-                        Match.match_status_id.in_(active_status_ids),
-                    )
-                    .count()
-                )
+                # Active match count from the grouped aggregate above
+                match_count = active_match_counts.get(volunteer_user.id, 0)
 
                 # Format dates as ISO strings if they exist
                 date_of_diagnosis_str = None
@@ -251,52 +313,345 @@ class MatchingService(IMatchingService):
                     "loved_one_treatments": loved_one_treatment_names,
                     "loved_one_experiences": loved_one_experience_names,
                 }
-                scored_volunteers.append((match_candidate, score))
+                match_candidates.append(match_candidate)
 
-            scored_volunteers.sort(key=lambda x: x[1], reverse=True)
-            return [candidate for candidate, _ in scored_volunteers]
+            return {"matches": match_candidates, "next_cursor": next_cursor}
 
         except ValueError as ve:
             raise ve
+        except HTTPException:
+            raise
         except Exception as e:
             self.logger.error(f"Error finding admin matches: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Internal server error during matching process: {str(e)}")
 
+    def get_batch_matches(
+        self,
+        participant_ids: Optional[List[UUID]] = None,
+        limit: int = 10,
+        min_score: Optional[float] = None,
+        use_process_pool: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Rank volunteers for many participants at once.
+        Participants, their preferences, the volunteer pools and active match counts are all loaded
+        up front (the pools once per language); the returned iterator only scores, so results can be
+        streamed without holding database work open. Only volunteers of the type a participant can be
+        matched with are ranked.
+        :param participant_ids: Participants to match; None for every participant with a pending volunteer request
+        :param limit: Maximum number of candidates per participant
+        :param min_score: Only return candidates with a match score (0-100 scale) at or above this value
+        :param use_process_pool: Score in a pool of `MATCHING_BATCH_WORKERS` processes instead of in this process
+        :return: Iterator of dictionaries with 'participant_id', 'matches' and 'error' keys, one per participant
+        """
+        batch = self._prepare_batch(participant_ids)
+
+        def results() -> Iterator[Dict[str, Any]]:
+            # Rankings arrive in job order, which follows the requested participant order
+            rankings = self._rank_batch_jobs(batch.pools, batch.jobs, limit, min_score, use_process_pool)
+            for participant_id in batch.participant_ids:
+                if participant_id in batch.errors:
+                    yield {"participant_id": participant_id, "matches": [], "error": batch.errors[participant_id]}
+                    continue
+                matches = []
+                if participant_id in batch.job_keys:
+                    _, ranking = next(rankings)
+                    volunteers = batch.volunteers_by_key[batch.job_keys[participant_id]]
+                    for index, score in ranking:
+                        volunteer = volunteers[index]
+                        matches.append(
+                            {
+                                "volunteer_id": volunteer.user_id,
+                                "first_name": volunteer.first_name,
+                                "last_name": volunteer.last_name,
+                                "email": volunteer.email,
+                                "match_score": round(score * 100, 2),
+                                "match_count": batch.active_match_counts.get(volunteer.user_id, 0),
+                            }
+                        )
+                yield {"participant_id": participant_id, "matches": matches, "error": None}
+
+        return results()
+
+    @in_threadpool
+    def propose_assignments(
+        self,
+        participant_ids: Optional[List[UUID]] = None,
+        capacity: int = 3,
+        candidates_per_participant: int = 50,
+        min_score: Optional[float] = None,
+        use_process_pool: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Propose one volunteer for each of many participants, maximizing the total match score
+        across all of them instead of matching each participant greedily on their own.
+        No volunteer is proposed beyond `capacity` active matches, counting the ones they already have,
+        nor to a participant they already have an active match with. Proposals are not saved; approve them by passing `match_requests` to MatchService.create_matches.
+        :param participant_ids: Participants to match; None for every participant with a pending volunteer request
+        :param capacity: Maximum number of active matches per volunteer
+        :param candidates_per_participant: Number of top-ranked volunteers per participant the solver considers
+        :param min_score: Only consider candidates with a match score (0-100 scale) at or above this value
+        :param use_process_pool: Rank candidates in a pool of `MATCHING_BATCH_WORKERS` processes
+        :return: Dictionary with 'proposals', 'match_requests', 'unassigned_participant_ids' and 'total_score'
+        """
+        batch = self._prepare_batch(participant_ids)
+        try:
+            matched_volunteers = self._get_active_matched_volunteers(list(batch.job_keys))
+            # Rank enough extra candidates that dropping already matched volunteers leaves the requested number
+            rank_limit = candidates_per_participant + max(map(len, matched_volunteers.values()), default=0)
+            volunteers_by_id = {}
+            candidates = {}
+            rankings = self._rank_batch_jobs(batch.pools, batch.jobs, rank_limit, min_score, use_process_pool)
+            for participant_id, ranking in rankings:
+                volunteers = batch.volunteers_by_key[batch.job_keys[participant_id]]
+                excluded = matched_volunteers.get(participant_id, set())
+                candidates[participant_id] = []
+                for index, score in ranking:
+                    volunteer_id = volunteers[index].user_id
+                    if volunteer_id in excluded:
+                        continue
+                    if len(candidates[participant_id]) == candidates_per_participant:
+                        break
+                    volunteers_by_id[volunteer_id] = volunteers[index]
+                    candidates[participant_id].append((volunteer_id, score))
+
+            capacities = {
+                volunteer_id: capacity - batch.active_match_counts.get(volunteer_id, 0)
+                for volunteer_id in volunteers_by_id
+            }
+            assignment = solve_assignment(candidates, capacities)
+        except Exception as e:
+            self.logger.error(f"Error solving match assignment: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Internal server error during matching process: {str(e)}")
+
+        proposals = []
+        unassigned_participant_ids = []
+        for participant_id in dict.fromkeys(batch.participant_ids):
+            if participant_id not in assignment:
+                unassigned_participant_ids.append(participant_id)
+                continue
+            volunteer_id, score = assignment[participant_id]
+            volunteer = volunteers_by_id[volunteer_id]
+            proposals.append(
+                {
+                    "participant_id": participant_id,
+                    "volunteer_id": volunteer_id,
+                    "first_name": volunteer.first_name,
+                    "last_name": volunteer.last_name,
+                    "email": volunteer.email,
+                    "match_score": round(score * 100, 2),
+                    "match_count": batch.active_match_counts.get(volunteer_id, 0),
+                }
+            )
+
+        return {
+            "proposals": proposals,
+            "match_requests": [
+                {"participant_id": proposal["participant_id"], "volunteer_ids": [proposal["volunteer_id"]]}
+                for proposal in proposals
+            ],
+            "unassigned_participant_ids": unassigned_participant_ids,
+            "total_score": round(sum(score for _, score in assignment.values()) * 100, 2),
+        }
+
+    def _prepare_batch(self, participant_ids: Optional[List[UUID]]) -> _MatchingBatch:
+        """
+        Load everything batch matching needs in a fixed number of queries: the participants, their
+        preferences, the volunteer pool of each (language, volunteer type) in use, and active match counts.
+        """
+        try:
+            query = (
+                self.db.query(User, UserData)
+                .join(User.role)
+                .outerjoin(UserData, User.id == UserData.user_id)
+                .filter(Role.name == UserRole.PARTICIPANT)
+            )
+            if participant_ids is None:
+                query = query.filter(User.pending_volunteer_request.is_(True)).order_by(User.id)
+            else:
+                query = query.filter(User.id.in_(participant_ids))
+            participants = {user.id: (user, user_data) for user, user_data in query.all()}
+            batch = _MatchingBatch(participant_ids=list(participants) if participant_ids is None else participant_ids)
+
+            preferences_by_user = self._get_preferences_for_users(list(participants))
+
+            # Build one job per matchable participant; everyone else gets an error result
+            for participant_id in batch.participant_ids:
+                user, participant_data = participants.get(participant_id, (None, None))
+                preferences = preferences_by_user.get(participant_id)
+                if user is None:
+                    batch.errors[participant_id] = f"User with ID {participant_id} not found or not a participant"
+                    continue
+                if participant_data is None:
+                    batch.errors[participant_id] = f"User with ID {participant_id} has no intake form data"
+                    continue
+                if not preferences:
+                    batch.errors[participant_id] = f"User with ID {participant_id} has no ranking form data"
+                    continue
+
+                target_type = eligible_volunteer_type(participant_data, preferences)
+                key = (user.language, target_type)
+                if key not in batch.pools:
+                    segment = volunteer_index.get_segments(self.db, user.language).get(target_type)
+                    if segment:
+                        batch.volunteers_by_key[key], batch.pools[key] = segment
+                if key in batch.pools:
+                    profile = ParticipantProfile.from_user_data(participant_data)
+                    batch.jobs.append((participant_id, key, profile, detach_preferences(preferences)))
+                    batch.job_keys[participant_id] = key
+
+            volunteer_ids = [v.user_id for volunteers in batch.volunteers_by_key.values() for v in volunteers]
+            batch.active_match_counts = self._get_active_match_counts(volunteer_ids)
+            return batch
+        except Exception as e:
+            self.logger.error(f"Error preparing batch matches: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Internal server error during matching process: {str(e)}")
+
+    def _rank_batch_jobs(
+        self,
+        pools: Dict[Any, Any],
+        jobs: List[Any],
+        limit: int,
+        min_score: Optional[float],
+        use_process_pool: bool,
+    ) -> Iterator[Tuple[UUID, List[Tuple[int, float]]]]:
+        """Rank batch jobs in chunks, in job order, optionally spread over worker processes."""
+        chunks = [jobs[i : i + BATCH_CHUNK_SIZE] for i in range(0, len(jobs), BATCH_CHUNK_SIZE)]
+        if not use_process_pool or BATCH_PROCESS_WORKERS < 1 or len(chunks) < 2:
+            for chunk in chunks:
+                yield from rank_batch(pools, chunk, limit, min_score)
+            return
+
+        # Each task carries the pools its chunk uses, pickled once; workers unpickle each pool once
+        executor = batch_executor.get()
+        futures = []
+        try:
+            for chunk in chunks:
+                chunk_pools = {key: pickle_pool(pools[key]) for key in {job[1] for job in chunk}}
+                futures.append(executor.submit(rank_batch_in_worker, chunk_pools, chunk, limit, min_score))
+            for future in futures:
+                yield from future.result()
+        except BrokenProcessPool:
+            # A worker died; start a new pool for the next batch
+            batch_executor.shutdown()
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def _score_sort_key(volunteer: IndexedVolunteer, score: float) -> Tuple[float, str]:
+        """Admin candidate ordering: highest score first, ties broken by volunteer id."""
+        return (-score, str(volunteer.user_id))
+
+    @staticmethod
+    def _encode_score_cursor(volunteer: IndexedVolunteer, score: float) -> str:
+        return f"{score!r}_{volunteer.user_id}"
+
+    @staticmethod
+    def _decode_score_cursor(cursor: str) -> Tuple[float, str]:
+        """Turn a cursor back into the sort key of the last candidate on the previous page."""
+        try:
+            score, volunteer_id = cursor.split("_", 1)
+            return (-float(score), str(UUID(volunteer_id)))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    def _get_active_match_counts(self, volunteer_ids: List[UUID]) -> Dict[UUID, int]:
+        """Count non-deleted matches in an active status for each volunteer, in a single grouped query."""
+        if not volunteer_ids:
+            return {}
+        match_counts = (
+            self.db.query(Match.volunteer_id, func.count(Match.id).label("count"))
+            .filter(
+                Match.volunteer_id.in_(volunteer_ids),
+                Match.deleted_at.is_(None),
+                Match.match_status_id.in_(reference_data.get_ids(self.db, MatchStatus, ACTIVE_MATCH_STATUSES)),
+            )
+            .group_by(Match.volunteer_id)
+            .all()
+        )
+        return {volunteer_id: count for volunteer_id, count in match_counts}
+
+    def _get_active_matched_volunteers(self, participant_ids: List[UUID]) -> Dict[UUID, Set[UUID]]:
+        """Volunteers each participant has a non-deleted match with in an active status, in a single query."""
+        if not participant_ids:
+            return {}
+        matches = (
+            self.db.query(Match.participant_id, Match.volunteer_id)
+            .filter(
+                Match.participant_id.in_(participant_ids),
+                Match.deleted_at.is_(None),
+                Match.match_status_id.in_(reference_data.get_ids(self.db, MatchStatus, ACTIVE_MATCH_STATUSES)),
+            )
+            .all()
+        )
+        matched: Dict[UUID, Set[UUID]] = {}
+        for participant_id, volunteer_id in matches:
+            matched.setdefault(participant_id, set()).add(volunteer_id)
+        return matched
+
+    def _score_volunteer_pool(
+        self, participant_data: UserData, preferences: List[Dict[str, Any]], language: Language
+    ) -> List[Tuple[IndexedVolunteer, float]]:
+        """
+        Score every indexed volunteer of the given language for a participant.
+        Only the volunteer type the participant can be matched with is scored; the rest score 0.0.
+        """
+        target_type = eligible_volunteer_type(participant_data, preferences)
+        scored_volunteers = []
+        for volunteer_type, (volunteers, pool) in volunteer_index.get_segments(self.db, language).items():
+            if volunteer_type == target_type:
+                scores = pool.score(participant_data, preferences).tolist()
+            else:
+                scores = [0.0] * len(volunteers)
+            scored_volunteers.extend(zip(volunteers, scores))
+        return scored_volunteers
+
     def _get_user_preferences(self, user_id: UUID) -> List[Dict[str, Any]]:
         """Get user's ranking preferences with full context."""
+        return self._get_preferences_for_users([user_id]).get(user_id, [])
+
+    def _get_preferences_for_users(self, user_ids: List[UUID]) -> Dict[UUID, List[Dict[str, Any]]]:
+        """
+        Get ranking preferences with full context for several users, with a single query.
+        :return: Mapping of user id to preferences ordered by rank (users without any are omitted)
+        """
+        if not user_ids:
+            return {}
         preferences = (
             self.db.query(RankingPreference)
-            .filter(RankingPreference.user_id == user_id)
-            .order_by(RankingPreference.rank)
+            .filter(RankingPreference.user_id.in_(user_ids))
+            .order_by(RankingPreference.user_id, RankingPreference.rank)
             .all()
         )
 
-        preference_data = []
+        # Referenced qualities, treatments and experiences come from the reference data cache
+        models = {"quality": Quality, "treatment": Treatment, "experience": Experience}
+        preference_data: Dict[UUID, List[Dict[str, Any]]] = {}
         for pref in preferences:
-            pref_info = {
-                "target_role": pref.target_role,
-                "kind": pref.kind,
-                "scope": pref.scope,
-                "rank": pref.rank,
-                "object": None,
-            }
-
-            # Get the actual object based on kind
-            if pref.kind == "quality" and pref.quality_id:
-                quality = self.db.query(Quality).filter(Quality.id == pref.quality_id).first()
-                pref_info["object"] = quality
-            elif pref.kind == "treatment" and pref.treatment_id:
-                treatment = self.db.query(Treatment).filter(Treatment.id == pref.treatment_id).first()
-                pref_info["object"] = treatment
-            elif pref.kind == "experience" and pref.experience_id:
-                experience = self.db.query(Experience).filter(Experience.id == pref.experience_id).first()
-                pref_info["object"] = experience
-
-            if pref_info["object"]:
-                preference_data.append(pref_info)
+            model = models.get(pref.kind)
+            obj = reference_data.get_by_id(self.db, model, self._preference_object_id(pref)) if model else None
+            if obj:
+                preference_data.setdefault(pref.user_id, []).append(
+                    {
+                        "target_role": pref.target_role,
+                        "kind": pref.kind,
+                        "scope": pref.scope,
+                        "rank": pref.rank,
+                        "object": obj,
+                    }
+                )
 
         return preference_data
 
+    @staticmethod
+    def _preference_object_id(pref: RankingPreference) -> Optional[int]:
+        """Id of the quality, treatment or experience a preference points at, based on its kind."""
+        return {"quality": pref.quality_id, "treatment": pref.treatment_id, "experience": pref.experience_id}.get(
+            pref.kind
+        )
+
     def _is_patient_volunteer(self, volunteer_data: UserData) -> bool:
         """Check if volunteer is a patient (has cancer and not a caregiver)."""
         has_cancer = (volunteer_data.has_blood_cancer or "").lower() == "yes"
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.models import Form, FormSubmission, Quality, User, UserData
 from app.models.User import FormStatus
+from app.utilities.reference_data import reference_data
 
 
 class RankingService:
@@ -35,7 +36,7 @@ class RankingService:
         }
 
     def _static_qualities(self, data: UserData, target: str, case: Dict[str, bool]) -> List[Dict]:
-        qualities = self.db.query(Quality).order_by(Quality.id.asc()).all()
+        qualities = reference_data.get_all(self.db, Quality)
         items: List[Dict] = []
         # Determine allowed_scopes for same_diagnosis
         allow_self_diag = False
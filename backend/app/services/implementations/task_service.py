@@ -4,7 +4,9 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.interfaces.task_service import ITaskService
 from app.models import Task, TaskPriority, TaskStatus, TaskType, User
@@ -13,7 +15,7 @@ from app.utilities.constants import LOGGER_NAME
 
 
 class TaskService(ITaskService):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.logger = logging.getLogger(LOGGER_NAME("task_service"))
 
@@ -24,13 +26,13 @@ class TaskService(ITaskService):
         try:
             # Validate participant exists if provided
             if task.participant_id:
-                participant = self.db.query(User).filter(User.id == task.participant_id).first()
+                participant = await self.db.get(User, task.participant_id)
                 if not participant:
                     raise HTTPException(status_code=404, detail="Participant not found")
 
             # Validate assignee is an admin if provided
             if task.assignee_id:
-                assignee = self.db.query(User).filter(User.id == task.assignee_id, User.role_id == 3).first()
+                assignee = await self.db.scalar(select(User).where(User.id == task.assignee_id, User.role_id == 3))
                 if not assignee:
                     raise HTTPException(status_code=404, detail="Assignee must be an admin user")
 
@@ -45,8 +47,8 @@ class TaskService(ITaskService):
             )
 
             self.db.add(db_task)
-            self.db.commit()
-            self.db.refresh(db_task)
+            await self.db.commit()
+            await self.db.refresh(db_task)
 
             self.logger.info(f"Created task {db_task.id} of type {task.type}")
             return TaskResponse.model_validate(db_task)
@@ -54,7 +56,7 @@ class TaskService(ITaskService):
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error creating task: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -63,14 +65,13 @@ class TaskService(ITaskService):
         Get a task by its ID with eager loading of participant and assignee
         """
         try:
-            task = (
-                self.db.query(Task)
+            task = await self.db.scalar(
+                select(Task)
                 .options(
                     joinedload(Task.participant),
                     joinedload(Task.assignee),
                 )
-                .filter(Task.id == task_id)
-                .first()
+                .where(Task.id == task_id)
             )
             if not task:
                 raise HTTPException(status_code=404, detail="Task not found")
@@ -122,7 +123,7 @@ class TaskService(ITaskService):
         Uses eager loading to fetch participant and assignee data in a single query.
         """
         try:
-            query = self.db.query(Task).options(
+            query = select(Task).options(
                 joinedload(Task.participant),
                 joinedload(Task.assignee),
             )
@@ -130,26 +131,26 @@ class TaskService(ITaskService):
             # Apply filters if provided
             if status:
                 try:
-                    query = query.filter(Task.status == TaskStatus(status))
+                    query = query.where(Task.status == TaskStatus(status))
                 except ValueError:
                     raise HTTPException(status_code=400, detail="Invalid status value")
 
             if priority:
                 try:
-                    query = query.filter(Task.priority == TaskPriority(priority))
+                    query = query.where(Task.priority == TaskPriority(priority))
                 except ValueError:
                     raise HTTPException(status_code=400, detail="Invalid priority value")
 
             if task_type:
                 try:
-                    query = query.filter(Task.type == TaskType(task_type))
+                    query = query.where(Task.type == TaskType(task_type))
                 except ValueError:
                     raise HTTPException(status_code=400, detail="Invalid task type value")
 
             if assignee_id:
-                query = query.filter(Task.assignee_id == assignee_id)
+                query = query.where(Task.assignee_id == assignee_id)
 
-            tasks = query.order_by(Task.created_at.desc()).all()
+            tasks = (await self.db.scalars(query.order_by(Task.created_at.desc()))).all()
 
             # Build TaskResponse with participant and assignee names
             task_responses = []
@@ -197,7 +198,7 @@ class TaskService(ITaskService):
         Update a task
         """
         try:
-            db_task = self.db.query(Task).filter(Task.id == task_id).first()
+            db_task = await self.db.get(Task, task_id)
             if not db_task:
                 raise HTTPException(status_code=404, detail="Task not found")
 
@@ -206,13 +207,15 @@ class TaskService(ITaskService):
 
             # Validate participant if being updated
             if "participant_id" in update_data and update_data["participant_id"]:
-                participant = self.db.query(User).filter(User.id == update_data["participant_id"]).first()
+                participant = await self.db.get(User, update_data["participant_id"])
                 if not participant:
                     raise HTTPException(status_code=404, detail="Participant not found")
 
             # Validate assignee is admin if being updated
             if "assignee_id" in update_data and update_data["assignee_id"]:
-                assignee = self.db.query(User).filter(User.id == update_data["assignee_id"], User.role_id == 3).first()
+                assignee = await self.db.scalar(
+                    select(User).where(User.id == update_data["assignee_id"], User.role_id == 3)
+                )
                 if not assignee:
                     raise HTTPException(status_code=404, detail="Assignee must be an admin user")
 
@@ -229,8 +232,8 @@ class TaskService(ITaskService):
 
             db_task.updated_at = datetime.utcnow()
 
-            self.db.commit()
-            self.db.refresh(db_task)
+            await self.db.commit()
+            await self.db.refresh(db_task)
 
             self.logger.info(f"Updated task {task_id}")
             return TaskResponse.model_validate(db_task)
@@ -240,7 +243,7 @@ class TaskService(ITaskService):
         except ValueError as e:
             raise HTTPException(status_code=400, detail=f"Invalid enum value: {str(e)}")
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error updating task {task_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -249,20 +252,20 @@ class TaskService(ITaskService):
         Assign a task to an admin user
         """
         try:
-            db_task = self.db.query(Task).filter(Task.id == task_id).first()
+            db_task = await self.db.get(Task, task_id)
             if not db_task:
                 raise HTTPException(status_code=404, detail="Task not found")
 
             # Validate assignee is an admin
-            assignee = self.db.query(User).filter(User.id == assignee_id, User.role_id == 3).first()
+            assignee = await self.db.scalar(select(User).where(User.id == assignee_id, User.role_id == 3))
             if not assignee:
                 raise HTTPException(status_code=404, detail="Assignee must be an admin user")
 
             db_task.assignee_id = assignee_id
             db_task.updated_at = datetime.utcnow()
 
-            self.db.commit()
-            self.db.refresh(db_task)
+            await self.db.commit()
+            await self.db.refresh(db_task)
 
             self.logger.info(f"Assigned task {task_id} to admin {assignee_id}")
             return TaskResponse.model_validate(db_task)
@@ -270,7 +273,7 @@ class TaskService(ITaskService):
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error assigning task {task_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -279,7 +282,7 @@ class TaskService(ITaskService):
         Mark a task as completed
         """
         try:
-            db_task = self.db.query(Task).filter(Task.id == task_id).first()
+            db_task = await self.db.get(Task, task_id)
             if not db_task:
                 raise HTTPException(status_code=404, detail="Task not found")
 
@@ -287,8 +290,8 @@ class TaskService(ITaskService):
             db_task.end_date = datetime.utcnow()
             db_task.updated_at = datetime.utcnow()
 
-            self.db.commit()
-            self.db.refresh(db_task)
+            await self.db.commit()
+            await self.db.refresh(db_task)
 
             self.logger.info(f"Completed task {task_id}")
             return TaskResponse.model_validate(db_task)
@@ -296,7 +299,7 @@ class TaskService(ITaskService):
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error completing task {task_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -305,18 +308,18 @@ class TaskService(ITaskService):
         Delete a task
         """
         try:
-            db_task = self.db.query(Task).filter(Task.id == task_id).first()
+            db_task = await self.db.get(Task, task_id)
             if not db_task:
                 raise HTTPException(status_code=404, detail="Task not found")
 
-            self.db.delete(db_task)
-            self.db.commit()
+            await self.db.delete(db_task)
+            await self.db.commit()
 
             self.logger.info(f"Deleted task {task_id}")
 
         except HTTPException:
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error deleting task {task_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -12,7 +12,6 @@ from sqlalchemy.sql import func
 from app.interfaces.user_service import IUserService
 from app.models import (
     AvailabilityTemplate,
-    Experience,
     FormStatus,
     FormSubmission,
     Match,
@@ -22,7 +21,6 @@ from app.models import (
     TaskPriority,
     TaskStatus,
     TaskType,
-    Treatment,
     User,
     UserData,
 )
@@ -39,6 +37,10 @@ from app.schemas.user import (
 )
 from app.schemas.user_data import UserDataUpdateRequest
 from app.utilities.constants import LOGGER_NAME
+from app.utilities.request_metrics import external_call
+from app.utilities.threadpool import in_threadpool
+from app.utilities.user_data_links import REFERENCE_LINKS, replace_links
+from app.utilities.volunteer_index import volunteer_index
 
 
 class UserService(IUserService):
@@ -46,17 +48,20 @@ class UserService(IUserService):
         self.db = db
         self.logger = logging.getLogger(LOGGER_NAME("user_service"))
 
-    async def create_user(self, user: UserCreateRequest) -> UserCreateResponse:
+    @in_threadpool
+    def create_user(self, user: UserCreateRequest) -> UserCreateResponse:
         firebase_user = None
         try:
             if user.signup_method == SignUpMethod.PASSWORD:
-                firebase_user = firebase_admin.auth.create_user(email=user.email, password=user.password)
+                with external_call("firebase", "create_user"):
+                    firebase_user = firebase_admin.auth.create_user(email=user.email, password=user.password)
             ## TO DO: SSO functionality depends a lot on frontend implementation,
             ##   so we may need to update this when we have a better idea of what
             ##   that looks like
             elif user.signup_method == SignUpMethod.GOOGLE:
                 # For signup with Google, Firebase users are automatically created
-                firebase_user = firebase_admin.auth.get_user(user.auth_id)
+                with external_call("firebase", "get_user"):
+                    firebase_user = firebase_admin.auth.get_user(user.auth_id)
 
             role_id = UserRole.to_role_id(user.role)
 
@@ -93,7 +98,8 @@ class UserService(IUserService):
             # Clean up Firebase user if a database exception occurs
             if firebase_user:
                 try:
-                    firebase_admin.auth.delete_user(firebase_user.uid)
+                    with external_call("firebase", "delete_user"):
+                        firebase_admin.auth.delete_user(firebase_user.uid)
                 except firebase_admin.exceptions.FirebaseError as firebase_error:
                     self.logger.error(
                         "Failed to delete Firebase user after database insertion failed"
@@ -107,7 +113,8 @@ class UserService(IUserService):
 
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def delete_user_by_email(self, email: str):
+    @in_threadpool
+    def delete_user_by_email(self, email: str):
         try:
             db_user = self.db.query(User).filter(User.email == email).first()
             if not db_user:
@@ -123,7 +130,8 @@ class UserService(IUserService):
             self.logger.error(f"Error deleting user with email {email}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def delete_user_by_id(self, user_id: str):
+    @in_threadpool
+    def delete_user_by_id(self, user_id: str):
         """
         Delete a user and all related data in the correct order to respect FK constraints.
 
@@ -210,11 +218,13 @@ class UserService(IUserService):
 
             # Commit all database changes
             self.db.commit()
+            volunteer_index.remove_user(db_user.id)
 
             # 12. Delete Firebase user (after successful DB deletion)
             if firebase_auth_id:
                 try:
-                    firebase_admin.auth.delete_user(firebase_auth_id)
+                    with external_call("firebase", "delete_user"):
+                        firebase_admin.auth.delete_user(firebase_auth_id)
                     self.logger.info(f"Successfully deleted Firebase user {firebase_auth_id}")
                 except firebase_admin.exceptions.FirebaseError as firebase_error:
                     # Log error but don't fail - DB deletion already succeeded
@@ -231,7 +241,8 @@ class UserService(IUserService):
             self.logger.error(f"Error deleting user {user_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def soft_delete_user_by_id(self, user_id: str):
+    @in_threadpool
+    def soft_delete_user_by_id(self, user_id: str):
         try:
             db_user = self.db.query(User).filter(User.id == UUID(user_id)).first()
             if not db_user:
@@ -252,6 +263,7 @@ class UserService(IUserService):
             self.db.add(opt_out_task)
 
             self.db.commit()
+            volunteer_index.refresh_user(self.db, db_user.id)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid user ID format")
         except HTTPException:
@@ -261,7 +273,8 @@ class UserService(IUserService):
             self.logger.error(f"Error deactivating user {user_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def reactivate_user_by_id(self, user_id: str):
+    @in_threadpool
+    def reactivate_user_by_id(self, user_id: str):
         try:
             db_user = self.db.query(User).filter(User.id == UUID(user_id)).first()
             if not db_user:
@@ -269,6 +282,7 @@ class UserService(IUserService):
 
             db_user.active = True
             self.db.commit()
+            volunteer_index.refresh_user(self.db, db_user.id)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid user ID format")
         except HTTPException:
@@ -278,7 +292,8 @@ class UserService(IUserService):
             self.logger.error(f"Error reactivating user {user_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def get_user_id_by_auth_id(self, auth_id: str) -> str:
+    @in_threadpool
+    def get_user_id_by_auth_id(self, auth_id: str) -> str:
         """Get user ID for a user by their Firebase auth_id"""
         user = self.db.query(User).filter(User.auth_id == auth_id).first()
         if not user:
@@ -291,7 +306,15 @@ class UserService(IUserService):
             raise ValueError(f"User with email {email} not found")
         return user
 
-    async def get_user_by_id(self, user_id: str) -> UserResponse:
+    def get_user_by_auth_id(self, auth_id: str) -> User:
+        """Get a user and their role by their Firebase auth_id in one query"""
+        user = self.db.query(User).options(joinedload(User.role)).filter(User.auth_id == auth_id).first()
+        if not user:
+            raise ValueError(f"User with auth_id {auth_id} not found")
+        return user
+
+    @in_threadpool
+    def get_user_by_id(self, user_id: str) -> UserResponse:
         try:
             user = (
                 self.db.query(User)
@@ -352,7 +375,8 @@ class UserService(IUserService):
             raise ValueError(f"User with auth_id {auth_id} not found")
         return user.role.name
 
-    async def get_users(self) -> List[UserResponse]:
+    @in_threadpool
+    def get_users(self) -> List[UserResponse]:
         try:
             # Filter users to only include participants and volunteers (role_id 1 and 2)
             users = (
@@ -432,7 +456,8 @@ class UserService(IUserService):
             self.logger.error(f"Error getting users: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def get_admins(self) -> List[UserResponse]:
+    @in_threadpool
+    def get_admins(self) -> List[UserResponse]:
         try:
             # Get only admin users (role_id 3)
             users = (
@@ -473,7 +498,8 @@ class UserService(IUserService):
             self.logger.error(f"Error retrieving admin users: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def update_user_by_id(self, user_id: str, user_update: UserUpdateRequest) -> UserResponse:
+    @in_threadpool
+    def update_user_by_id(self, user_id: str, user_update: UserUpdateRequest) -> UserResponse:
         try:
             db_user = self.db.query(User).filter(User.id == UUID(user_id)).first()
             if not db_user:
@@ -497,6 +523,7 @@ class UserService(IUserService):
 
             self.db.commit()
             self.db.refresh(db_user)
+            volunteer_index.refresh_user(self.db, db_user.id)
 
             # return user with role information and availability
             updated_user = (
@@ -538,7 +565,8 @@ class UserService(IUserService):
             self.logger.error(f"Error updating user {user_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def update_user_data_by_id(self, user_id: str, user_data_update: UserDataUpdateRequest) -> UserResponse:
+    @in_threadpool
+    def update_user_data_by_id(self, user_id: str, user_data_update: UserDataUpdateRequest) -> UserResponse:
         """
         Update user_data fields for a user. Handles partial updates including
         treatments and experiences (many-to-many relationships).
@@ -607,48 +635,14 @@ class UserService(IUserService):
                 except (ValueError, AttributeError):
                     pass  # Invalid language value, skip
 
-            # Handle treatments (many-to-many)
-            if "treatments" in update_data:
-                user_data.treatments.clear()
-                if update_data["treatments"]:
-                    for treatment_name in update_data["treatments"]:
-                        if treatment_name:
-                            treatment = self.db.query(Treatment).filter(Treatment.name == treatment_name).first()
-                            if treatment:
-                                user_data.treatments.append(treatment)
-
-            # Handle experiences (many-to-many)
-            if "experiences" in update_data:
-                user_data.experiences.clear()
-                if update_data["experiences"]:
-                    for experience_name in update_data["experiences"]:
-                        if experience_name:
-                            experience = self.db.query(Experience).filter(Experience.name == experience_name).first()
-                            if experience:
-                                user_data.experiences.append(experience)
-
-            # Handle loved one treatments (many-to-many)
-            if "loved_one_treatments" in update_data:
-                user_data.loved_one_treatments.clear()
-                if update_data["loved_one_treatments"]:
-                    for treatment_name in update_data["loved_one_treatments"]:
-                        if treatment_name:
-                            treatment = self.db.query(Treatment).filter(Treatment.name == treatment_name).first()
-                            if treatment:
-                                user_data.loved_one_treatments.append(treatment)
-
-            # Handle loved one experiences (many-to-many)
-            if "loved_one_experiences" in update_data:
-                user_data.loved_one_experiences.clear()
-                if update_data["loved_one_experiences"]:
-                    for experience_name in update_data["loved_one_experiences"]:
-                        if experience_name:
-                            experience = self.db.query(Experience).filter(Experience.name == experience_name).first()
-                            if experience:
-                                user_data.loved_one_experiences.append(experience)
+            # Handle treatments and experiences (many-to-many): only changed links are written
+            for field in REFERENCE_LINKS:
+                if field in update_data:
+                    replace_links(self.db, user_data, field, update_data[field] or [])
 
             self.db.commit()
             self.db.refresh(db_user)
+            volunteer_index.refresh_user(self.db, db_user.id)
 
             # Return updated user with all relationships loaded
             updated_user = (
@@ -0,0 +1,75 @@
+"""
+Global assignment of participants to volunteers.
+
+Given each participant's scored candidate volunteers and how many more participants each
+volunteer can take, ``solve_assignment`` finds the set of (participant, volunteer) pairs with
+the highest total score, giving each participant at most one volunteer.
+
+The problem is solved as a sparse minimum-cost bipartite matching (SciPy's LAPJVsp): every
+volunteer is expanded into one column per free slot, and every participant gets a private
+"unassigned" column so a full matching always exists. Only the candidate edges passed in are
+considered, so the graph stays sparse for thousands of participants and volunteers.
+"""
+
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+
+def solve_assignment(
+    candidates: Dict[Hashable, List[Tuple[Hashable, float]]],
+    capacities: Dict[Hashable, int],
+) -> Dict[Hashable, Tuple[Hashable, float]]:
+    """
+    Compute a maximum-weight assignment with per-volunteer capacity.
+    :param candidates: Each participant's candidate volunteers with scores; non-positive scores are ignored
+    :param capacities: How many more participants each volunteer can take (missing volunteers take none)
+    :return: Mapping of assigned participant to (volunteer, score); unassigned participants are omitted
+    """
+    participants = list(candidates)
+    # Keep the best score per (participant, volunteer) pair, and only volunteers with free slots
+    edges: Dict[Tuple[int, Hashable], float] = {}
+    for row, participant in enumerate(participants):
+        for volunteer, score in candidates[participant]:
+            if score > 0 and capacities.get(volunteer, 0) > 0:
+                edges[(row, volunteer)] = max(score, edges.get((row, volunteer), 0.0))
+    if not edges:
+        return {}
+
+    volunteers = list(dict.fromkeys(volunteer for _, volunteer in edges))
+    volunteer_index = {volunteer: i for i, volunteer in enumerate(volunteers)}
+    edge_rows = np.fromiter((row for row, _ in edges), dtype=np.int64, count=len(edges))
+    edge_volunteers = np.fromiter((volunteer_index[v] for _, v in edges), dtype=np.int64, count=len(edges))
+    edge_scores = np.fromiter(edges.values(), dtype=np.float64, count=len(edges))
+
+    # A volunteer never needs more slots than participants who could be assigned to them
+    demand = np.bincount(edge_volunteers, minlength=len(volunteers))
+    slots = np.minimum([capacities[v] for v in volunteers], demand)
+    slot_offsets = np.concatenate(([0], np.cumsum(slots)[:-1]))
+    total_slots = int(slots.sum())
+
+    # Expand every candidate edge into one edge per slot of its volunteer
+    repeats = slots[edge_volunteers]
+    slot_rows = np.repeat(edge_rows, repeats)
+    slot_scores = np.repeat(edge_scores, repeats)
+    within_volunteer = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    slot_columns = np.repeat(slot_offsets[edge_volunteers], repeats) + within_volunteer
+
+    # Costs must be positive (zero entries are not edges): cost = base - score, unassigned = base
+    base = float(edge_scores.max()) + 1.0
+    rows = np.concatenate((slot_rows, np.arange(len(participants))))
+    columns = np.concatenate((slot_columns, total_slots + np.arange(len(participants))))
+    costs = np.concatenate((base - slot_scores, np.full(len(participants), base)))
+    graph = csr_matrix((costs, (rows, columns)), shape=(len(participants), total_slots + len(participants)))
+
+    matched_rows, matched_columns = min_weight_full_bipartite_matching(graph)
+
+    assignment = {}
+    for row, column in zip(matched_rows.tolist(), matched_columns.tolist()):
+        if column >= total_slots:
+            continue
+        volunteer = volunteers[int(np.searchsorted(slot_offsets, column, side="right")) - 1]
+        assignment[participants[row]] = (volunteer, edges[(row, volunteer)])
+    return assignment
@@ -0,0 +1,198 @@
+"""
+Connection pool settings and telemetry for the database engines in ``db_utils``.
+
+Pools are configured from the environment:
+
+- ``DB_POOL_SIZE`` (default 5), ``DB_MAX_OVERFLOW`` (default 10): connections kept open, and
+  extra connections allowed under load, per engine and worker process
+- ``DB_POOL_TIMEOUT`` (default 30): seconds a request waits for a free connection
+- ``DB_POOL_RECYCLE`` (default 1800): seconds before a connection is replaced
+- ``DB_POOL_PRE_PING`` (default true): test connections on checkout, so a restarted database or
+  an idle-timeout disconnect costs one retry instead of a failed request
+- ``DB_MAX_CONNECTIONS``: when set and ``DB_POOL_SIZE`` is not, every engine in every one of
+  ``WEB_CONCURRENCY`` worker processes gets an equal share of this connection budget
+- ``DB_PGBOUNCER`` (default false): for a PgBouncer in transaction mode. SQLAlchemy keeps no
+  pool of its own (PgBouncer does the pooling) and asyncpg does not cache prepared statements,
+  which do not survive PgBouncer switching server connections between transactions
+
+Engines built with these settings count checkouts, connection opens and closes, invalidations,
+checkout timeouts and how long checkouts waited for a connection; ``pool_status`` reports
+them with the pool's current occupancy for ``/health/db``.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+# Each worker process has a sync and an async engine
+ENGINES_PER_WORKER = 2
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    pool_size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30
+    recycle: int = 1800
+    pre_ping: bool = True
+    pgbouncer: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        pool_size, max_overflow = cls.pool_size, cls.max_overflow
+        max_connections = os.getenv("DB_MAX_CONNECTIONS")
+        if max_connections and not os.getenv("DB_POOL_SIZE"):
+            # Split the budget evenly; half kept open, half as overflow
+            workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+            budget = max(1, int(max_connections) // (workers * ENGINES_PER_WORKER))
+            pool_size = max(1, budget // 2)
+            max_overflow = budget - pool_size
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", max_overflow)),
+            timeout=float(os.getenv("DB_POOL_TIMEOUT", cls.timeout)),
+            recycle=int(os.getenv("DB_POOL_RECYCLE", cls.recycle)),
+            pre_ping=_env_bool("DB_POOL_PRE_PING", cls.pre_ping),
+            pgbouncer=_env_bool("DB_PGBOUNCER", cls.pgbouncer),
+        )
+
+    def engine_kwargs(self, is_async: bool = False) -> Dict[str, Any]:
+        """Keyword arguments for ``create_engine``/``create_async_engine``."""
+        if self.pgbouncer:
+            kwargs: Dict[str, Any] = {"poolclass": NullPool}
+            if is_async:
+                kwargs["connect_args"] = {
+                    "statement_cache_size": 0,
+                    "prepared_statement_cache_size": 0,
+                    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+                }
+            return kwargs
+        return {
+            "poolclass": InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.timeout,
+            "pool_recycle": self.recycle,
+            "pool_pre_ping": self.pre_ping,
+        }
+
+
+class PoolStats:
+    """Counters for one engine's pool, plus checkout wait times over a recent window."""
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._recent_waits: deque = deque(maxlen=window)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self._recent_waits.append(seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent_waits)
+            waits = len(recent)
+            return {
+                "checkouts": self.checkouts,
+                # Connections opened and closed since startup; steady growth means the pool is churning
+                "connections_opened": self.connects,
+                "connections_closed": self.disconnects,
+                "invalidations": self.invalidations,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_ms": {
+                    "mean": round(1000 * sum(recent) / waits, 3) if waits else 0.0,
+                    "p95": round(1000 * recent[min(waits - 1, int(0.95 * waits))], 3) if waits else 0.0,
+                    "max": round(1000 * self.wait_seconds_max, 3),
+                    "total": round(1000 * self.wait_seconds_total, 3),
+                },
+            }
+
+
+class _TimedCheckout:
+    """Times how long each checkout waits for a connection (including opening a new one)."""
+
+    stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.stats is not None:
+                self.stats.record_wait(time.perf_counter() - started, timed_out)
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine) -> PoolStats:
+    """Attach a PoolStats to an engine's pool (sync engine, or an AsyncEngine's ``sync_engine``)."""
+    engine = getattr(engine, "sync_engine", engine)
+    stats = PoolStats()
+    engine.pool.stats = stats
+    event.listen(engine, "checkout", lambda *args: stats.increment("checkouts"))
+    event.listen(engine, "connect", lambda *args: stats.increment("connects"))
+    event.listen(engine, "close", lambda *args: stats.increment("disconnects"))
+    event.listen(engine, "close_detached", lambda *args: stats.increment("disconnects"))
+    event.listen(engine, "invalidate", lambda *args: stats.increment("invalidations"))
+    return stats
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Current occupancy and lifetime counters of an engine's pool."""
+    pool = getattr(engine, "sync_engine", engine).pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # Negative while fewer than pool_size connections have been opened
+            overflow=pool.overflow(),
+        )
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(stats.snapshot())
+    return status
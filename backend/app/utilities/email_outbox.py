@@ -0,0 +1,81 @@
+"""
+Transactional email outbox.
+
+``OutboxEmailService`` has the same ``send_*`` methods as ``SESEmailService``, but instead of
+calling SES it adds an ``EmailOutbox`` row to the caller's session. The email is therefore only
+sent if the transaction that changed the state it announces commits, and the request does not
+wait on SES. ``EmailOutboxDispatcher`` sends the rows in the background.
+
+Each row has an idempotency key made of an ``event_key``, the template and the recipient; a key
+that is already in the outbox is not enqueued again. The event key names the event and the entity
+it happened to (e.g. ``f"match-{match.id}-scheduled-{match.chosen_time_block_id}"``), so
+replaying the same event, e.g. a retried request, does not send a second email, while a new event
+gets a new key.
+
+Callers enqueue inside ``db.begin_nested()``, so an email that fails to enqueue rolls back to the
+savepoint and leaves the caller's transaction usable for the state change it is committing.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence, Set
+
+from sqlalchemy.orm import Session
+
+from app.models import EmailOutbox
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.ses_email_service import BulkSendResult, SESEmailService, TemplatedEmail
+
+
+class OutboxEmailService(SESEmailService):
+    def __init__(self, db: Session, event_key: str):
+        if not event_key:
+            raise ValueError("OutboxEmailService needs an event_key to build idempotency keys")
+        self.db = db
+        self.event_key = event_key
+        # Keys added to the session but possibly not flushed yet
+        self._enqueued_keys: Set[str] = set()
+        super().__init__()
+        self.logger = logging.getLogger(LOGGER_NAME("email_outbox"))
+
+    def _create_client(self):
+        # Rows are sent by the dispatcher, which has its own client
+        return None
+
+    def send_templated_email(
+        self, to_email: str, template_name: str, template_data: Dict[str, Any], source_email: str = None
+    ) -> bool:
+        """
+        Add the email to the outbox in the caller's transaction; it is sent after the commit.
+
+        Returns:
+            bool: True if the email was enqueued or already in the outbox
+        """
+        idempotency_key = f"{self.event_key}:{template_name}:{to_email}"
+        if idempotency_key in self._enqueued_keys or (
+            self.db.query(EmailOutbox.id).filter(EmailOutbox.idempotency_key == idempotency_key).first()
+        ):
+            self.logger.info(f"Email {idempotency_key} is already in the outbox")
+            return True
+
+        self.db.add(
+            EmailOutbox(
+                idempotency_key=idempotency_key,
+                to_email=to_email,
+                source_email=source_email if source_email else self.source_email,
+                template_name=template_name,
+                template_data=template_data,
+            )
+        )
+        self._enqueued_keys.add(idempotency_key)
+        return True
+
+    def send_bulk_templated_emails(self, emails: Sequence[TemplatedEmail]) -> List[BulkSendResult]:
+        """
+        Add every email to the outbox; the dispatcher sends them in bulk after the commit.
+
+        Returns:
+            List[BulkSendResult]: One result per email, without a message_id since nothing is sent yet
+        """
+        for email in emails:
+            self.send_templated_email(email.to_email, email.template_name, email.template_data, email.source_email)
+        return [BulkSendResult(email) for email in emails]
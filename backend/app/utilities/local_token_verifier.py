@@ -0,0 +1,242 @@
+"""
+Local verification of Firebase ID tokens.
+
+Firebase ID tokens are RS256 JWTs signed with Google's rotating ``securetoken`` keys. With
+``AUTH_TOKEN_VERIFICATION=local`` the token cache verifies them in-process instead of calling the
+Firebase admin API. Signatures are checked against Google's published certificates, which are
+cached for as long as their ``Cache-Control: max-age`` allows and refreshed in the background
+by the server's scheduler. Claims are validated the same way ``firebase_admin.auth.verify_id_token``
+validates them, and the same firebase_admin errors are raised.
+
+Revocation is checked against ``revoked_uids``, a record of when each user's tokens were revoked,
+rather than by a call per request. ``AuthService.revoke_tokens`` adds to it and to the
+``token_revocations`` table, and every process reloads that table at startup and every
+``AUTH_REVOCATION_REFRESH_SECONDS`` (default 10), so a revocation made by any worker or container
+applies everywhere within that time and survives restarts. ``email_verified`` is read from the
+token's own claim.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.request
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import firebase_admin
+import firebase_admin.auth
+import jwt
+from cryptography import x509
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import TokenRevocation
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.db_utils import SessionLocal
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+ISSUER_PREFIX = "https://securetoken.google.com/"
+# Firebase ID tokens expire an hour after they are issued, so older revocations no longer matter
+MAX_TOKEN_LIFETIME_SECONDS = 3600
+
+# Fetches {key id: PEM certificate} and how many seconds the response may be cached for
+CertFetcher = Callable[[], Tuple[Dict[str, str], float]]
+
+
+def fetch_google_certs() -> Tuple[Dict[str, str], float]:
+    """Download Google's current ID token signing certificates."""
+    # urlopen raises HTTPError for non-2xx responses
+    with urllib.request.urlopen(GOOGLE_CERTS_URL, timeout=5) as response:
+        certs = json.loads(response.read().decode("utf-8"))
+        match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+    return certs, float(match.group(1)) if match else 0.0
+
+
+def _load_public_key(pem: str) -> RSAPublicKey:
+    if "BEGIN CERTIFICATE" in pem:
+        return x509.load_pem_x509_certificate(pem.encode()).public_key()
+    return load_pem_public_key(pem.encode())
+
+
+class GooglePublicKeys:
+    def __init__(self, fetch: CertFetcher = fetch_google_certs, min_refresh_seconds: float = 60):
+        self.fetch = fetch
+        # Unknown key ids trigger a refresh at most this often, so bad tokens cannot force a fetch each
+        self.min_refresh_seconds = min_refresh_seconds
+        self.logger = logging.getLogger(LOGGER_NAME("local_token_verifier"))
+        self._lock = threading.Lock()
+        self._keys: Dict[str, RSAPublicKey] = {}
+        self._expires_at = 0.0
+        self._refreshed_at: Optional[float] = None
+
+    def get(self, kid: Optional[str]) -> Optional[RSAPublicKey]:
+        """Public key for a key id, refreshing the certificates if they expired or the id is new."""
+        with self._lock:
+            if time.monotonic() >= self._expires_at:
+                self._refresh()
+            key = self._keys.get(kid)
+            if key is None and time.monotonic() - (self._refreshed_at or 0.0) > self.min_refresh_seconds:
+                self._refresh()
+                key = self._keys.get(kid)
+            return key
+
+    def refresh(self) -> None:
+        """Re-download the certificates (scheduled ahead of their expiry)."""
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        self._refreshed_at = time.monotonic()
+        try:
+            certs, max_age = self.fetch()
+            self._keys = {kid: _load_public_key(pem) for kid, pem in certs.items()}
+            self._expires_at = self._refreshed_at + max_age
+            self.logger.info(f"Loaded {len(self._keys)} Google ID token signing keys")
+        except Exception as e:
+            if not self._keys:
+                raise firebase_admin.auth.CertificateFetchError(f"Failed to fetch public key certificates: {e}", e)
+            # Keep verifying with the keys we have; Google publishes new keys well before using them
+            self.logger.error(f"Failed to refresh Google signing keys, keeping {len(self._keys)} cached: {str(e)}")
+            self._expires_at = self._refreshed_at + self.min_refresh_seconds
+
+
+class RevokedUids:
+    """
+    When each user's tokens were last revoked, as epoch seconds; older tokens are rejected.
+    With a ``session_factory`` revocations are also stored in ``token_revocations``, and ``refresh``
+    reloads the ones recorded by other processes.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        self.session_factory = session_factory
+        self.logger = logging.getLogger(LOGGER_NAME("local_token_verifier"))
+        self._lock = threading.Lock()
+        self._revoked_at: Dict[str, int] = {}
+
+    def revoke(self, uid: str, revoked_at: Optional[int] = None) -> None:
+        # Whole seconds, like Firebase's tokensValidAfterTime: tokens issued in that second stay valid
+        revoked_at = int(revoked_at if revoked_at is not None else time.time())
+        if self.session_factory is not None:
+            revoked_at_time = datetime.fromtimestamp(revoked_at, timezone.utc)
+            upsert = insert(TokenRevocation).values(auth_id=uid, revoked_at=revoked_at_time)
+            with self.session_factory() as db:
+                db.execute(
+                    upsert.on_conflict_do_update(
+                        index_elements=[TokenRevocation.auth_id],
+                        set_={"revoked_at": func.greatest(TokenRevocation.revoked_at, upsert.excluded.revoked_at)},
+                    )
+                )
+                db.commit()
+        with self._lock:
+            self._revoked_at[uid] = max(revoked_at, self._revoked_at.get(uid, 0))
+
+    def refresh(self) -> None:
+        """
+        Reload the revocations recorded by every process, deleting the ones older than any token
+        that could still be valid. Called at startup and periodically by the scheduler.
+        """
+        if self.session_factory is None:
+            return
+        cutoff = int(time.time()) - MAX_TOKEN_LIFETIME_SECONDS
+        cutoff_time = datetime.fromtimestamp(cutoff, timezone.utc)
+        with self.session_factory() as db:
+            db.execute(delete(TokenRevocation).where(TokenRevocation.revoked_at < cutoff_time))
+            rows = db.execute(select(TokenRevocation.auth_id, TokenRevocation.revoked_at)).all()
+            db.commit()
+        with self._lock:
+            # Keep revocations made here since the query, in case they were not committed yet
+            revoked_at = {uid: at for uid, at in self._revoked_at.items() if at >= cutoff}
+            for uid, at in rows:
+                revoked_at[uid] = max(int(at.timestamp()), revoked_at.get(uid, 0))
+            self._revoked_at = revoked_at
+
+    def is_revoked(self, uid: str, issued_at: float) -> bool:
+        with self._lock:
+            revoked_at = self._revoked_at.get(uid)
+        return revoked_at is not None and issued_at < revoked_at
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked_at.clear()
+
+
+class LocalTokenVerifier:
+    def __init__(
+        self,
+        keys: GooglePublicKeys,
+        revoked: RevokedUids,
+        project_id: Optional[str] = None,
+        clock_skew_seconds: int = 0,
+    ):
+        self.keys = keys
+        self.revoked = revoked
+        self._project_id = project_id
+        self.clock_skew_seconds = clock_skew_seconds
+
+    @property
+    def project_id(self) -> str:
+        # Firebase may be initialized after this module is imported, so resolve the project lazily
+        project_id = self._project_id or firebase_admin.get_app().project_id
+        if not project_id:
+            raise ValueError("A Firebase project id is required to verify ID tokens locally")
+        return project_id
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verify an ID token's signature and claims without calling Firebase.
+        :return: The decoded claims, with ``uid`` set like ``verify_id_token`` does
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as e:
+            raise firebase_admin.auth.InvalidIdTokenError(f"Malformed ID token: {e}", cause=e)
+        if header.get("alg") != "RS256":
+            raise firebase_admin.auth.InvalidIdTokenError("ID token has incorrect algorithm")
+        key = self.keys.get(header.get("kid"))
+        if key is None:
+            raise firebase_admin.auth.InvalidIdTokenError("ID token has no valid key id")
+
+        project_id = self.project_id
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                audience=project_id,
+                issuer=ISSUER_PREFIX + project_id,
+                leeway=self.clock_skew_seconds,
+                options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise firebase_admin.auth.ExpiredIdTokenError("Token expired", cause=e)
+        except jwt.PyJWTError as e:
+            raise firebase_admin.auth.InvalidIdTokenError(f"Invalid ID token: {e}", cause=e)
+
+        subject = claims["sub"]
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise firebase_admin.auth.InvalidIdTokenError("ID token has an invalid subject")
+        if claims.get("auth_time", 0) > time.time() + self.clock_skew_seconds:
+            raise firebase_admin.auth.InvalidIdTokenError("ID token has an auth_time in the future")
+        if self.revoked.is_revoked(subject, claims["iat"]):
+            raise firebase_admin.auth.RevokedIdTokenError("The Firebase ID token has been revoked.")
+
+        claims["uid"] = subject
+        return claims
+
+
+google_public_keys = GooglePublicKeys()
+revoked_uids = RevokedUids(session_factory=SessionLocal)
+
+local_token_verifier: Optional[LocalTokenVerifier] = None
+if os.getenv("AUTH_TOKEN_VERIFICATION", "firebase") == "local":
+    local_token_verifier = LocalTokenVerifier(
+        keys=google_public_keys,
+        revoked=revoked_uids,
+        project_id=os.getenv("FIREBASE_PROJECT_ID"),
+    )
@@ -0,0 +1,463 @@
+"""
+Vectorized candidate scoring for the matching service.
+
+A ``CandidatePool`` turns a list of volunteers into column arrays once (string codes for
+gender, diagnosis, marital status and kids, numeric ages, and bitmasks for ethnic groups,
+treatments and experiences). A participant's ranked preferences are then scored against
+every candidate in a single NumPy pass.
+
+Scores are identical to ``MatchingService._calculate_match_score``, which remains the
+reference implementation of the matching rules.
+
+For batch matching, ``ParticipantProfile`` and ``detach_preferences`` give picklable copies of
+a participant and their preferences so ``rank_batch`` can also run in worker processes. Pools are
+pickled once (``pickle_pool``) and each long-lived worker unpickles a pool only the first time it
+sees it (``rank_batch_in_worker``).
+"""
+
+import heapq
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import date
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+
+import numpy as np
+
+# Code reserved for a missing (None) string value. Two missing values compare equal,
+# matching the `participant_value == volunteer_value` fallback in the reference scorer.
+_NONE_CODE = 0
+# Code for a participant value that no candidate has; it never matches.
+_UNKNOWN_CODE = -1
+
+# Quality slugs compared by case-insensitive string equality, keyed by scope
+_STRING_QUALITY_ATTRIBUTES = {
+    "self": {
+        "same_gender_identity": "gender_identity",
+        "same_diagnosis": "diagnosis",
+        "same_marital_status": "marital_status",
+        "same_parental_status": "has_kids",
+    },
+    "loved_one": {
+        "same_gender_identity": "loved_one_gender_identity",
+        "same_diagnosis": "loved_one_diagnosis",
+    },
+}
+
+# Qualities a volunteer's loved one has no value for (treated as None, not as unsupported)
+_VOLUNTEER_LOVED_ONE_NULL_QUALITIES = {"same_marital_status", "same_parental_status"}
+
+_STRING_ATTRIBUTES = (
+    "gender_identity",
+    "diagnosis",
+    "marital_status",
+    "has_kids",
+    "loved_one_gender_identity",
+    "loved_one_diagnosis",
+)
+
+
+def _is_yes(value: Optional[str]) -> bool:
+    return (value or "").lower() == "yes"
+
+
+def _normalize_string(value: Any) -> Any:
+    """Normalize a string for comparison; non-string values are compared as-is."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+
+def _normalize_groups(value: Any) -> FrozenSet[str]:
+    """Normalize an ethnic group value (list or scalar) into a set of comparable strings."""
+    if not value:
+        return frozenset()
+    groups = value if isinstance(value, list) else [value]
+    return frozenset(str(g).strip().lower() for g in groups if g)
+
+
+def _parse_age(value: Any) -> Optional[int]:
+    """Parse an age the way `_check_age_similarity` does; None when it would score 0."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class CandidateFeatures:
+    """Compact, normalized matching features for a single volunteer."""
+
+    user_id: Optional[UUID]
+    gender_identity: Any
+    diagnosis: Any
+    marital_status: Any
+    has_kids: Any
+    loved_one_gender_identity: Any
+    loved_one_diagnosis: Any
+    birth_year: Optional[int]
+    loved_one_age: Optional[int]
+    ethnic_groups: FrozenSet[str]
+    treatments: FrozenSet[str]
+    experiences: FrozenSet[str]
+    loved_one_treatments: FrozenSet[str]
+    loved_one_experiences: FrozenSet[str]
+    is_patient: bool
+    is_caregiver: bool
+
+    @property
+    def volunteer_type(self) -> str:
+        """Volunteer type used to segment the pool: "patient", "caregiver" or "other"."""
+        if self.is_caregiver:
+            return "caregiver"
+        if self.is_patient:
+            return "patient"
+        return "other"
+
+    @classmethod
+    def from_user_data(cls, user_data) -> "CandidateFeatures":
+        """Extract features from a UserData row (loads its treatment/experience relationships)."""
+        is_caregiver = _is_yes(user_data.caring_for_someone)
+        return cls(
+            user_id=user_data.user_id,
+            gender_identity=_normalize_string(user_data.gender_identity),
+            diagnosis=_normalize_string(user_data.diagnosis),
+            marital_status=_normalize_string(user_data.marital_status),
+            has_kids=_normalize_string(user_data.has_kids),
+            loved_one_gender_identity=_normalize_string(user_data.loved_one_gender_identity),
+            loved_one_diagnosis=_normalize_string(user_data.loved_one_diagnosis),
+            birth_year=user_data.date_of_birth.year if user_data.date_of_birth else None,
+            loved_one_age=_parse_age(user_data.loved_one_age),
+            ethnic_groups=_normalize_groups(user_data.ethnic_group),
+            treatments=frozenset(t.name for t in user_data.treatments),
+            experiences=frozenset(e.name for e in user_data.experiences),
+            loved_one_treatments=frozenset(t.name for t in user_data.loved_one_treatments),
+            loved_one_experiences=frozenset(e.name for e in user_data.loved_one_experiences),
+            is_patient=_is_yes(user_data.has_blood_cancer) and not is_caregiver,
+            is_caregiver=is_caregiver,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ParticipantProfile:
+    """Picklable copy of the participant fields read by ``CandidatePool.score``."""
+
+    has_blood_cancer: Optional[str]
+    caring_for_someone: Optional[str]
+    gender_identity: Any
+    diagnosis: Any
+    marital_status: Any
+    has_kids: Any
+    date_of_birth: Optional[date]
+    ethnic_group: Any
+    loved_one_gender_identity: Any
+    loved_one_diagnosis: Any
+    loved_one_age: Any
+
+    @classmethod
+    def from_user_data(cls, user_data) -> "ParticipantProfile":
+        return cls(**{field.name: getattr(user_data, field.name) for field in fields(cls)})
+
+
+@dataclass(frozen=True, slots=True)
+class PreferenceTarget:
+    """Picklable stand-in for the Quality, Treatment or Experience a preference points at."""
+
+    slug: Optional[str] = None
+    name: Optional[str] = None
+
+
+def detach_preferences(preferences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy preferences with their ORM `object` replaced by a ``PreferenceTarget``."""
+    return [
+        {
+            **pref,
+            "object": PreferenceTarget(
+                slug=getattr(pref["object"], "slug", None), name=getattr(pref["object"], "name", None)
+            ),
+        }
+        for pref in preferences
+    ]
+
+
+def _build_bitmasks(item_sets: Sequence[Iterable[str]], vocabulary: Dict[str, int]) -> np.ndarray:
+    """Pack each candidate's item set into uint64 words, growing `vocabulary` as needed."""
+    for items in item_sets:
+        for item in items:
+            vocabulary.setdefault(item, len(vocabulary))
+    word_count = max(1, (len(vocabulary) + 63) // 64)
+    masks = np.zeros((len(item_sets), word_count), dtype=np.uint64)
+    for row, items in enumerate(item_sets):
+        for item in items:
+            bit = vocabulary[item]
+            masks[row, bit >> 6] |= np.uint64(1) << np.uint64(bit & 63)
+    return masks
+
+
+def _query_mask(items: Iterable[str], vocabulary: Dict[str, int], word_count: int) -> np.ndarray:
+    mask = np.zeros(word_count, dtype=np.uint64)
+    for item in items:
+        bit = vocabulary.get(item)
+        if bit is not None:
+            mask[bit >> 6] |= np.uint64(1) << np.uint64(bit & 63)
+    return mask
+
+
+def _age_similarity(participant_age: Optional[int], volunteer_ages: np.ndarray) -> np.ndarray:
+    """Vectorized `_check_age_similarity`; NaN marks a volunteer age that scores 0."""
+    if not participant_age or participant_age <= 0:
+        return np.zeros(len(volunteer_ages))
+    valid = ~np.isnan(volunteer_ages) & (volunteer_ages != 0)
+    similarity = np.clip(1.0 - np.abs(participant_age - volunteer_ages) / participant_age, 0.0, 1.0)
+    return np.where(valid, similarity, 0.0)
+
+
+def eligible_volunteer_type(participant_data, preferences: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Return the volunteer type a participant can be matched with ("patient" or "caregiver"),
+    following the case selection in `_calculate_match_score`; None when no case applies.
+    """
+    has_patient_prefs = any(p["target_role"] == "patient" for p in preferences)
+    has_caregiver_prefs = any(p["target_role"] == "caregiver" for p in preferences)
+
+    is_caregiver = _is_yes(participant_data.caring_for_someone)
+    wants_patient = _is_yes(participant_data.has_blood_cancer) and not is_caregiver
+
+    # Cases 1 & 2: patient or caregiver participant wants a patient volunteer
+    if has_patient_prefs and (wants_patient or is_caregiver):
+        return "patient"
+    # Case 3: caregiver participant wants a caregiver volunteer
+    if has_caregiver_prefs and is_caregiver:
+        return "caregiver"
+    return None
+
+
+class CandidatePool:
+    """Column-oriented view of a volunteer pool, scored against one participant at a time."""
+
+    def __init__(self, candidates: Sequence[CandidateFeatures]):
+        self.candidates: List[CandidateFeatures] = list(candidates)
+        self.size = len(self.candidates)
+
+        # String attributes share one vocabulary of normalized values
+        self._string_vocabulary: Dict[Any, int] = {None: _NONE_CODE}
+        self._string_codes: Dict[str, np.ndarray] = {}
+        for attribute in _STRING_ATTRIBUTES:
+            codes = np.empty(self.size, dtype=np.int32)
+            for row, candidate in enumerate(self.candidates):
+                value = getattr(candidate, attribute)
+                codes[row] = self._string_vocabulary.setdefault(value, len(self._string_vocabulary))
+            self._string_codes[attribute] = codes
+
+        self._birth_years = np.array(
+            [c.birth_year if c.birth_year is not None else np.nan for c in self.candidates], dtype=np.float64
+        )
+        self._loved_one_ages = np.array(
+            [c.loved_one_age if c.loved_one_age is not None else np.nan for c in self.candidates], dtype=np.float64
+        )
+
+        self._ethnic_vocabulary: Dict[str, int] = {}
+        self._ethnic_masks = _build_bitmasks([c.ethnic_groups for c in self.candidates], self._ethnic_vocabulary)
+
+        # Self and loved-one sets share a vocabulary so one query mask serves both scopes
+        self._treatment_vocabulary: Dict[str, int] = {}
+        self._treatment_masks = {
+            "self": _build_bitmasks([c.treatments for c in self.candidates], self._treatment_vocabulary),
+            "loved_one": _build_bitmasks([c.loved_one_treatments for c in self.candidates], self._treatment_vocabulary),
+        }
+        self._experience_vocabulary: Dict[str, int] = {}
+        self._experience_masks = {
+            "self": _build_bitmasks([c.experiences for c in self.candidates], self._experience_vocabulary),
+            "loved_one": _build_bitmasks(
+                [c.loved_one_experiences for c in self.candidates], self._experience_vocabulary
+            ),
+        }
+
+        self._is_patient = np.array([c.is_patient for c in self.candidates], dtype=bool)
+        self._is_caregiver = np.array([c.is_caregiver for c in self.candidates], dtype=bool)
+        # (token, bytes) from `pickle_pool`
+        self._pickled: Optional[Tuple[str, bytes]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {**self.__dict__, "_pickled": None}
+
+    def score(self, participant_data, preferences: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Score every candidate for a participant.
+        :param participant_data: The participant's UserData (only scalar columns are read)
+        :param preferences: Ranked preferences as returned by `MatchingService._get_user_preferences`
+        :return: Array of scores in [0.0, 1.0], aligned with `self.candidates`
+        """
+        target_type = eligible_volunteer_type(participant_data, preferences)
+        if target_type == "patient":
+            eligible, volunteer_scope_override = self._is_patient, "self"
+        elif target_type == "caregiver":
+            eligible, volunteer_scope_override = self._is_caregiver, None
+        else:
+            return np.zeros(self.size)
+        case_prefs = [p for p in preferences if p["target_role"] == target_type]
+
+        current_year = date.today().year
+        total_score = np.zeros(self.size)
+        max_possible_score = 0.0
+        for pref in case_prefs:
+            weight = 1.0 / pref["rank"]
+            participant_scope = pref.get("scope", "self")
+            volunteer_scope = volunteer_scope_override if volunteer_scope_override is not None else participant_scope
+            total_score += weight * self._match_column(
+                participant_data, pref, participant_scope, volunteer_scope, current_year
+            )
+            max_possible_score += weight
+
+        if max_possible_score <= 0:
+            return np.zeros(self.size)
+        return np.where(eligible, total_score / max_possible_score, 0.0)
+
+    def _match_column(
+        self,
+        participant_data,
+        preference: Dict[str, Any],
+        participant_scope: str,
+        volunteer_scope: str,
+        current_year: int,
+    ) -> np.ndarray:
+        obj = preference["object"]
+        kind = preference["kind"]
+
+        if kind == "quality":
+            return self._quality_column(participant_data, obj.slug, participant_scope, volunteer_scope, current_year)
+        elif kind == "treatment":
+            return self._membership_column(
+                obj.name, self._treatment_vocabulary, self._treatment_masks.get(volunteer_scope)
+            )
+        elif kind == "experience":
+            return self._membership_column(
+                obj.name, self._experience_vocabulary, self._experience_masks.get(volunteer_scope)
+            )
+
+        return np.zeros(self.size)
+
+    def _membership_column(self, name: str, vocabulary: Dict[str, int], masks: Optional[np.ndarray]) -> np.ndarray:
+        if masks is None or name not in vocabulary:
+            return np.zeros(self.size)
+        bit = vocabulary[name]
+        word = masks[:, bit >> 6]
+        return ((word >> np.uint64(bit & 63)) & np.uint64(1)).astype(np.float64)
+
+    def _quality_column(
+        self,
+        participant_data,
+        quality_slug: str,
+        participant_scope: str,
+        volunteer_scope: str,
+        current_year: int,
+    ) -> np.ndarray:
+        zeros = np.zeros(self.size)
+
+        if quality_slug == "same_age":
+            if participant_scope == "self":
+                dob = participant_data.date_of_birth
+                participant_age = current_year - dob.year if dob else None
+            elif participant_scope == "loved_one":
+                participant_age = _parse_age(participant_data.loved_one_age)
+            else:
+                return zeros
+
+            if volunteer_scope == "self":
+                volunteer_ages = current_year - self._birth_years
+            elif volunteer_scope == "loved_one":
+                volunteer_ages = self._loved_one_ages
+            else:
+                return zeros
+            return _age_similarity(participant_age, volunteer_ages)
+
+        if quality_slug == "same_ethnic_or_cultural_group":
+            if participant_scope != "self" or volunteer_scope != "self":
+                return zeros
+            participant_groups = _normalize_groups(participant_data.ethnic_group)
+            if not participant_groups:
+                return zeros
+            query = _query_mask(participant_groups, self._ethnic_vocabulary, self._ethnic_masks.shape[1])
+            return np.any((self._ethnic_masks & query) != 0, axis=1).astype(np.float64)
+
+        participant_attribute = _STRING_QUALITY_ATTRIBUTES.get(participant_scope, {}).get(quality_slug)
+        if participant_attribute is None:
+            return zeros
+
+        if volunteer_scope == "loved_one" and quality_slug in _VOLUNTEER_LOVED_ONE_NULL_QUALITIES:
+            volunteer_codes = np.full(self.size, _NONE_CODE, dtype=np.int32)
+        else:
+            volunteer_attribute = _STRING_QUALITY_ATTRIBUTES.get(volunteer_scope, {}).get(quality_slug)
+            if volunteer_attribute is None:
+                return zeros
+            volunteer_codes = self._string_codes[volunteer_attribute]
+
+        participant_value = _normalize_string(getattr(participant_data, participant_attribute))
+        participant_code = self._string_vocabulary.get(participant_value, _UNKNOWN_CODE)
+        return (volunteer_codes == participant_code).astype(np.float64)
+
+
+def rank_candidates(
+    pool: CandidatePool,
+    participant_data,
+    preferences: List[Dict[str, Any]],
+    limit: int,
+    min_score: Optional[float] = None,
+) -> List[Tuple[int, float]]:
+    """
+    Select a participant's top candidates from a pool.
+    :param min_score: Only keep candidates whose score (0-100 scale) is at or above this value
+    :return: Up to `limit` (candidate index, score) pairs, highest score first, ties by user id
+    """
+    scores = pool.score(participant_data, preferences)
+    indices = range(pool.size) if min_score is None else np.flatnonzero(scores * 100 >= min_score)
+    top = heapq.nsmallest(limit, indices, key=lambda i: (-scores[i], str(pool.candidates[i].user_id)))
+    return [(int(i), float(scores[i])) for i in top]
+
+
+# A batch job: (participant id, pool key, participant, preferences)
+BatchJob = Tuple[Any, Hashable, Any, List[Dict[str, Any]]]
+
+# Pools a worker process keeps unpickled between batches, keyed by `pickle_pool` token, least recently used first
+WORKER_POOL_CACHE_SIZE = 16
+_worker_pools: "OrderedDict[str, CandidatePool]" = OrderedDict()
+
+
+def rank_batch(
+    pools: Dict[Hashable, CandidatePool], jobs: List[BatchJob], limit: int, min_score: Optional[float] = None
+) -> List[Tuple[Any, List[Tuple[int, float]]]]:
+    """Rank candidates for each job against the pool its key points at."""
+    return [
+        (participant_id, rank_candidates(pools[key], participant, preferences, limit, min_score))
+        for participant_id, key, participant, preferences in jobs
+    ]
+
+
+def pickle_pool(pool: CandidatePool) -> Tuple[str, bytes]:
+    """
+    A pool pickled for worker processes, with a token naming it. Pools do not change once built, so
+    this is computed once per pool and reused by every later batch.
+    """
+    if pool._pickled is None:
+        pool._pickled = (uuid4().hex, pickle.dumps(pool))
+    return pool._pickled
+
+
+def rank_batch_in_worker(
+    pools: Dict[Hashable, Tuple[str, bytes]], jobs: List[BatchJob], limit: int, min_score: Optional[float] = None
+) -> List[Tuple[Any, List[Tuple[int, float]]]]:
+    """`rank_batch` in a worker process, against pools from `pickle_pool`, each unpickled once per worker."""
+    resolved = {}
+    for key, (token, payload) in pools.items():
+        if token not in _worker_pools:
+            _worker_pools[token] = pickle.loads(payload)
+            if len(_worker_pools) > WORKER_POOL_CACHE_SIZE:
+                _worker_pools.popitem(last=False)
+        _worker_pools.move_to_end(token)
+        resolved[key] = _worker_pools[token]
+    return rank_batch(resolved, jobs, limit, min_score)
@@ -0,0 +1,154 @@
+"""
+Database migrations outside the request-serving startup path.
+
+Migrations run once per deploy with ``python -m app.utilities.migrations`` (``pdm run migrate``).
+Concurrent runs take a Postgres advisory lock, so only one of them applies migrations; the others
+wait and then find the schema already at the head revision. Server processes only check that the
+database is at the head revision, which reads the revision files and ``alembic_version`` without
+loading the Alembic environment.
+
+Waiters poll ``pg_try_advisory_lock`` on an autocommit connection instead of blocking in
+``pg_advisory_lock``: a blocked statement holds a snapshot, and ``CREATE INDEX CONCURRENTLY`` in
+the running migrations waits for every older snapshot, so the two would wait on each other forever.
+The lock is held by the session, so ``migrate`` needs a direct connection to Postgres, not one
+through PgBouncer in transaction mode (``DB_PGBOUNCER``), which could leave the lock held.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Optional, Set
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app import models
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.db_pool import PoolSettings
+from app.utilities.db_utils import engine as default_engine
+
+# Key of the Postgres advisory lock held while migrating (any constant shared by every process)
+MIGRATION_LOCK_KEY = 4_715_520_931
+# Seconds between attempts to take the lock while another process migrates
+MIGRATION_LOCK_POLL_SECONDS = 1.0
+
+log = logging.getLogger(LOGGER_NAME("migrations"))
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def head_revisions(alembic_cfg: Optional[Config] = None) -> Set[str]:
+    """The head revision(s) of the migration scripts."""
+    return set(ScriptDirectory.from_config(alembic_cfg or Config("alembic.ini")).get_heads())
+
+
+def database_revisions(connection: Connection) -> Set[str]:
+    """The revision(s) the database is at, from its alembic_version table."""
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def check_schema_version(engine: Optional[Engine] = None, alembic_cfg: Optional[Config] = None) -> bool:
+    """
+    Check that the database is at the head revision.
+    :return: Whether it is; False if the database is at a revision these scripts do not know,
+        e.g. while a newer deploy rolls out
+    :raises SchemaVersionError: If the database has not been migrated to the head revision
+    """
+    engine = engine or default_engine
+    alembic_cfg = alembic_cfg or Config("alembic.ini")
+    script = ScriptDirectory.from_config(alembic_cfg)
+    heads = set(script.get_heads())
+    with engine.connect() as connection:
+        current = database_revisions(connection)
+
+    if current == heads:
+        return True
+    unknown = [revision for revision in current if not _is_known_revision(script, revision)]
+    if unknown:
+        log.warning(f"Database is at revision {', '.join(sorted(unknown))}, newer than this code ({', '.join(heads)})")
+        return False
+    raise SchemaVersionError(
+        f"Database is at revision {', '.join(sorted(current)) or '(none)'}, not {', '.join(sorted(heads))}. "
+        "Run `pdm run migrate` (python -m app.utilities.migrations)."
+    )
+
+
+def migrate_once(
+    engine: Optional[Engine] = None,
+    alembic_cfg: Optional[Config] = None,
+    poll_seconds: float = MIGRATION_LOCK_POLL_SECONDS,
+) -> bool:
+    """
+    Upgrade the database to the head revision, unless it already is, holding the migration
+    advisory lock (on Postgres) so concurrent callers run the migrations only once.
+    :return: Whether migrations were applied
+    :raises SchemaVersionError: If the migrations do not reach the head revision, or the
+        connection goes through PgBouncer
+    """
+    engine = engine or default_engine
+    alembic_cfg = alembic_cfg or Config("alembic.ini")
+    heads = head_revisions(alembic_cfg)
+    use_lock = engine.dialect.name == "postgresql"
+    if use_lock and PoolSettings.from_env().pgbouncer:
+        raise SchemaVersionError(
+            "Migrations hold a session-level advisory lock, which PgBouncer in transaction mode can "
+            "leave held. Run `pdm run migrate` against Postgres directly, with DB_PGBOUNCER=false."
+        )
+
+    # Autocommit, so no transaction (and no snapshot) stays open while waiting or migrating
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        if use_lock:
+            _acquire_migration_lock(connection, poll_seconds)
+        try:
+            if database_revisions(connection) == heads:
+                log.info("Database is already at the head revision")
+                return False
+            models.run_migrations()
+            current = database_revisions(connection)
+            if current != heads:
+                raise SchemaVersionError(f"Migrations did not reach {', '.join(sorted(heads))}; at {current}")
+            log.info(f"Database migrated to {', '.join(sorted(heads))}")
+            return True
+        finally:
+            if use_lock:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+
+def _acquire_migration_lock(connection: Connection, poll_seconds: float) -> None:
+    """Take the migration lock, sleeping between attempts with no statement running."""
+    while not connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}).scalar():
+        log.info("Waiting for the migration lock")
+        time.sleep(poll_seconds)
+
+
+def _is_known_revision(script: ScriptDirectory, revision: str) -> bool:
+    try:
+        return script.get_revision(revision) is not None
+    except Exception:
+        return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate the database to the head revision, once")
+    parser.add_argument(
+        "--check", action="store_true", help="Only check the schema version; exit 1 if it is not the head"
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    try:
+        if args.check:
+            check_schema_version()
+        else:
+            migrate_once()
+    except SchemaVersionError as e:
+        log.error(str(e))
+        sys.exit(1)
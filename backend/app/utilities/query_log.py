@@ -0,0 +1,134 @@
+"""
+N+1 query detection.
+
+``capture_queries()`` records every SQL statement executed on any engine in the current context
+(the request, test or task that opened it, including the worker threads and greenlets it runs
+on), grouped by statement shape: the SQL text with literals and parameter lists collapsed, so
+``... WHERE id = 1`` and ``... WHERE id = 2`` are the same shape. A shape that repeats more than
+``N_PLUS_ONE_THRESHOLD`` times is almost always a query issued per row of an earlier result.
+
+In development, ``DETECT_N_PLUS_ONE=true`` adds ``QueryLogMiddleware``, which logs a warning for
+every request with repeated shapes. In tests, ``assert_query_budget`` (the ``query_budget``
+fixture) fails when a block issues more statements than its budget or repeats a shape.
+"""
+
+import logging
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.utilities.constants import LOGGER_NAME
+
+log = logging.getLogger(LOGGER_NAME("query_log"))
+
+DETECT_N_PLUS_ONE = os.getenv("DETECT_N_PLUS_ONE", "false").lower() in ("1", "true", "yes", "on")
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"%\([^)]*\)s|\$\d+|:\w+|\?|%s")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with literals, bind parameters and IN lists replaced by ``?``."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PARAMETER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryLog:
+    """Statements executed while the log is active, counted by shape."""
+
+    def __init__(self):
+        self.shapes: Counter = Counter()
+
+    @property
+    def count(self) -> int:
+        return sum(self.shapes.values())
+
+    def record(self, statement: str) -> None:
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """Shapes executed more than ``threshold`` times, most repeated first."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def report(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> str:
+        lines = [f"{self.count} statements"]
+        lines.extend(f"  {count}x {shape}" for shape, count in self.repeated(threshold))
+        return "\n".join(lines)
+
+
+_current_log: ContextVar[Optional[QueryLog]] = ContextVar("query_log", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    query_log = _current_log.get()
+    if query_log is not None:
+        query_log.record(statement)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryLog]:
+    """Record the statements executed in this context until the block exits."""
+    query_log = QueryLog()
+    token = _current_log.set(query_log)
+    try:
+        yield query_log
+    finally:
+        _current_log.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def assert_query_budget(
+    max_queries: Optional[int] = None, max_repeats: int = N_PLUS_ONE_THRESHOLD
+) -> Iterator[QueryLog]:
+    """
+    Fail if the block executes more than ``max_queries`` statements, or any statement shape more
+    than ``max_repeats`` times.
+    """
+    with capture_queries() as query_log:
+        yield query_log
+    if max_queries is not None and query_log.count > max_queries:
+        raise QueryBudgetExceeded(f"Query budget of {max_queries} exceeded: {query_log.report(max_repeats)}")
+    if query_log.repeated(max_repeats):
+        raise QueryBudgetExceeded(f"Repeated statements (possible N+1): {query_log.report(max_repeats)}")
+
+
+class QueryLogMiddleware:
+    """Warns about requests that repeat a statement shape more than ``threshold`` times."""
+
+    def __init__(self, app: ASGIApp, threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with capture_queries() as query_log:
+            await self.app(scope, receive, send)
+        if query_log.repeated(self.threshold):
+            log.warning(
+                "Possible N+1 queries in %s %s: %s",
+                scope["method"],
+                scope["path"],
+                query_log.report(self.threshold),
+            )
@@ -0,0 +1,136 @@
+"""
+In-process cache of seeded reference data: qualities, treatments, experiences, roles and match statuses.
+
+These tables are written by ``app/seeds`` and almost never change, so each process loads them once
+(at startup, or each table lazily on first use) and serves lookups by id or by name from memory. Cached rows
+are detached; lookups return instances merged into the caller's session without a query, so they
+can be assigned to relationships like rows loaded by that session.
+
+``reference_data.refresh(db)`` reloads the cache on demand. A lookup that misses also triggers a
+reload, at most once per ``REFERENCE_DATA_MISS_RELOAD_SECONDS`` (default 60), so rows added after
+startup are picked up without a restart.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models import Experience, MatchStatus, Quality, Role, Treatment
+from app.utilities.constants import LOGGER_NAME
+
+T = TypeVar("T")
+
+# Cached models and the column each one is looked up by name with
+_NAME_COLUMNS: Dict[type, str] = {
+    Quality: "slug",
+    Treatment: "name",
+    Experience: "name",
+    Role: "name",
+    MatchStatus: "name",
+}
+
+
+class ReferenceDataCache:
+    def __init__(self, miss_reload_seconds: float):
+        self.miss_reload_seconds = miss_reload_seconds
+        self.logger = logging.getLogger(LOGGER_NAME("reference_data"))
+        self._lock = threading.RLock()
+        # Per model: rows ordered by id, indexes by id and by name, and when they were loaded
+        self._rows: Dict[type, List[Any]] = {}
+        self._by_id: Dict[type, Dict[int, Any]] = {}
+        self._by_name: Dict[type, Dict[str, Any]] = {}
+        self._loaded_at: Dict[type, float] = {}
+
+    def refresh(self, db: Session) -> Dict[str, int]:
+        """
+        (Re)load every reference table.
+        :return: Number of cached rows per table
+        """
+        with self._lock:
+            for model in _NAME_COLUMNS:
+                self._load(db, model)
+            self.logger.info(f"Loaded {sum(len(rows) for rows in self._rows.values())} reference data rows")
+            return {model.__tablename__: len(rows) for model, rows in self._rows.items()}
+
+    def invalidate(self) -> None:
+        """Drop the cache; each table is reloaded on its next lookup."""
+        with self._lock:
+            self._rows.clear()
+            self._by_id.clear()
+            self._by_name.clear()
+            self._loaded_at.clear()
+
+    def get_by_id(self, db: Session, model: Type[T], item_id: Optional[int]) -> Optional[T]:
+        """Look up a reference row by primary key, as an instance bound to `db`."""
+        return self._attach(db, self._lookup(db, model, self._by_id, item_id))
+
+    def get_by_name(self, db: Session, model: Type[T], name: Optional[str]) -> Optional[T]:
+        """Look up a reference row by name (slug for qualities), as an instance bound to `db`."""
+        return self._attach(db, self._lookup(db, model, self._by_name, name))
+
+    def get_by_names(self, db: Session, model: Type[T], names: Iterable[str]) -> List[T]:
+        """Reference rows with these names, in order and without duplicates, bound to `db`; unknown names are skipped."""
+        rows = []
+        for name in names:
+            row = self._lookup(db, model, self._by_name, name)
+            if row is not None and row not in rows:
+                rows.append(row)
+        return [self._attach(db, row) for row in rows]
+
+    def get_id(self, db: Session, model: Type[T], name: Optional[str]) -> Optional[int]:
+        """Id of the reference row with this name, without attaching anything to `db`."""
+        row = self._lookup(db, model, self._by_name, name)
+        return row.id if row is not None else None
+
+    def get_ids(self, db: Session, model: Type[T], names: Iterable[str]) -> List[int]:
+        """Ids of the reference rows with these names; unknown names are skipped."""
+        return [item_id for item_id in (self.get_id(db, model, name) for name in names) if item_id is not None]
+
+    def get_all(self, db: Session, model: Type[T]) -> List[T]:
+        """All rows of a reference table ordered by id, as instances bound to `db`."""
+        with self._lock:
+            if model not in self._loaded_at:
+                self._load(db, model)
+            rows = list(self._rows[model])
+        return [self._attach(db, row) for row in rows]
+
+    def _lookup(self, db: Session, model: type, index: Dict[type, Dict[Any, Any]], key: Any) -> Optional[Any]:
+        if key is None:
+            return None
+        with self._lock:
+            if model not in self._loaded_at:
+                self._load(db, model)
+            row = index[model].get(key)
+            if row is None and time.monotonic() - self._loaded_at[model] > self.miss_reload_seconds:
+                self._load(db, model)
+                row = index[model].get(key)
+            return row
+
+    def _load(self, db: Session, model: type) -> None:
+        # Read plain column values so instances already in the caller's session are left alone
+        result = db.execute(select(model.__table__).order_by(model.__table__.c.id.asc()))
+        rows = [self._detached(model, dict(row._mapping)) for row in result]
+
+        self._rows[model] = rows
+        self._by_id[model] = {row.id: row for row in rows}
+        self._by_name[model] = {getattr(row, _NAME_COLUMNS[model]): row for row in rows}
+        self._loaded_at[model] = time.monotonic()
+
+    @staticmethod
+    def _detached(model: Type[T], values: Dict[str, Any]) -> T:
+        row = model(**values)
+        make_transient_to_detached(row)
+        return row
+
+    @staticmethod
+    def _attach(db: Session, row: Optional[T]) -> Optional[T]:
+        # merge(load=False) copies the cached state into the session without querying
+        return db.merge(row, load=False) if row is not None else None
+
+
+reference_data = ReferenceDataCache(miss_reload_seconds=float(os.getenv("REFERENCE_DATA_MISS_RELOAD_SECONDS", "60")))
@@ -0,0 +1,196 @@
+"""
+Request-level latency and query-count instrumentation.
+
+``MetricsMiddleware`` times every request and, through ``RequestTimings`` held in a context
+variable, collects what the request spent in the database (statement count and time, from
+cursor events on the ``db_utils`` engines) and in Firebase and SES calls (``external_call`` and
+``instrument_boto_client``). Per-route histograms are exposed in Prometheus format at
+``/metrics``; with ``METRICS_SERVER_TIMING=true`` each response also carries a ``Server-Timing``
+header, e.g. ``db;dur=12.4;desc="5 queries", firebase;dur=31.0, total;dur=58.2``.
+
+Routes are labelled with their path template (``/users/{user_id}``), so label cardinality stays
+bounded. Work on threads the request did not start (such as a token verification shared by
+concurrent requests) is only attributed to the request that started it.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_SERVER_TIMING = os.getenv("METRICS_SERVER_TIMING", "false").lower() in ("1", "true", "yes", "on")
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000),
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+EXTERNAL_CALL_SECONDS = Histogram(
+    "external_call_duration_seconds",
+    "Latency of calls to external services",
+    ["service", "operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+class RequestTimings:
+    """What one request spent in the database and external services; shared with its worker threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.external_seconds: Dict[str, float] = {}
+
+    def add_query(self, seconds: float) -> None:
+        with self._lock:
+            self.queries += 1
+            self.db_seconds += seconds
+
+    def add_external(self, service: str, seconds: float) -> None:
+        with self._lock:
+            self.external_seconds[service] = self.external_seconds.get(service, 0.0) + seconds
+
+    def server_timing(self, total_seconds: float) -> str:
+        with self._lock:
+            entries = [f'db;dur={self.db_seconds * 1000:.1f};desc="{self.queries} queries"']
+            entries.extend(
+                f"{service};dur={seconds * 1000:.1f}" for service, seconds in sorted(self.external_seconds.items())
+            )
+        entries.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Timings of the request being handled, or None outside a request."""
+    return _current_timings.get()
+
+
+@contextmanager
+def external_call(service: str, operation: str) -> Iterator[None]:
+    """Time a call to an external service (e.g. ``with external_call("firebase", "verify_id_token"):``)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record_external(service, operation, time.perf_counter() - started)
+
+
+def _record_external(service: str, operation: str, seconds: float) -> None:
+    EXTERNAL_CALL_SECONDS.labels(service, operation).observe(seconds)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_external(service, seconds)
+
+
+def instrument_boto_client(client, service: str):
+    """Time every API call of a boto3 client as ``service``; returns the client."""
+    events = getattr(getattr(client, "meta", None), "events", None)
+    if events is None:
+        # Not a botocore client (e.g. a test double)
+        return client
+
+    def before_call(model, context, **kwargs):
+        context["metrics_operation"] = model.name
+        context["metrics_started"] = time.perf_counter()
+
+    def after_call(context, **kwargs):
+        started = context.pop("metrics_started", None)
+        if started is not None:
+            _record_external(service, context.pop("metrics_operation"), time.perf_counter() - started)
+
+    # before-parameter-build is the first per-call event and, unlike before-call, always fires
+    events.register("before-parameter-build", before_call)
+    events.register("after-call", after_call)
+    events.register("after-call-error", after_call)
+    return client
+
+
+def instrument_engine_queries(engine: Engine) -> None:
+    """Count statements and time spent in them towards the current request (sync engine or AsyncEngine)."""
+    engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _record_query(conn)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        if exception_context.connection is not None:
+            _record_query(exception_context.connection)
+
+
+def _record_query(conn) -> None:
+    started = conn.info.get("metrics_query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_query(elapsed)
+
+
+class MetricsMiddleware:
+    """Records per-route latency, SQL and external call metrics for every HTTP request."""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = METRICS_SERVER_TIMING, excluded_paths=("/metrics",)):
+        self.app = app
+        self.server_timing = server_timing
+        self.excluded_paths = set(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    server_timing = timings.server_timing(time.perf_counter() - started)
+                    MutableHeaders(scope=message).append("Server-Timing", server_timing)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timings.reset(token)
+            # The router stores the matched route in the scope; unmatched paths share one label
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_LATENCY.labels(scope["method"], route, str(status)).observe(time.perf_counter() - started)
+            REQUEST_DB_QUERIES.labels(route).observe(timings.queries)
+            REQUEST_DB_SECONDS.labels(route).observe(timings.db_seconds)
@@ -1,19 +1,25 @@
 import logging
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..services.implementations.auth_service import AuthService
 from ..services.implementations.task_service import TaskService
 from ..services.implementations.user_service import UserService
 from ..services.implementations.volunteer_data_service import VolunteerDataService
-from .db_utils import get_db
+from .db_utils import get_async_db, get_async_read_db, get_db, get_read_db
 
 
 def get_user_service(db: Session = Depends(get_db)):
     return UserService(db)
 
 
+def get_read_user_service(db: Session = Depends(get_read_db)):
+    """UserService for read-only endpoints, reading from the replica when one is configured"""
+    return UserService(db)
+
+
 def get_volunteer_data_service(db: Session = Depends(get_db)):
     return VolunteerDataService(db)
 
@@ -23,5 +29,10 @@ def get_auth_service(user_service: UserService = Depends(get_user_service)):
     return AuthService(logger=logger, user_service=user_service)
 
 
-def get_task_service(db: Session = Depends(get_db)):
+def get_task_service(db: AsyncSession = Depends(get_async_db)):
+    return TaskService(db)
+
+
+def get_read_task_service(db: AsyncSession = Depends(get_async_read_db)):
+    """TaskService for read-only endpoints, reading from the replica when one is configured"""
     return TaskService(db)
@@ -0,0 +1,114 @@
+"""
+Process-wide SES clients.
+
+Building a boto3 client resolves credentials and loads the service model, which takes tens of
+milliseconds; the clients themselves are thread-safe and pool their HTTPS connections. So each
+process creates one client per set of credentials, on first use, and every email service shares
+it. Creation is serialized because boto3's default session is not thread-safe.
+
+In the SES sandbox only verified addresses can receive email. The verified addresses are listed
+once and cached for ``SES_VERIFIED_EMAILS_TTL_SECONDS`` (default 300), and a verification
+request is sent at most once per address in that time.
+"""
+
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Optional, Set, Tuple
+
+import boto3
+from botocore.config import Config
+
+from app.utilities.request_metrics import instrument_boto_client
+
+
+class _ClientState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.verified_emails: Optional[Set[str]] = None
+        self.verified_at = 0.0
+        # Addresses a verification request was sent to, and when
+        self.verification_requested: Dict[str, float] = {}
+
+
+class SESClientRegistry:
+    def __init__(self, verified_emails_ttl_seconds: float, max_pool_connections: int):
+        self.verified_emails_ttl_seconds = verified_emails_ttl_seconds
+        self.max_pool_connections = max_pool_connections
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str, str], object] = {}
+        self._states: "weakref.WeakKeyDictionary[object, _ClientState]" = weakref.WeakKeyDictionary()
+
+    def client(self, region: Optional[str] = None, access_key: Optional[str] = None, secret_key: Optional[str] = None):
+        """
+        The shared SES client for these credentials (AWS_REGION, AWS_ACCESS_KEY and AWS_SECRET_KEY
+        by default), or None if any of them is missing.
+        """
+        key = (
+            region or os.getenv("AWS_REGION"),
+            access_key or os.getenv("AWS_ACCESS_KEY"),
+            secret_key or os.getenv("AWS_SECRET_KEY"),
+        )
+        if not all(key):
+            return None
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            if key not in self._clients:
+                client = instrument_boto_client(
+                    boto3.client(
+                        "ses",
+                        region_name=key[0],
+                        aws_access_key_id=key[1],
+                        aws_secret_access_key=key[2],
+                        config=Config(max_pool_connections=self.max_pool_connections),
+                    ),
+                    "ses",
+                )
+                self._states[client] = _ClientState()
+                self._clients[key] = client
+            return self._clients[key]
+
+    def verified_emails(self, client) -> Set[str]:
+        """Addresses verified in SES for this client's account, cached."""
+        state = self._state(client)
+        with state.lock:
+            if state.verified_emails is None or time.monotonic() - state.verified_at > self.verified_emails_ttl_seconds:
+                response = client.list_verified_email_addresses()
+                state.verified_emails = set(response.get("VerifiedEmailAddresses", []))
+                state.verified_at = time.monotonic()
+            return state.verified_emails
+
+    def request_verification(self, client, email: str) -> bool:
+        """
+        Ask SES to send a verification email to `email`, unless one was requested recently.
+        :return: Whether a request was sent
+        """
+        state = self._state(client)
+        with state.lock:
+            requested_at = state.verification_requested.get(email)
+            if requested_at is not None and time.monotonic() - requested_at < self.verified_emails_ttl_seconds:
+                return False
+            state.verification_requested[email] = time.monotonic()
+        client.verify_email_identity(EmailAddress=email)
+        return True
+
+    def invalidate(self) -> None:
+        """Drop every client and cached verification state; clients are recreated on next use."""
+        with self._lock:
+            self._clients.clear()
+            self._states.clear()
+
+    def _state(self, client) -> _ClientState:
+        with self._lock:
+            # Clients not created by the registry (e.g. injected in tests) get their state here
+            return self._states.setdefault(client, _ClientState())
+
+
+ses_clients = SESClientRegistry(
+    verified_emails_ttl_seconds=float(os.getenv("SES_VERIFIED_EMAILS_TTL_SECONDS", "300")),
+    max_pool_connections=int(os.getenv("SES_MAX_POOL_CONNECTIONS", "10")),
+)
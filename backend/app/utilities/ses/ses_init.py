@@ -1,12 +1,27 @@
+"""
+SES template sync.
+
+Each template's subject, text and HTML are hashed into a local manifest. The manifest of the last
+sync is stored in SES itself, as the text part of the ``TemplateManifest`` template, so syncing
+costs one ``get_template`` call when nothing changed, and only changed templates are uploaded.
+
+The server runs the sync in the background after startup (unless SES_TEMPLATE_SYNC_ON_STARTUP is
+false); deploys can run it once instead with ``python -m app.utilities.ses.ses_init``.
+"""
+
+import argparse
+import hashlib
 import json
-import os
-from typing import Dict
+from typing import Dict, List, Optional
 
-import boto3
 from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+
+from app.utilities.ses.ses_clients import ses_clients
 
 TEMPLATES_FILE = "app/utilities/ses/ses_templates.json"
 TEMPLATES_DIR = "app/utilities/ses/template_files"
+MANIFEST_TEMPLATE_NAME = "TemplateManifest"
 
 
 def load_templates_metadata(file_path: str) -> Dict:
@@ -31,60 +46,117 @@ def load_file_content(file_path: str) -> str:
         return ""
 
 
-# Function to create or update SES template
-def create_or_update_ses_template(template_metadata, ses_client, force_update=False):
-    name = template_metadata["TemplateName"]
-    try:
+def load_templates(templates_file: str = TEMPLATES_FILE) -> List[Dict[str, str]]:
+    """The SES templates described by `templates_file`, with their text and HTML read from disk."""
+    templates = []
+    for template_metadata in load_templates_metadata(templates_file):
+        name = template_metadata["TemplateName"]
         text_part = load_file_content(template_metadata["TextPart"])
         html_part = load_file_content(template_metadata["HtmlPart"])
         if not text_part or not html_part:
             print(f"Skipping template '{name}' missing content.")
-            return
+            continue
+        templates.append(
+            {
+                "TemplateName": name,
+                "SubjectPart": template_metadata["SubjectPart"],
+                "TextPart": text_part,
+                "HtmlPart": html_part,
+            }
+        )
+    return templates
+
+
+def template_hash(template: Dict[str, str]) -> str:
+    return hashlib.sha256(json.dumps(template, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_manifest(templates: List[Dict[str, str]]) -> Dict[str, str]:
+    """Template name -> content hash."""
+    return {template["TemplateName"]: template_hash(template) for template in templates}
+
+
+def fetch_remote_manifest(ses_client) -> Dict[str, str]:
+    """The manifest stored by the last sync, or {} if there is none."""
+    try:
+        response = ses_client.get_template(TemplateName=MANIFEST_TEMPLATE_NAME)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "TemplateDoesNotExist":
+            return {}
+        raise
+    try:
+        return json.loads(response["Template"].get("TextPart") or "{}")
+    except json.JSONDecodeError:
+        return {}
+
+
+def put_template(ses_client, template: Dict[str, str]) -> None:
+    """Update the template, or create it if SES does not have it."""
+    try:
+        ses_client.update_template(Template=template)
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "TemplateDoesNotExist":
+            raise
+        ses_client.create_template(Template=template)
 
-        template = {
-            "TemplateName": template_metadata["TemplateName"],
-            "SubjectPart": template_metadata["SubjectPart"],
-            "TextPart": text_part,
-            "HtmlPart": html_part,
-        }
 
-        # Check if template exists
+def sync_ses_templates(ses_client, templates_file: str = TEMPLATES_FILE, force_update: bool = False) -> List[str]:
+    """
+    Upload the templates whose content differs from the remote manifest (all of them with
+    `force_update`), then store the new manifest.
+    :return: Names of the uploaded templates
+    """
+    templates = load_templates(templates_file)
+    local_manifest = build_manifest(templates)
+    remote_manifest = {} if force_update else fetch_remote_manifest(ses_client)
+
+    synced = []
+    for template in templates:
+        name = template["TemplateName"]
+        if remote_manifest.get(name) == local_manifest[name]:
+            continue
         try:
-            ses_client.get_template(TemplateName=name)
-            # Template exists, update it
-            if force_update:
-                ses_client.update_template(Template=template)
-                print(f"SES template '{name}' updated successfully!")
-            else:
-                print(f"SES template '{name}' already exists. Use force_update=True to update.")
+            put_template(ses_client, template)
+            synced.append(name)
+            print(f"SES template '{name}' synced successfully!")
         except ClientError as e:
-            if e.response["Error"]["Code"] == "TemplateDoesNotExist":
-                # Template doesn't exist, create it
-                ses_client.create_template(Template=template)
-                print(f"SES template '{name}' created successfully!")
-            else:
-                raise
-    except ClientError as e:
-        print(f"An error occurred while processing SES template '{name}': {e}")
+            print(f"An error occurred while processing SES template '{name}': {e}")
+            # Not recorded, so the next sync retries it
+            local_manifest.pop(name)
 
+    manifest = {**remote_manifest, **local_manifest}
+    if manifest != remote_manifest:
+        put_template(
+            ses_client,
+            {
+                "TemplateName": MANIFEST_TEMPLATE_NAME,
+                "SubjectPart": "SES template manifest",
+                "TextPart": json.dumps(manifest, sort_keys=True),
+            },
+        )
+    return synced
 
-# Ensure SES templates are available at app startup
-def ensure_ses_templates(force_update=False):
-    templates_metadata = load_templates_metadata(TEMPLATES_FILE)
-    aws_region = os.getenv("AWS_REGION")
-    aws_access_key = os.getenv("AWS_ACCESS_KEY")
-    aws_secret_key = os.getenv("AWS_SECRET_KEY")
 
-    if not all([aws_region, aws_access_key, aws_secret_key]):
+def ensure_ses_templates(force_update: bool = False, ses_client=None) -> Optional[List[str]]:
+    """Sync the SES templates if AWS credentials are configured."""
+    ses_client = ses_client or ses_clients.client()
+    if ses_client is None:
         print("AWS credentials not set. Skipping SES template setup.")
-        return
+        return None
+
+    try:
+        synced = sync_ses_templates(ses_client, force_update=force_update)
+    except ClientError as e:
+        print(f"An error occurred while syncing SES templates: {e}")
+        return None
+    print(f"SES templates up to date ({len(synced)} synced).")
+    return synced
+
 
-    ses_client = boto3.client(
-        "ses",
-        region_name=aws_region,
-        aws_access_key_id=aws_access_key,
-        aws_secret_access_key=aws_secret_key,
-    )
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upload changed SES email templates")
+    parser.add_argument("--force", action="store_true", help="Upload every template, ignoring the manifest")
+    args = parser.parse_args()
 
-    for template_metadata in templates_metadata:
-        create_or_update_ses_template(template_metadata, ses_client, force_update=force_update)
+    load_dotenv()
+    ensure_ses_templates(force_update=args.force)
@@ -1,12 +1,53 @@
 import json
 import logging
 import os
-from typing import Any, Dict
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
 
-import boto3
 from botocore.exceptions import ClientError
 
 from app.utilities.constants import LOGGER_NAME
+from app.utilities.ses.ses_clients import ses_clients
+
+# SendBulkTemplatedEmail accepts at most 50 destinations per call
+SES_MAX_BULK_DESTINATIONS = 50
+
+# SES errors worth retrying: error codes of a failed call, or statuses of one destination in a bulk send.
+# Anything else (e.g. MessageRejected) fails the email immediately.
+RETRYABLE_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailable",
+    "InternalFailure",
+    "RequestTimeout",
+    "TransientFailure",
+    "AccountThrottled",
+    "AccountDailyQuotaExceeded",
+    "Failed",
+}
+
+
+class SESNotConfiguredError(Exception):
+    pass
+
+
+@dataclass
+class TemplatedEmail:
+    to_email: str
+    template_name: str
+    template_data: Dict[str, Any]
+    source_email: Optional[str] = None
+
+
+@dataclass
+class BulkSendResult:
+    email: TemplatedEmail
+    message_id: Optional[str] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    retryable: bool = False
 
 
 class SESEmailService:
@@ -23,21 +64,20 @@ class SESEmailService:
         # Use English source email as default for backwards compatibility
         self.source_email = self.source_email_en
 
-        if not all([self.aws_region, self.aws_access_key, self.aws_secret_key, self.source_email_en]):
+        self.ses_client = self._create_client()
+
+    def _create_client(self):
+        if not self.source_email_en:
             self.logger.warning("SES credentials not fully configured. Email sending will be disabled.")
-            self.ses_client = None
-        else:
-            try:
-                self.ses_client = boto3.client(
-                    "ses",
-                    region_name=self.aws_region,
-                    aws_access_key_id=self.aws_access_key,
-                    aws_secret_access_key=self.aws_secret_key,
-                )
-                self.logger.info("SES client initialized successfully")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize SES client: {str(e)}")
-                self.ses_client = None
+            return None
+        try:
+            ses_client = ses_clients.client(self.aws_region, self.aws_access_key, self.aws_secret_key)
+        except Exception as e:
+            self.logger.error(f"Failed to initialize SES client: {str(e)}")
+            return None
+        if ses_client is None:
+            self.logger.warning("SES credentials not fully configured. Email sending will be disabled.")
+        return ses_client
 
     def verify_email_address(self, email: str) -> bool:
         """
@@ -47,8 +87,10 @@ class SESEmailService:
             return False
 
         try:
-            self.ses_client.verify_email_identity(EmailAddress=email)
-            self.logger.info(f"Email verification request sent to {email}")
+            if ses_clients.request_verification(self.ses_client, email):
+                self.logger.info(f"Email verification request sent to {email}")
+            else:
+                self.logger.info(f"Email verification already requested for {email}")
             return True
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -74,44 +116,169 @@ class SESEmailService:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
-        if not self.ses_client:
+        try:
+            message_id = self.deliver_templated_email(to_email, template_name, template_data, source_email)
+            self.logger.info(f"Email sent successfully to {to_email}. MessageId: {message_id}")
+            return True
+
+        except SESNotConfiguredError:
             self.logger.error("SES client not available. Cannot send email.")
             return False
+        except ClientError as e:
+            self.handle_send_error(to_email, e)
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error sending email to {to_email}: {str(e)}")
+            return False
+
+    def deliver_templated_email(
+        self, to_email: str, template_name: str, template_data: Dict[str, Any], source_email: str = None
+    ) -> str:
+        """
+        Send a templated email using SES, raising on failure
+
+        Returns:
+            str: The SES MessageId
+
+        Raises:
+            SESNotConfiguredError: If SES credentials are not configured
+            ClientError: If SES rejects the request
+        """
+        if not self.ses_client:
+            raise SESNotConfiguredError("SES client not available")
+
+        response = self.ses_client.send_templated_email(
+            Source=source_email if source_email else self.source_email,
+            Destination={"ToAddresses": [to_email]},
+            Template=template_name,
+            TemplateData=json.dumps(template_data),
+        )
+        return response["MessageId"]
 
-        # Use provided source email or fall back to default
-        from_email = source_email if source_email else self.source_email
+    def send_bulk_templated_emails(self, emails: Sequence[TemplatedEmail]) -> List[BulkSendResult]:
+        """
+        Send many templated emails with as few SES calls as possible (see deliver_bulk_templated_emails)
 
+        Args:
+            emails: Emails to send; each is sent to one recipient with its own template data
+
+        Returns:
+            List[BulkSendResult]: One result per email, in the order given
+        """
         try:
-            response = self.ses_client.send_templated_email(
-                Source=from_email,
-                Destination={"ToAddresses": [to_email]},
-                Template=template_name,
-                TemplateData=json.dumps(template_data),
-            )
+            results = self.deliver_bulk_templated_emails(emails)
+        except SESNotConfiguredError:
+            self.logger.error("SES client not available. Cannot send email.")
+            return [BulkSendResult(email, error_code="SESNotConfigured") for email in emails]
 
-            self.logger.info(f"Email sent successfully to {to_email}. MessageId: {response['MessageId']}")
-            return True
+        for result in results:
+            if result.message_id is None:
+                self.handle_send_failure(result.email.to_email, result.error_code, result.error_message)
+        sent = sum(1 for result in results if result.message_id is not None)
+        self.logger.info(f"Bulk send: {sent} of {len(results)} emails sent")
+        return results
+
+    def deliver_bulk_templated_emails(self, emails: Sequence[TemplatedEmail]) -> List[BulkSendResult]:
+        """
+        Send templated emails with one SendBulkTemplatedEmail call per template, source address
+        (i.e. language) and SES_MAX_BULK_DESTINATIONS recipients
+
+        Returns:
+            List[BulkSendResult]: One result per email, in the order given. A failed call fails
+            every email it contained.
+
+        Raises:
+            SESNotConfiguredError: If SES credentials are not configured
+        """
+        if not self.ses_client:
+            raise SESNotConfiguredError("SES client not available")
+
+        results: Dict[int, BulkSendResult] = {}
+        for group in self.group_for_bulk_send(emails):
+            for index, result in zip(group, self._send_bulk_chunk([emails[index] for index in group])):
+                results[index] = result
+        return [results[index] for index in range(len(emails))]
 
+    def group_for_bulk_send(self, emails: Sequence[TemplatedEmail]) -> List[List[int]]:
+        """
+        Split emails into groups that can share a SendBulkTemplatedEmail call: same template and
+        source address, at most SES_MAX_BULK_DESTINATIONS each.
+
+        Returns:
+            List[List[int]]: The indexes of the emails in each group
+        """
+        groups: Dict[tuple, List[int]] = defaultdict(list)
+        for index, email in enumerate(emails):
+            groups[(email.template_name, email.source_email or self.source_email)].append(index)
+        return [
+            group[start : start + SES_MAX_BULK_DESTINATIONS]
+            for group in groups.values()
+            for start in range(0, len(group), SES_MAX_BULK_DESTINATIONS)
+        ]
+
+    def _send_bulk_chunk(self, chunk: List[TemplatedEmail]) -> List[BulkSendResult]:
+        try:
+            response = self.ses_client.send_bulk_templated_email(
+                Source=chunk[0].source_email or self.source_email,
+                Template=chunk[0].template_name,
+                # Every destination carries all of its template data
+                DefaultTemplateData="{}",
+                Destinations=[
+                    {
+                        "Destination": {"ToAddresses": [email.to_email]},
+                        "ReplacementTemplateData": json.dumps(email.template_data),
+                    }
+                    for email in chunk
+                ],
+            )
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
-            error_message = e.response["Error"]["Message"]
-
-            if error_code == "MessageRejected" and "not verified" in error_message:
-                # Try to verify the email address automatically
-                self.logger.info(f"Email {to_email} not verified. Attempting to verify...")
-                if self.verify_email_address(to_email):
-                    self.logger.info(
-                        f"Email verification request sent to {to_email}. Please check your email and verify."
+            return [
+                BulkSendResult(
+                    email,
+                    error_code=error_code,
+                    error_message=e.response["Error"]["Message"],
+                    retryable=error_code in RETRYABLE_ERROR_CODES,
+                )
+                for email in chunk
+            ]
+        except Exception as e:
+            # Connection errors and timeouts
+            return [
+                BulkSendResult(email, error_code=type(e).__name__, error_message=str(e), retryable=True)
+                for email in chunk
+            ]
+
+        results = []
+        for email, status in zip(chunk, response["Status"]):
+            if status["Status"] == "Success":
+                results.append(BulkSendResult(email, message_id=status["MessageId"]))
+            else:
+                results.append(
+                    BulkSendResult(
+                        email,
+                        error_code=status["Status"],
+                        error_message=status.get("Error", ""),
+                        retryable=status["Status"] in RETRYABLE_ERROR_CODES,
                     )
-                else:
-                    self.logger.error(f"Failed to send verification request for {to_email}")
-                return False
+                )
+        return results
+
+    def handle_send_error(self, to_email: str, error: ClientError) -> None:
+        """Log a failed send; in the SES sandbox, also request verification of an unverified recipient."""
+        self.handle_send_failure(to_email, error.response["Error"]["Code"], error.response["Error"]["Message"])
+
+    def handle_send_failure(self, to_email: str, error_code: str, error_message: str) -> None:
+        """Like handle_send_error, for a failure reported as an SES error code and message."""
+        if error_code == "MessageRejected" and "not verified" in (error_message or ""):
+            # Try to verify the email address automatically
+            self.logger.info(f"Email {to_email} not verified. Attempting to verify...")
+            if self.verify_email_address(to_email):
+                self.logger.info(f"Email verification request sent to {to_email}. Please check your email and verify.")
             else:
-                self.logger.error(f"Failed to send email to {to_email}. Error: {error_code} - {error_message}")
-                return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error sending email to {to_email}: {str(e)}")
-            return False
+                self.logger.error(f"Failed to send verification request for {to_email}")
+        else:
+            self.logger.error(f"Failed to send email to {to_email}. Error: {error_code} - {error_message}")
 
     def send_verification_email(
         self, to_email: str, verification_link: str, first_name: str = None, language: str = "en"
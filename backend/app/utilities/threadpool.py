@@ -0,0 +1,22 @@
+"""Awaitable wrappers for service methods that query a sync SQLAlchemy Session."""
+
+import functools
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def in_threadpool(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+    """
+    Make a blocking method awaitable by running it in Starlette's threadpool, as FastAPI runs plain
+    ``def`` routes, so its database calls do not block the event loop. Callers keep awaiting it.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return await run_in_threadpool(func, *args, **kwargs)
+
+    return wrapper
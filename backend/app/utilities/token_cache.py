@@ -0,0 +1,128 @@
+"""
+Process-level cache of verified Firebase ID tokens.
+
+Verifying a token with ``check_revoked=True`` and reading the user's ``email_verified`` flag costs
+two round trips to Google, and a single page load can issue many API calls with the same token.
+``token_cache.verify(token)`` does that work once per token and serves the decoded claims from
+memory until the token's own ``exp``.
+
+A revoked token stays valid in the cache until it is re-checked, so entries are re-verified
+against Firebase once ``AUTH_TOKEN_REVOCATION_CHECK_SECONDS`` (default 60) have passed since the
+last check; set it to 0 to check on every request. Entries are keyed by a SHA-256 of the token,
+so raw tokens are never held in memory, and at most ``AUTH_TOKEN_CACHE_MAX_ENTRIES`` (default
+10000) are kept, least recently used first out.
+
+With ``AUTH_TOKEN_VERIFICATION=local`` tokens are instead verified in-process on every call by
+``app.utilities.local_token_verifier``, which needs neither the cache nor any remote call.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import firebase_admin.auth
+
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.local_token_verifier import LocalTokenVerifier, local_token_verifier
+from app.utilities.request_metrics import external_call
+
+
+@dataclass(frozen=True, slots=True)
+class VerifiedToken:
+    """Decoded claims of a verified ID token plus the user's current email verification flag."""
+
+    claims: Dict[str, Any]
+    email_verified: bool
+    # Wall-clock expiry of the token, and monotonic time of the last revocation check
+    expires_at: Optional[float]
+    checked_at: float
+
+    @property
+    def uid(self) -> str:
+        return self.claims["uid"]
+
+
+class TokenVerificationCache:
+    def __init__(
+        self,
+        revocation_check_seconds: float,
+        max_entries: int,
+        local_verifier: Optional[LocalTokenVerifier] = None,
+    ):
+        self.revocation_check_seconds = revocation_check_seconds
+        self.max_entries = max_entries
+        self.local_verifier = local_verifier
+        self.logger = logging.getLogger(LOGGER_NAME("token_cache"))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, VerifiedToken]" = OrderedDict()
+
+    def verify(self, token: str) -> VerifiedToken:
+        """
+        Verify an ID token, using the cached result when it is still fresh.
+        Raises the same firebase_admin errors as ``verify_id_token`` and ``get_user``.
+        :return: The token's claims and the user's email_verified flag
+        """
+        if self.local_verifier is not None:
+            # Signature and revocation checks are local and cheap, so there is nothing worth caching
+            claims = self.local_verifier.verify(token)
+            return VerifiedToken(
+                claims=claims,
+                email_verified=bool(claims.get("email_verified", False)),
+                expires_at=float(claims["exp"]),
+                checked_at=time.monotonic(),
+            )
+
+        key = hashlib.sha256(token.encode()).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry):
+                self._entries.move_to_end(key)
+                return entry
+            self._entries.pop(key, None)
+
+        # Verify outside the lock so concurrent requests for other tokens are not serialized
+        with external_call("firebase", "verify_id_token"):
+            claims = firebase_admin.auth.verify_id_token(token, check_revoked=True)
+        with external_call("firebase", "get_user"):
+            firebase_user = firebase_admin.auth.get_user(claims["uid"])
+        exp = claims.get("exp")
+        entry = VerifiedToken(
+            claims=claims,
+            email_verified=firebase_user.email_verified,
+            expires_at=float(exp) if exp is not None else None,
+            checked_at=time.monotonic(),
+        )
+
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate_user(self, uid: str) -> None:
+        """Drop every cached token of a Firebase user, e.g. after their refresh tokens are revoked."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.uid == uid]:
+                del self._entries[key]
+
+    def invalidate(self) -> None:
+        """Drop every cached token; each is verified with Firebase on its next use."""
+        with self._lock:
+            self._entries.clear()
+
+    def _is_fresh(self, entry: VerifiedToken) -> bool:
+        if entry.expires_at is not None and time.time() >= entry.expires_at:
+            return False
+        return time.monotonic() - entry.checked_at < self.revocation_check_seconds
+
+
+token_cache = TokenVerificationCache(
+    revocation_check_seconds=float(os.getenv("AUTH_TOKEN_REVOCATION_CHECK_SECONDS", "60")),
+    max_entries=int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000")),
+    local_verifier=local_token_verifier,
+)
@@ -0,0 +1,77 @@
+"""
+Bulk updates of UserData's treatment and experience links.
+
+Names are resolved to reference rows from the ``reference_data`` cache, and a collection is
+replaced by diffing the link table: one SELECT of the current ids, then a single DELETE of the
+removed links and a single INSERT of the added ones. Links that stay are not touched. The ORM
+collection is set to the new rows without reloading it.
+"""
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import Table, delete, insert, inspect, select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import Experience, Treatment, UserData
+from app.models.UserData import (
+    user_experiences,
+    user_loved_one_experiences,
+    user_loved_one_treatments,
+    user_treatments,
+)
+from app.utilities.reference_data import reference_data
+
+# UserData collection -> (reference model, link table, link table column of the reference id)
+REFERENCE_LINKS: Dict[str, Tuple[type, Table, str]] = {
+    "treatments": (Treatment, user_treatments, "treatment_id"),
+    "experiences": (Experience, user_experiences, "experience_id"),
+    "loved_one_treatments": (Treatment, user_loved_one_treatments, "treatment_id"),
+    "loved_one_experiences": (Experience, user_loved_one_experiences, "experience_id"),
+}
+
+
+def replace_links(db: Session, user_data: UserData, field: str, names: Iterable[Optional[str]]) -> None:
+    """Set a UserData collection (e.g. ``"treatments"``) to the rows with these names; unknown names are skipped."""
+    _update_links(db, user_data, field, names, keep_existing=False)
+
+
+def add_links(db: Session, user_data: UserData, field: str, names: Iterable[Optional[str]]) -> None:
+    """Add the rows with these names to a UserData collection, keeping the rows already in it."""
+    _update_links(db, user_data, field, names, keep_existing=True)
+
+
+def _update_links(
+    db: Session, user_data: UserData, field: str, names: Iterable[Optional[str]], keep_existing: bool
+) -> None:
+    model, table, column = REFERENCE_LINKS[field]
+    rows = reference_data.get_by_names(db, model, (name for name in names if name))
+
+    if not inspect(user_data).persistent:
+        # Nothing to diff against yet; the ORM inserts the links when the UserData is flushed
+        collection = getattr(user_data, field)
+        if not keep_existing:
+            collection.clear()
+        collection.extend(row for row in rows if row not in collection)
+        return
+
+    current = _current_ids(db, user_data, field, table, column)
+    removed = set() if keep_existing else current - {row.id for row in rows}
+    added = [row for row in rows if row.id not in current]
+
+    if removed:
+        db.execute(delete(table).where(table.c.user_data_id == user_data.id, table.c[column].in_(removed)))
+    if added:
+        db.execute(insert(table), [{"user_data_id": user_data.id, column: row.id} for row in added])
+
+    if keep_existing:
+        rows = [reference_data.get_by_id(db, model, item_id) for item_id in sorted(current)] + added
+    set_committed_value(user_data, field, [row for row in rows if row is not None])
+
+
+def _current_ids(db: Session, user_data: UserData, field: str, table: Table, column: str) -> Set[int]:
+    if field in user_data.__dict__:
+        # A loaded collection matches the link table once its pending changes are flushed
+        db.flush()
+        return {row.id for row in getattr(user_data, field)}
+    return set(db.scalars(select(table.c[column]).where(table.c.user_data_id == user_data.id)))
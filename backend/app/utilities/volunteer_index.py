@@ -0,0 +1,171 @@
+"""
+Process-level index of volunteer matching features.
+
+The index keeps the active, approved volunteer pool in memory as compact feature records,
+segmented by language and volunteer type ("patient", "caregiver" or "other"), with a
+``CandidatePool`` built lazily per segment. Matching requests read from it instead of
+re-running the User/UserData/Role join and loading every treatment and experience.
+
+Code paths that change a volunteer call ``volunteer_index.refresh_user`` (or ``remove_user``)
+after committing. The index is per process, so changes committed by another worker are picked
+up by a full reload once ``VOLUNTEER_INDEX_TTL_SECONDS`` (default 300) has elapsed.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import Role, User, UserData
+from app.models.User import Language
+from app.schemas.user import UserRole
+from app.utilities.constants import LOGGER_NAME
+from app.utilities.matching_engine import CandidateFeatures, CandidatePool
+
+VOLUNTEER_TYPES = ("patient", "caregiver", "other")
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedVolunteer:
+    """A volunteer's matching features plus the fields needed to display a match."""
+
+    features: CandidateFeatures
+    first_name: Optional[str]
+    last_name: Optional[str]
+    email: str
+
+    @property
+    def user_id(self) -> UUID:
+        return self.features.user_id
+
+
+class _Segment:
+    """Volunteers of one language and type, with a lazily built scoring pool."""
+
+    def __init__(self):
+        self.volunteers: Dict[UUID, IndexedVolunteer] = {}
+        self._snapshot: Optional[Tuple[List[IndexedVolunteer], CandidatePool]] = None
+
+    def put(self, volunteer: IndexedVolunteer) -> None:
+        self.volunteers[volunteer.user_id] = volunteer
+        self._snapshot = None
+
+    def discard(self, user_id: UUID) -> None:
+        if self.volunteers.pop(user_id, None) is not None:
+            self._snapshot = None
+
+    def snapshot(self) -> Tuple[List[IndexedVolunteer], CandidatePool]:
+        if self._snapshot is None:
+            volunteers = list(self.volunteers.values())
+            self._snapshot = (volunteers, CandidatePool([v.features for v in volunteers]))
+        return self._snapshot
+
+
+class VolunteerFeatureIndex:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(LOGGER_NAME("volunteer_index"))
+        self._lock = threading.RLock()
+        self._segments: Dict[Tuple[Language, str], _Segment] = {}
+        self._locations: Dict[UUID, Tuple[Language, str]] = {}
+        self._loaded_at: Optional[float] = None
+
+    def get_segments(self, db: Session, language: Language) -> Dict[str, Tuple[List[IndexedVolunteer], CandidatePool]]:
+        """
+        Get the volunteer pool for a language, keyed by volunteer type.
+        Loads (or reloads, once the TTL has passed) the whole index on demand.
+        :return: Mapping of volunteer type to (volunteers, pool) with aligned ordering
+        """
+        with self._lock:
+            if self._is_stale():
+                self._load(db)
+            return {
+                volunteer_type: self._segments[(language, volunteer_type)].snapshot()
+                for volunteer_type in VOLUNTEER_TYPES
+                if (language, volunteer_type) in self._segments
+            }
+
+    def refresh_user(self, db: Session, user_id) -> None:
+        """Re-read one user after a committed change, adding, moving or removing them as needed."""
+        user_id = UUID(str(user_id))
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            try:
+                rows = self._fetch_rows(db, user_id=user_id)
+                self._discard(user_id)
+                for user, user_data in rows:
+                    self._put(user, user_data)
+            except Exception as e:
+                # Never fail the caller's request; rebuild from scratch on next use instead
+                self.logger.error(f"Failed to refresh volunteer {user_id} in index: {str(e)}")
+                self.invalidate()
+
+    def remove_user(self, user_id) -> None:
+        """Drop a user from the index (e.g. after deletion)."""
+        with self._lock:
+            self._discard(UUID(str(user_id)))
+
+    def invalidate(self) -> None:
+        """Discard the index; it is rebuilt on the next matching request."""
+        with self._lock:
+            self._segments.clear()
+            self._locations.clear()
+            self._loaded_at = None
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    def _load(self, db: Session) -> None:
+        self._segments.clear()
+        self._locations.clear()
+        for user, user_data in self._fetch_rows(db):
+            self._put(user, user_data)
+        self._loaded_at = time.monotonic()
+        self.logger.info(f"Loaded {len(self._locations)} volunteers into the matching index")
+
+    def _fetch_rows(self, db: Session, user_id: Optional[UUID] = None) -> List[Tuple[User, UserData]]:
+        """Active, approved volunteers with intake data, optionally restricted to one user."""
+        query = (
+            db.query(User, UserData)
+            .join(User.role)
+            .join(UserData, User.id == UserData.user_id)
+            .options(
+                selectinload(UserData.treatments),
+                selectinload(UserData.experiences),
+                selectinload(UserData.loved_one_treatments),
+                selectinload(UserData.loved_one_experiences),
+            )
+            .filter(Role.name == UserRole.VOLUNTEER)
+            .filter(User.active)
+            .filter(User.approved)
+        )
+        if user_id is not None:
+            query = query.filter(User.id == user_id)
+        return query.all()
+
+    def _put(self, user: User, user_data: UserData) -> None:
+        features = CandidateFeatures.from_user_data(user_data)
+        key = (user.language, features.volunteer_type)
+        self._segments.setdefault(key, _Segment()).put(
+            IndexedVolunteer(
+                features=features,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                email=user.email,
+            )
+        )
+        self._locations[user.id] = key
+
+    def _discard(self, user_id: UUID) -> None:
+        key = self._locations.pop(user_id, None)
+        if key is not None:
+            self._segments[key].discard(user_id)
+
+
+volunteer_index = VolunteerFeatureIndex(ttl_seconds=float(os.getenv("VOLUNTEER_INDEX_TTL_SECONDS", "300")))
@@ -0,0 +1,189 @@
+"""
+Query-plan and latency benchmark for the hot lookup indexes (migration c4a9e2f1b7d3).
+
+Runs the application's most frequent lookups against a Postgres database with
+``EXPLAIN (ANALYZE, BUFFERS)`` twice in one transaction: first with the indexes declared on the
+models, then after dropping them. The transaction is rolled back, so the database is left as it
+was. The DROP INDEX takes exclusive locks on the tables until then: point this at a benchmark
+database, not a live one.
+
+The queries run against the synthetic users of ``python -m app.seeds.runner --scale N``;
+``--seed N`` (re)generates N of them first (see ``app.seeds.synthetic``).
+
+Reports the median execution time and the scans each query's plan used:
+
+    python -m benchmarks.index_queries [--database-url URL] [--seed 100000] [--repeat 5] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from app.models import Base
+from app.seeds.synthetic import SYNTHETIC_EMAIL_PATTERN, seed_synthetic_users
+
+load_dotenv()
+
+TABLES = ["users", "user_data", "matches", "availability_templates", "form_submissions", "tasks"]
+
+# The lookups the indexes are for, as the services issue them
+QUERIES = {
+    "principal_by_auth_id": """
+        SELECT users.id, roles.name FROM users LEFT OUTER JOIN roles ON users.role_id = roles.id
+        WHERE users.auth_id = :auth_id
+    """,
+    "user_data_by_user_id": "SELECT * FROM user_data WHERE user_id = :user_id",
+    "active_matches_for_participant": """
+        SELECT * FROM matches WHERE participant_id = :user_id AND deleted_at IS NULL
+    """,
+    "volunteer_active_match_counts": """
+        SELECT volunteer_id, count(id) FROM matches
+        WHERE volunteer_id = ANY(CAST(:volunteer_ids AS uuid[])) AND deleted_at IS NULL
+          AND match_status_id = ANY(:status_ids)
+        GROUP BY volunteer_id
+    """,
+    "confirmed_matches_sweep": "SELECT id FROM matches WHERE deleted_at IS NULL AND match_status_id = 2",
+    "active_availability_for_volunteer": """
+        SELECT * FROM availability_templates WHERE user_id = :volunteer_id AND is_active IS true
+    """,
+    "form_submissions_for_user": """
+        SELECT * FROM form_submissions WHERE user_id = :user_id AND form_id = :form_id
+    """,
+    "pending_tasks_for_assignee": """
+        SELECT * FROM tasks WHERE status = 'pending' AND assignee_id = :assignee_id
+    """,
+}
+
+
+def sample_params(connection: Connection) -> Dict[str, Any]:
+    """Parameters for QUERIES, taken from a random participant and volunteers"""
+    synthetic = {"email_pattern": SYNTHETIC_EMAIL_PATTERN}
+    participant = connection.execute(
+        text("SELECT id, auth_id FROM users WHERE email LIKE :email_pattern AND role_id = 1 ORDER BY random() LIMIT 1"),
+        synthetic,
+    ).one()
+    volunteer_ids = connection.scalars(
+        text("SELECT id FROM users WHERE email LIKE :email_pattern AND role_id = 2 ORDER BY random() LIMIT 50"),
+        synthetic,
+    ).all()
+    return {
+        "auth_id": participant.auth_id,
+        "user_id": participant.id,
+        "volunteer_id": volunteer_ids[0],
+        "volunteer_ids": volunteer_ids,
+        "status_ids": [1, 2, 6, 8, 9, 10],
+        "form_id": connection.scalar(
+            text("SELECT form_id FROM form_submissions WHERE user_id = :user_id LIMIT 1"), {"user_id": participant.id}
+        ),
+        "assignee_id": connection.scalar(
+            text("SELECT id FROM users WHERE email LIKE :email_pattern AND role_id = 3 LIMIT 1"), synthetic
+        ),
+    }
+
+
+def _scans(plan: Dict[str, Any]) -> List[str]:
+    scans = []
+    if "Scan" in plan["Node Type"]:
+        index = plan.get("Index Name")
+        scans.append(f"{plan['Node Type']} on {plan.get('Relation Name', '?')}" + (f" using {index}" if index else ""))
+    for child in plan.get("Plans", []):
+        scans.extend(_scans(child))
+    return scans
+
+
+def measure(connection: Connection, params: Dict[str, Any], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name, query in QUERIES.items():
+        timings = []
+        for _ in range(repeat + 1):  # the first run warms the cache and is not counted
+            (explained,) = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}"), params).scalar()
+            timings.append(explained["Execution Time"])
+        results[name] = {
+            "median_ms": round(statistics.median(timings[1:]), 3),
+            "scans": _scans(explained["Plan"]),
+            # Pages touched, from shared buffers or disk
+            "shared_blocks": explained["Plan"].get("Shared Hit Blocks", 0)
+            + explained["Plan"].get("Shared Read Blocks", 0),
+        }
+    return results
+
+
+def run(database_url: str, seed_users: int, repeat: int) -> Dict[str, Any]:
+    engine = create_engine(database_url)
+    indexes = [index for table in TABLES for index in Base.metadata.tables[table].indexes]
+    try:
+        if seed_users:
+            with Session(bind=engine) as session:
+                seed_synthetic_users(session, seed_users, verbose=False)
+            with engine.connect() as connection:
+                for table in TABLES:
+                    connection.execute(text(f"ANALYZE {table}"))
+                connection.commit()
+
+        with engine.connect() as connection:
+            params = sample_params(connection)
+            rows = {table: connection.scalar(text(f"SELECT count(*) FROM {table}")) for table in TABLES}
+
+            try:
+                # Also works before the migration has run: the indexes are created in this transaction
+                for index in indexes:
+                    connection.execute(CreateIndex(index, if_not_exists=True))
+                indexed = measure(connection, params, repeat)
+                for index in indexes:
+                    connection.execute(DropIndex(index))
+                unindexed = measure(connection, params, repeat)
+            finally:
+                connection.rollback()
+    finally:
+        engine.dispose()
+
+    return {
+        "benchmark": "index_queries",
+        "params": {"repeat": repeat, "rows": rows},
+        "queries": {
+            name: {
+                "without_indexes": unindexed[name],
+                "with_indexes": indexed[name],
+                "speedup": round(unindexed[name]["median_ms"] / max(indexed[name]["median_ms"], 0.001), 1),
+            }
+            for name in QUERIES
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("BENCHMARK_DATABASE_URL") or os.getenv("POSTGRES_DATABASE_URL"),
+        help="Defaults to BENCHMARK_DATABASE_URL, then POSTGRES_DATABASE_URL",
+    )
+    parser.add_argument("--seed", type=int, default=0, metavar="N", help="Generate N synthetic users first")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("no database URL: pass --database-url or set BENCHMARK_DATABASE_URL")
+
+    result = run(args.database_url, args.seed, args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2, default=str))
+        return
+    print("Rows: " + ", ".join(f"{table} {count}" for table, count in result["params"]["rows"].items()))
+    for name, stats in result["queries"].items():
+        before, after = stats["without_indexes"], stats["with_indexes"]
+        print(f"\n{name}: {before['median_ms']}ms -> {after['median_ms']}ms ({stats['speedup']}x)")
+        print(f"  without: {'; '.join(before['scans'])}")
+        print(f"  with:    {'; '.join(after['scans'])}")
+
+
+if __name__ == "__main__":
+    main()
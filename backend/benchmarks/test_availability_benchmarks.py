@@ -0,0 +1,31 @@
+"""Benchmarks for replacing and deleting volunteer availability (AvailabilityService)."""
+
+from datetime import time
+
+import pytest
+
+from app.schemas.availability import AvailabilityTemplateSlot, CreateAvailabilityRequest, DeleteAvailabilityRequest
+from app.services.implementations.availability_service import AvailabilityService
+
+pytestmark = pytest.mark.benchmark(group="availability")
+
+# A typical week: three evenings of two hours, i.e. 12 half-hour templates
+WEEK = [AvailabilityTemplateSlot(day_of_week=day, start_time=time(17), end_time=time(19)) for day in (0, 2, 4)]
+
+
+def test_create_availability(benchmark_scale, db, dataset, run):
+    service = AvailabilityService(db)
+    request = CreateAvailabilityRequest(user_id=dataset.volunteer_ids[-1], templates=WEEK)
+
+    benchmark_scale(lambda: run(service.create_availability(request)))
+
+
+def test_delete_availability(benchmark_scale, db, dataset, run):
+    service = AvailabilityService(db)
+    user_id = dataset.volunteer_ids[-1]
+
+    def recreate():
+        run(service.create_availability(CreateAvailabilityRequest(user_id=user_id, templates=WEEK)))
+        return (DeleteAvailabilityRequest(user_id=user_id, templates=WEEK),), {}
+
+    benchmark_scale.pedantic(lambda request: run(service.delete_availability(request)), setup=recreate, rounds=50)
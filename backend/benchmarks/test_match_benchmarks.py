@@ -0,0 +1,35 @@
+"""Benchmarks for match lookups and suggested times (MatchService)."""
+
+from itertools import cycle
+
+import pytest
+
+from app.models import Match, User
+from app.services.implementations.match_service import MatchService
+
+pytestmark = pytest.mark.benchmark(group="matches")
+
+
+def test_get_matches_for_participant(benchmark_scale, db, dataset, run):
+    service = MatchService(db)
+    participant_ids = cycle(dataset.matched_participant_ids)
+
+    def get_matches():
+        matches = run(service.get_matches_for_participant(next(participant_ids)))
+        db.expunge_all()
+        return matches
+
+    benchmark_scale(get_matches)
+
+
+def test_attach_initial_suggested_times(benchmark_scale, db, dataset):
+    service = MatchService(db)
+    volunteer_ids = cycle(dataset.volunteer_ids)
+    participant_id = dataset.participant_ids[0]
+
+    def new_match():
+        # A transient match: the time blocks are built but never written
+        volunteer = db.get(User, next(volunteer_ids))
+        return (Match(participant_id=participant_id, volunteer_id=volunteer.id), volunteer), {}
+
+    benchmark_scale.pedantic(service._attach_initial_suggested_times, setup=new_match, rounds=200)
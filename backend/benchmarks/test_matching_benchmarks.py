@@ -0,0 +1,53 @@
+"""Benchmarks for volunteer matching (MatchingService)."""
+
+from itertools import cycle
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.models import User, UserData
+from app.seeds.synthetic import SYNTHETIC_EMAIL_PATTERN
+from app.services.implementations.matching_service import MatchingService
+
+pytestmark = pytest.mark.benchmark(group="matching")
+
+# Volunteers scored per round by the match score benchmark
+SCORED_VOLUNTEERS = 200
+
+
+def test_get_matches(benchmark_scale, db, dataset, run):
+    service = MatchingService(db)
+    participant_ids = cycle(dataset.participant_ids)
+    run(service.get_matches(dataset.participant_ids[0]))  # build the volunteer index outside the timing
+
+    benchmark_scale(lambda: run(service.get_matches(next(participant_ids))))
+
+
+@pytest.mark.parametrize("page_size", [20, None], ids=["page", "all"])
+def test_get_admin_matches(benchmark_scale, db, dataset, run, page_size):
+    service = MatchingService(db)
+    participant_ids = cycle(dataset.participant_ids)
+    run(service.get_admin_matches(dataset.participant_ids[0], page_size=page_size))
+
+    benchmark_scale(lambda: run(service.get_admin_matches(next(participant_ids), page_size=page_size)))
+
+
+def test_calculate_match_score(benchmark_scale, db, dataset):
+    service = MatchingService(db)
+    participant_id = dataset.participant_ids[0]
+    participant_data = db.scalars(select(UserData).where(UserData.user_id == participant_id)).one()
+    preferences = service._get_user_preferences(participant_id)
+    volunteers = db.scalars(
+        select(UserData)
+        .join(User, User.id == UserData.user_id)
+        .where(User.role_id == 2, User.email.like(SYNTHETIC_EMAIL_PATTERN))
+        .options(selectinload(UserData.treatments), selectinload(UserData.experiences))
+        .options(selectinload(UserData.loved_one_treatments), selectinload(UserData.loved_one_experiences))
+        .limit(SCORED_VOLUNTEERS)
+    ).all()
+    benchmark_scale.extra_info["volunteers_per_round"] = len(volunteers)
+
+    benchmark_scale(
+        lambda: [service._calculate_match_score(participant_data, volunteer, preferences) for volunteer in volunteers]
+    )
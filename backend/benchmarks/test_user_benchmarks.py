@@ -0,0 +1,18 @@
+"""Benchmarks for the admin user directory (UserService)."""
+
+import pytest
+
+from app.services.implementations.user_service import UserService
+
+pytestmark = pytest.mark.benchmark(group="users")
+
+
+def test_get_users(benchmark_scale, db, run):
+    service = UserService(db)
+
+    def get_users():
+        users = run(service.get_users())
+        db.expunge_all()  # each request starts with an empty session
+        return users
+
+    benchmark_scale(get_users)
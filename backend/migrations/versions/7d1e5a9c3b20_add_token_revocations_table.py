@@ -0,0 +1,33 @@
+"""add token revocations table
+
+Revision ID: 7d1e5a9c3b20
+Revises: f2b8d4c61e09
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d1e5a9c3b20"
+down_revision: Union[str, None] = "f2b8d4c61e09"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_revocations",
+        sa.Column("auth_id", sa.Text(), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("auth_id"),
+    )
+    op.create_index("ix_token_revocations_revoked_at", "token_revocations", ["revoked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_token_revocations_revoked_at", table_name="token_revocations")
+    op.drop_table("token_revocations")
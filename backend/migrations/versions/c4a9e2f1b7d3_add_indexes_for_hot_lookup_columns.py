@@ -0,0 +1,56 @@
+"""add indexes for hot lookup columns
+
+Revision ID: c4a9e2f1b7d3
+Revises: ab35065726ef
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e2f1b7d3"
+down_revision: Union[str, None] = "ab35065726ef"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_MATCH = sa.text("deleted_at IS NULL")
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    # Every authenticated request resolves its user by auth_id
+    ("ix_users_auth_id", "users", ["auth_id"], None),
+    ("ix_user_data_user_id", "user_data", ["user_id"], None),
+    # A user's matches, including soft-deleted ones (deactivation, form reprocessing)
+    ("ix_matches_participant_id", "matches", ["participant_id"], None),
+    ("ix_matches_volunteer_id", "matches", ["volunteer_id"], None),
+    # Active matches: volunteer capacity counts and the match completion sweep by status
+    ("ix_matches_active_volunteer_id_status", "matches", ["volunteer_id", "match_status_id"], ACTIVE_MATCH),
+    ("ix_matches_active_status", "matches", ["match_status_id"], ACTIVE_MATCH),
+    ("ix_availability_templates_user_id_is_active", "availability_templates", ["user_id", "is_active"], None),
+    ("ix_form_submissions_user_id_form_id", "form_submissions", ["user_id", "form_id"], None),
+    ("ix_tasks_status_assignee_id", "tasks", ["status", "assignee_id"], None),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY builds without blocking writes to these tables, but cannot run in a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
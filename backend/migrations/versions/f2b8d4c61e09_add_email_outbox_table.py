@@ -0,0 +1,51 @@
+"""add email outbox table
+
+Revision ID: f2b8d4c61e09
+Revises: c4a9e2f1b7d3
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d4c61e09"
+down_revision: Union[str, None] = "c4a9e2f1b7d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("idempotency_key", sa.Text(), nullable=False),
+        sa.Column("to_email", sa.Text(), nullable=False),
+        sa.Column("source_email", sa.Text(), nullable=False),
+        sa.Column("template_name", sa.Text(), nullable=False),
+        sa.Column("template_data", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "sending", "sent", "failed", name="email_outbox_status_enum"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("message_id", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index("ix_email_outbox_status_next_attempt_at", "email_outbox", ["status", "next_attempt_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_status_next_attempt_at", table_name="email_outbox")
+    op.drop_table("email_outbox")
+    sa.Enum(name="email_outbox_status_enum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+import pytest
+
+from app.utilities.query_log import assert_query_budget
+from app.utilities.reference_data import reference_data
+from app.utilities.ses.ses_clients import ses_clients
+from app.utilities.token_cache import token_cache
+from app.utilities.volunteer_index import volunteer_index
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """Tests create and seed their own databases, so process-level caches must not leak between them."""
+    reference_data.invalidate()
+    volunteer_index.invalidate()
+    token_cache.invalidate()
+    ses_clients.invalidate()
+    yield
+    reference_data.invalidate()
+    volunteer_index.invalidate()
+    token_cache.invalidate()
+    ses_clients.invalidate()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail a block that issues too many statements or repeats one (a likely N+1):
+    ``with query_budget(max_queries=3): service.get_user(...)``
+    """
+    return assert_query_budget
@@ -0,0 +1,60 @@
+"""Unit tests for the global participant-volunteer assignment solver."""
+
+import itertools
+import random
+
+from app.utilities.assignment_solver import solve_assignment
+
+
+def _best_total(candidates, capacities):
+    """Brute-force the best total score over every capacity-respecting assignment."""
+    participants = list(candidates)
+    options = [[None] + [volunteer for volunteer, score in candidates[p] if score > 0] for p in participants]
+    best = 0.0
+    for choice in itertools.product(*options):
+        used = [volunteer for volunteer in choice if volunteer is not None]
+        if any(used.count(volunteer) > capacities.get(volunteer, 0) for volunteer in used):
+            continue
+        total = sum(
+            dict(candidates[p])[volunteer] for p, volunteer in zip(participants, choice) if volunteer is not None
+        )
+        best = max(best, total)
+    return best
+
+
+def test_solver_finds_maximum_weight_assignment():
+    rng = random.Random(42)
+    for _ in range(200):
+        volunteers = [f"v{i}" for i in range(rng.randint(1, 4))]
+        candidates = {
+            f"p{i}": [(v, rng.choice([0.0, 0.2, 0.5, 0.9, 1.0])) for v in volunteers if rng.random() < 0.7]
+            for i in range(rng.randint(1, 5))
+        }
+        capacities = {v: rng.randint(0, 2) for v in volunteers}
+
+        assignment = solve_assignment(candidates, capacities)
+
+        assigned = [volunteer for volunteer, _ in assignment.values()]
+        assert all(assigned.count(v) <= capacities[v] for v in assigned)
+        assert all(dict(candidates[p])[v] == score for p, (v, score) in assignment.items())
+        assert abs(sum(score for _, score in assignment.values()) - _best_total(candidates, capacities)) < 1e-9
+
+
+def test_solver_spreads_popular_volunteer_across_participants():
+    # Greedy matching would give "popular" to the first participant; the optimum gives it to "b"
+    candidates = {
+        "a": [("popular", 0.9), ("other", 0.8)],
+        "b": [("popular", 0.85), ("other", 0.1)],
+    }
+
+    assignment = solve_assignment(candidates, {"popular": 1, "other": 1})
+
+    assert assignment == {"a": ("other", 0.8), "b": ("popular", 0.85)}
+
+
+def test_solver_leaves_participants_without_capacity_unassigned():
+    candidates = {"a": [("v", 1.0)], "b": [("v", 0.5)], "c": [("w", 0.0)]}
+
+    assert solve_assignment(candidates, {"v": 1, "w": 3}) == {"a": ("v", 1.0)}
+    assert solve_assignment(candidates, {}) == {}
+    assert solve_assignment({}, {"v": 1}) == {}
@@ -1,6 +1,10 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import firebase_admin.auth
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -8,6 +12,7 @@ from fastapi.testclient import TestClient
 from app.middleware.auth import has_roles
 from app.middleware.auth_middleware import AuthMiddleware
 from app.schemas.user import UserRole
+from app.utilities.service_utils import get_auth_service
 
 # To test: public paths, protected routes, missing token, invalid token,
 # revoked token, expired token
@@ -200,3 +205,115 @@ def test_protected_route_expired_token():
 
         assert response.status_code == 401
         assert "Token has expired. Please reauthenticate." in response.json()["detail"]
+
+
+def test_repeated_requests_verify_token_once(mock_firebase):
+    """Requests reusing a token are served from the token cache instead of calling Firebase again."""
+    mock_verify, mock_get_user = mock_firebase
+    headers = {"Authorization": "Bearer valid_token"}
+
+    for _ in range(10):
+        assert client.get("/protected", headers=headers).status_code == 200
+
+    assert mock_verify.call_count == 1
+    assert mock_get_user.call_count == 1
+
+
+def _principal_client(user_row):
+    """Client for an app whose middleware resolves principals from a fake session returning `user_row`."""
+    db = MagicMock()
+    db.__enter__.return_value = db
+    db.query.return_value.outerjoin.return_value.filter.return_value.first.return_value = user_row
+    principal_app = FastAPI()
+    principal_app.add_middleware(AuthMiddleware, session_factory=lambda: db)
+
+    @principal_app.get("/admin")
+    async def principal_admin_route(authorized: bool = has_roles([UserRole.ADMIN])):
+        return {"message": "This is an admin-only route"}
+
+    auth_service = MagicMock(wraps=get_auth_service(user_service=MagicMock()))
+    principal_app.dependency_overrides[get_auth_service] = lambda: auth_service
+    return TestClient(principal_app), db, auth_service
+
+
+def test_has_roles_uses_principal_resolved_by_middleware(mock_firebase):
+    mock_verify, mock_get_user = mock_firebase
+    principal_client, db, auth_service = _principal_client((uuid4(), UserRole.ADMIN.value))
+
+    response = principal_client.get("/admin", headers={"Authorization": "Bearer valid_token"})
+
+    assert response.status_code == 200
+    assert mock_verify.call_count == 1
+    assert mock_get_user.call_count == 1
+    assert db.query.call_count == 1
+    auth_service.user_service.get_user_by_auth_id.assert_not_called()
+
+
+def test_has_roles_denies_principal_without_role(mock_firebase):
+    principal_client, _, _ = _principal_client((uuid4(), UserRole.VOLUNTEER.value))
+
+    response = principal_client.get("/admin", headers={"Authorization": "Bearer valid_token"})
+
+    assert response.status_code == 403
+
+
+def test_verify_email_grants_access_to_already_signed_in_session(mock_firebase):
+    _, mock_get_user = mock_firebase
+    mock_get_user.return_value = MagicMock(email_verified=False)
+    principal_client, _, _ = _principal_client((uuid4(), UserRole.ADMIN.value))
+    headers = {"Authorization": "Bearer unverified_token"}
+
+    assert principal_client.get("/admin", headers=headers).status_code == 403
+
+    user_service = MagicMock()
+    user_service.get_user_by_email.return_value = MagicMock(id=uuid4(), auth_id="test_user")
+    auth_service = get_auth_service(user_service=user_service)
+    with patch("firebase_admin.auth.update_user") as mock_update_user:
+        auth_service.verify_email("test@example.com")
+    mock_get_user.return_value = MagicMock(email_verified=True)
+
+    mock_update_user.assert_called_once_with("test_user", email_verified=True)
+    assert principal_client.get("/admin", headers=headers).status_code == 200
+
+
+@pytest.fixture
+def slow_firebase():
+    """Firebase verification that blocks its thread for 200ms, like a remote call."""
+
+    def slow_verify(token, check_revoked):
+        time.sleep(0.2)
+        return {"uid": f"uid-{token}", "email": "test@example.com"}
+
+    with (
+        patch("firebase_admin.auth.verify_id_token", side_effect=slow_verify) as mock_verify,
+        patch("firebase_admin.auth.get_user", return_value=MagicMock(email_verified=True)),
+    ):
+        yield mock_verify
+
+
+def _async_client():
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_with_same_token_share_one_verification(slow_firebase):
+    headers = {"Authorization": "Bearer shared_token"}
+    async with _async_client() as async_client:
+        responses = await asyncio.gather(*(async_client.get("/protected", headers=headers) for _ in range(10)))
+
+    assert [r.status_code for r in responses] == [200] * 10
+    assert slow_firebase.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_verification_does_not_block_event_loop(slow_firebase):
+    async with _async_client() as async_client:
+        protected = asyncio.create_task(async_client.get("/protected", headers={"Authorization": "Bearer slow_token"}))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        public = await async_client.get("/public")
+        public_latency = time.perf_counter() - started
+
+        assert public.status_code == 200
+        assert public_latency < 0.1
+        assert (await protected).status_code == 200
@@ -0,0 +1,82 @@
+"""Unit tests for database pool settings and telemetry (SQLite, no Postgres required)."""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import NullPool
+
+from app.utilities.db_pool import InstrumentedAsyncAdaptedQueuePool, PoolSettings, instrument_engine, pool_status
+
+
+@pytest.fixture
+def pool_env(monkeypatch):
+    for name in ["DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_MAX_CONNECTIONS", "WEB_CONCURRENCY", "DB_PGBOUNCER"]:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+def test_settings_read_from_environment(pool_env):
+    pool_env.setenv("DB_POOL_SIZE", "8")
+    pool_env.setenv("DB_POOL_PRE_PING", "false")
+
+    settings = PoolSettings.from_env()
+
+    assert settings.pool_size == 8
+    assert settings.max_overflow == 10
+    assert settings.pre_ping is False
+
+
+def test_connection_budget_is_split_across_workers(pool_env):
+    pool_env.setenv("DB_MAX_CONNECTIONS", "100")
+    pool_env.setenv("WEB_CONCURRENCY", "4")
+
+    settings = PoolSettings.from_env()
+
+    # 4 workers x 2 engines x (size + overflow) stays within 100 connections
+    assert (settings.pool_size, settings.max_overflow) == (6, 6)
+
+
+def test_pgbouncer_mode_disables_pooling_and_statement_caches(pool_env):
+    pool_env.setenv("DB_PGBOUNCER", "true")
+    settings = PoolSettings.from_env()
+
+    assert settings.engine_kwargs() == {"poolclass": NullPool}
+    async_kwargs = settings.engine_kwargs(is_async=True)
+    assert async_kwargs["connect_args"]["statement_cache_size"] == 0
+    assert async_kwargs["connect_args"]["prepared_statement_cache_size"] == 0
+    assert PoolSettings().engine_kwargs(is_async=True)["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+
+
+def test_pool_status_reports_occupancy_and_counters():
+    settings = PoolSettings(pool_size=1, max_overflow=0, timeout=0.05)
+    engine = create_engine("sqlite://", **settings.engine_kwargs())
+    instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        busy = pool_status(engine)
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    status = pool_status(engine)
+    assert busy["checked_out"] == 1
+    assert status["checked_out"] == 0
+    assert status["checked_in"] == 1
+    assert status["checkouts"] == 1
+    assert status["connections_opened"] == 1
+    assert status["checkout_timeouts"] == 1
+    assert status["checkout_wait_ms"]["max"] >= 50
+
+
+def test_stats_survive_engine_dispose():
+    engine = create_engine("sqlite://", **PoolSettings().engine_kwargs())
+    stats = instrument_engine(engine)
+    with engine.connect():
+        pass
+
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert engine.pool.stats is stats
+    assert pool_status(engine)["checkouts"] == 2
+    assert pool_status(engine)["connections_closed"] == 1
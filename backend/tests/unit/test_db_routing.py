@@ -0,0 +1,107 @@
+"""
+Unit tests for read-replica routing in db_utils.
+
+Uses two SQLite databases as primary and replica by default; set POSTGRES_TEST_DATABASE_URL and
+POSTGRES_TEST_REPLICA_DATABASE_URL to run them against two Postgres databases instead. The two
+databases are not replicated, so each query's result shows which one served it.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.utilities.db_utils import RequestRouting, RoutingSession
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = "routing_test_notes"
+
+    id = Column(Integer, primary_key=True)
+    body = Column(String, nullable=False)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary_url = os.getenv("POSTGRES_TEST_DATABASE_URL")
+    replica_url = os.getenv("POSTGRES_TEST_REPLICA_DATABASE_URL")
+    if not (primary_url and replica_url):
+        primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+        replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    primary = create_engine(primary_url)
+    replica = create_engine(replica_url)
+    for engine, body in ((primary, "primary"), (replica, "replica")):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(Note.__table__.insert(), {"id": 1, "body": body})
+
+    yield primary, replica
+
+    for engine in (primary, replica):
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def _session_factory(primary, replica):
+    return sessionmaker(class_=RoutingSession, autoflush=False, primary=primary, replica=replica)
+
+
+def test_selects_are_served_by_the_replica(engines):
+    session_factory = _session_factory(*engines)
+
+    with session_factory(info={"routing": RequestRouting()}) as db:
+        assert db.scalar(select(Note.body).where(Note.id == 1)) == "replica"
+        assert db.get(Note, 1).body == "replica"
+
+
+def test_reads_after_a_write_go_to_the_primary(engines):
+    session_factory = _session_factory(*engines)
+    routing = RequestRouting()
+
+    with session_factory(info={"routing": routing}) as db:
+        db.add(Note(id=2, body="new"))
+        db.commit()
+
+        assert routing.wrote
+        assert db.scalar(select(Note.body).where(Note.id == 2)) == "new"
+        assert db.scalar(select(Note.body).where(Note.id == 1)) == "primary"
+
+
+def test_write_in_one_session_pins_the_requests_other_sessions(engines):
+    session_factory = _session_factory(*engines)
+    routing = RequestRouting()
+
+    with session_factory(info={"routing": routing}) as reader:
+        assert reader.scalar(select(Note.body)) == "replica"
+        with session_factory(info={"routing": routing}) as writer:
+            writer.execute(Note.__table__.update().values(body="updated"))
+            writer.commit()
+
+        assert reader.scalar(select(Note.body)) == "updated"
+
+    # A new request starts on the replica again
+    with session_factory(info={"routing": RequestRouting()}) as db:
+        assert db.scalar(select(Note.body)) == "replica"
+
+
+def test_locking_and_textual_statements_use_the_primary(engines):
+    session_factory = _session_factory(*engines)
+
+    with session_factory(info={"routing": RequestRouting()}) as db:
+        if db.primary.dialect.name != "sqlite":
+            # SQLite has no FOR UPDATE; the routing decision is the same either way
+            assert db.scalar(select(Note.body).with_for_update()) == "primary"
+        assert db.get_bind(clause=select(Note).with_for_update()) is db.primary
+        assert db.execute(text("SELECT body FROM routing_test_notes")).scalar() == "primary"
+
+
+def test_without_a_replica_everything_uses_the_primary(engines):
+    primary, _ = engines
+    session_factory = _session_factory(primary, None)
+
+    with session_factory(info={"routing": RequestRouting()}) as db:
+        assert db.scalar(select(Note.body)) == "primary"
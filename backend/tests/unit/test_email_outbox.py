@@ -0,0 +1,315 @@
+"""Unit tests for the transactional email outbox and its dispatcher, with a fake SES client."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from botocore.exceptions import ClientError
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from app.models import EmailOutbox, EmailOutboxStatus
+from app.services.implementations.email_outbox_dispatcher import EmailOutboxDispatcher
+from app.utilities.email_outbox import OutboxEmailService
+from app.utilities.ses_email_service import SESEmailService, TemplatedEmail
+
+# Errors that fail a whole SES call rather than one destination of a bulk send
+CALL_ERROR_CODES = {"Throttling", "ServiceUnavailable"}
+
+
+class FakeSESClient:
+    """Records sends; ``errors`` maps a recipient to the SES error codes its next sends raise."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.sent = []
+        self.bulk_calls = []
+        self.verified = []
+        self.errors = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def send_templated_email(self, Source, Destination, Template, TemplateData):
+        to_email = Destination["ToAddresses"][0]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.errors.get(to_email):
+                code = self.errors[to_email].pop(0)
+                raise ClientError({"Error": {"Code": code, "Message": code}}, "SendTemplatedEmail")
+            self.sent.append((to_email, Template))
+            return {"MessageId": f"message-{len(self.sent)}"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def send_bulk_templated_email(self, Source, Template, DefaultTemplateData, Destinations):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            self.bulk_calls.append((Template, Source, len(Destinations)))
+            errors = [self._next_error(destination["Destination"]["ToAddresses"][0]) for destination in Destinations]
+            for code in errors:
+                if code in CALL_ERROR_CODES:
+                    raise ClientError({"Error": {"Code": code, "Message": code}}, "SendBulkTemplatedEmail")
+            statuses = []
+            for destination, code in zip(Destinations, errors):
+                if code:
+                    message = "Email address is not verified." if code == "MessageRejected" else code
+                    statuses.append({"Status": code, "Error": message})
+                else:
+                    self.sent.append((destination["Destination"]["ToAddresses"][0], Template))
+                    statuses.append({"Status": "Success", "MessageId": f"message-{len(self.sent)}"})
+            return {"Status": statuses}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _next_error(self, to_email):
+        with self._lock:
+            return self.errors[to_email].pop(0) if self.errors.get(to_email) else None
+
+    def verify_email_identity(self, EmailAddress):
+        self.verified.append(EmailAddress)
+        return {}
+
+
+class FakeSESEmailService(SESEmailService):
+    def __init__(self, client):
+        self.client = client
+        super().__init__()
+
+    def _create_client(self):
+        return self.client
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}", connect_args={"check_same_thread": False})
+    EmailOutbox.__table__.create(engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def ses():
+    return FakeSESClient()
+
+
+@pytest.fixture
+def dispatcher(session_factory, ses):
+    dispatcher = EmailOutboxDispatcher(
+        session_factory=session_factory,
+        email_service_factory=lambda: FakeSESEmailService(ses),
+        concurrency=2,
+        batch_size=5,
+        max_attempts=3,
+    )
+    yield dispatcher
+    dispatcher.shutdown()
+
+
+def _queue(session_factory, recipients, event_key="test", language="fr"):
+    with session_factory() as db:
+        outbox = OutboxEmailService(db, event_key=event_key)
+        for to_email in recipients:
+            outbox.send_intake_form_confirmation_email(to_email=to_email, first_name="Sam", language=language)
+        db.commit()
+
+
+def _rows(session_factory):
+    with session_factory() as db:
+        return {row.to_email: row for row in db.query(EmailOutbox).all()}
+
+
+def _make_due(session_factory):
+    with session_factory() as db:
+        db.execute(update(EmailOutbox).values(next_attempt_at=datetime.now(timezone.utc) - timedelta(seconds=1)))
+        db.commit()
+
+
+def test_emails_are_only_queued_when_the_transaction_commits(session_factory, ses):
+    with session_factory() as db:
+        OutboxEmailService(db, event_key="rolled-back").send_intake_form_confirmation_email(
+            to_email="rolled-back@example.com"
+        )
+        db.rollback()
+    _queue(session_factory, ["a@example.com"])
+
+    rows = _rows(session_factory)
+    assert list(rows) == ["a@example.com"]
+    assert rows["a@example.com"].template_name == "IntakeFormConfirmationFr"
+    assert rows["a@example.com"].status == EmailOutboxStatus.PENDING
+    assert ses.sent == []
+
+
+def test_same_event_is_queued_once(session_factory):
+    _queue(session_factory, ["a@example.com", "a@example.com"], event_key="match-1-created")
+    _queue(session_factory, ["a@example.com", "b@example.com"], event_key="match-1-created")
+
+    assert sorted(_rows(session_factory)) == ["a@example.com", "b@example.com"]
+
+
+def test_failed_enqueue_in_a_savepoint_keeps_the_transaction(session_factory):
+    with session_factory() as db:
+        OutboxEmailService(db, event_key="kept").send_intake_form_confirmation_email(to_email="a@example.com")
+        with pytest.raises(RuntimeError), db.begin_nested():
+            OutboxEmailService(db, event_key="failed").send_intake_form_confirmation_email(to_email="b@example.com")
+            raise RuntimeError("template data unavailable")
+        db.commit()
+
+    assert list(_rows(session_factory)) == ["a@example.com"]
+
+
+def test_queueing_needs_an_event_key(session_factory):
+    with session_factory() as db, pytest.raises(ValueError):
+        OutboxEmailService(db, event_key="")
+
+
+def test_dispatch_sends_every_due_email_with_bounded_concurrency(session_factory, dispatcher, ses):
+    ses.delay = 0.02
+    recipients = [f"user{i}@example.com" for i in range(12)]
+    _queue(session_factory, recipients[:6], language="en")
+    _queue(session_factory, recipients[6:], language="fr")
+
+    assert dispatcher.dispatch_pending() == {"sent": 12}
+
+    assert sorted(to_email for to_email, _ in ses.sent) == sorted(recipients)
+    assert ses.max_in_flight <= 2
+    rows = _rows(session_factory).values()
+    assert {row.status for row in rows} == {EmailOutboxStatus.SENT}
+    assert all(row.message_id and row.sent_at for row in rows)
+    assert all(row.template_data == {} for row in rows)
+    assert dispatcher.dispatch_pending() == {}
+
+
+def test_dispatch_sends_one_bulk_call_per_template_language_and_50_recipients(session_factory, ses):
+    dispatcher = EmailOutboxDispatcher(
+        session_factory=session_factory, email_service_factory=lambda: FakeSESEmailService(ses), batch_size=200
+    )
+    _queue(session_factory, [f"fr{i}@example.com" for i in range(60)], language="fr")
+    _queue(session_factory, [f"en{i}@example.com" for i in range(3)], language="en")
+
+    assert dispatcher.dispatch_pending() == {"sent": 63}
+    dispatcher.shutdown()
+
+    assert sorted((template, size) for template, _, size in ses.bulk_calls) == [
+        ("IntakeFormConfirmationEn", 3),
+        ("IntakeFormConfirmationFr", 10),
+        ("IntakeFormConfirmationFr", 50),
+    ]
+    assert len(ses.sent) == 63
+
+
+def test_throttled_email_is_retried_after_backoff(session_factory, dispatcher, ses):
+    ses.errors["a@example.com"] = ["Throttling"]
+    _queue(session_factory, ["a@example.com"])
+
+    assert dispatcher.dispatch_pending() == {"retry": 1}
+    row = _rows(session_factory)["a@example.com"]
+    assert row.status == EmailOutboxStatus.PENDING
+    assert row.attempts == 1
+    assert row.last_error == "Throttling"
+    # Not due again until the backoff has passed
+    assert dispatcher.dispatch_pending() == {}
+
+    _make_due(session_factory)
+    assert dispatcher.dispatch_pending() == {"sent": 1}
+    assert _rows(session_factory)["a@example.com"].attempts == 2
+
+
+def test_retries_stop_after_max_attempts(session_factory, dispatcher, ses):
+    ses.errors["a@example.com"] = ["ServiceUnavailable"] * 3
+    _queue(session_factory, ["a@example.com"])
+
+    for _ in range(3):
+        dispatcher.dispatch_pending()
+        _make_due(session_factory)
+
+    row = _rows(session_factory)["a@example.com"]
+    assert row.status == EmailOutboxStatus.FAILED
+    assert row.attempts == 3
+    assert ses.sent == []
+
+
+def test_rejected_email_is_not_retried(session_factory, dispatcher, ses):
+    ses.errors["a@example.com"] = ["MessageRejected"]
+    _queue(session_factory, ["a@example.com", "b@example.com"])
+
+    assert dispatcher.dispatch_pending() == {"sent": 1, "failed": 1}
+    assert len(ses.bulk_calls) == 1
+    row = _rows(session_factory)["a@example.com"]
+    assert row.status == EmailOutboxStatus.FAILED
+    assert row.last_error == "MessageRejected: Email address is not verified."
+    # In the sandbox, an unverified recipient is asked to verify
+    assert ses.verified == ["a@example.com"]
+
+
+def test_bulk_send_returns_one_result_per_email_in_order(ses):
+    ses.errors["b@example.com"] = ["MessageRejected"]
+    emails = [
+        TemplatedEmail("a@example.com", "IntakeFormConfirmationEn", {"first_name": "A"}),
+        TemplatedEmail("b@example.com", "IntakeFormConfirmationFr", {"first_name": "B"}),
+        TemplatedEmail("c@example.com", "IntakeFormConfirmationEn", {"first_name": "C"}),
+    ]
+
+    results = FakeSESEmailService(ses).send_bulk_templated_emails(emails)
+
+    assert [result.email.to_email for result in results] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert [result.message_id is not None for result in results] == [True, False, True]
+    assert results[1].error_code == "MessageRejected" and not results[1].retryable
+    assert len(ses.bulk_calls) == 2
+
+
+def test_email_left_sending_by_a_dead_dispatcher_is_taken_over_after_its_lease(session_factory, dispatcher, ses):
+    _queue(session_factory, ["a@example.com"])
+    with session_factory() as db:
+        db.execute(
+            update(EmailOutbox).values(
+                status=EmailOutboxStatus.SENDING,
+                attempts=1,
+                locked_until=datetime.now(timezone.utc) + timedelta(minutes=5),
+            )
+        )
+        db.commit()
+
+    assert dispatcher.dispatch_pending() == {}
+
+    with session_factory() as db:
+        db.execute(update(EmailOutbox).values(locked_until=datetime.now(timezone.utc) - timedelta(seconds=1)))
+        db.commit()
+    assert dispatcher.dispatch_pending() == {"sent": 1}
+
+
+def test_emails_stay_queued_while_ses_is_not_configured(session_factory):
+    dispatcher = EmailOutboxDispatcher(
+        session_factory=session_factory, email_service_factory=lambda: FakeSESEmailService(None)
+    )
+    _queue(session_factory, ["a@example.com"])
+
+    assert dispatcher.dispatch_pending() == {}
+    assert _rows(session_factory)["a@example.com"].status == EmailOutboxStatus.PENDING
+    dispatcher.shutdown()
+
+
+def test_purge_deletes_only_old_sent_and_failed_emails(session_factory, dispatcher, ses):
+    ses.errors["failed@example.com"] = ["MessageRejected"]
+    _queue(session_factory, ["old@example.com", "failed@example.com", "recent@example.com"])
+    dispatcher.dispatch_pending()
+    _queue(session_factory, ["pending@example.com"])
+    with session_factory() as db:
+        db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.to_email != "recent@example.com")
+            .values(created_at=datetime.now(timezone.utc) - timedelta(days=31))
+        )
+        db.commit()
+
+    assert dispatcher.purge_expired() == 2
+    assert sorted(_rows(session_factory)) == ["pending@example.com", "recent@example.com"]
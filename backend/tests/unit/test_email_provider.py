@@ -34,7 +34,7 @@ def provider(monkeypatch, fake_ses_client):
     # Patch boto3.client so that when AmazonSESEmailProvider is instantiated,
     # it uses our fake SES client.
     monkeypatch.setattr(
-        "app.services.email.amazon_ses_provider.boto3.client",
+        "app.utilities.ses.ses_clients.boto3.client",
         lambda service, **kwargs: fake_ses_client,
     )
 
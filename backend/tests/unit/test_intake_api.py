@@ -166,7 +166,7 @@ def override_dependencies(session: FakeSession, authorized: bool = True):
         yield session
 
     class DummyAuthService:
-        def is_authorized_by_role(self, token, roles):
+        def is_authorized_by_role(self, token, roles, principal=None):
             return authorized
 
     app.dependency_overrides[get_db] = _override_db
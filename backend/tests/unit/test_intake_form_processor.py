@@ -12,6 +12,7 @@ from app.models.User import FormStatus, Language, User
 from app.models.UserData import UserData
 from app.schemas.user import UserRole
 from app.services.implementations.intake_form_processor import IntakeFormProcessor
+from app.utilities.query_log import capture_queries
 
 # Test DB Configuration - Use SQLite with UUID handling fixes
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_intake.db"
@@ -1462,3 +1463,41 @@ def test_boundary_date_values(db_session, test_user):
     except Exception:
         db_session.rollback()
         raise
+
+
+def test_resubmission_only_writes_changed_links(db_session, test_user):
+    """Resubmitting with different treatments deletes and inserts only the links that changed"""
+    processor = IntakeFormProcessor(db_session)
+    form_data = {
+        "form_type": "participant",
+        "has_blood_cancer": "yes",
+        "caring_for_someone": "no",
+        "personal_info": {
+            "first_name": "John",
+            "last_name": "Doe",
+            "date_of_birth": "15/03/1985",
+            "phone_number": "555-123-4567",
+            "city": "Toronto",
+            "province": "Ontario",
+            "postal_code": "M1A 1A1",
+        },
+        "cancer_experience": {
+            "diagnosis": "Leukemia",
+            "date_of_diagnosis": "01/01/2023",
+            "treatments": ["Chemotherapy", "Transfusions", "Radiation"],
+            "experiences": ["Anxiety", "Fatigue"],
+        },
+    }
+    processor.process_form_submission(str(test_user.id), form_data)
+
+    form_data["cancer_experience"]["treatments"] = ["Chemotherapy", "Radiation", "CAR-T", "Not A Treatment"]
+    with capture_queries() as query_log:
+        user_data = processor.process_form_submission(str(test_user.id), form_data)
+
+    writes = [shape for shape in query_log.shapes if shape.startswith(("INSERT INTO user_", "DELETE FROM user_"))]
+    assert sorted(writes) == [
+        "DELETE FROM user_treatments WHERE user_treatments.user_data_id = ? AND user_treatments.treatment_id IN (?)",
+        "INSERT INTO user_treatments (user_data_id, treatment_id) VALUES (?)",
+    ]
+    assert sorted(t.name for t in user_data.treatments) == ["CAR-T", "Chemotherapy", "Radiation"]
+    assert sorted(e.name for e in user_data.experiences) == ["Anxiety", "Fatigue"]
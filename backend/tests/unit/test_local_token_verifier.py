@@ -0,0 +1,219 @@
+"""Unit tests for local Firebase ID token verification, signed with a locally generated keypair."""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import firebase_admin.auth
+import jwt
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import TokenRevocation
+from app.utilities.local_token_verifier import (
+    MAX_TOKEN_LIFETIME_SECONDS,
+    GooglePublicKeys,
+    LocalTokenVerifier,
+    RevokedUids,
+)
+from app.utilities.token_cache import TokenVerificationCache
+
+PROJECT_ID = "llsc-test"
+POSTGRES_TEST_DATABASE_URL = os.getenv("POSTGRES_TEST_DATABASE_URL")
+
+
+def _keypair():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.system.gserviceaccount.com")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(private_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(private_key, hashes.SHA256())
+    )
+    return private_key, certificate.public_bytes(serialization.Encoding.PEM).decode()
+
+
+@pytest.fixture(scope="module")
+def signing_keys():
+    return {"key-1": _keypair(), "key-2": _keypair()}
+
+
+@pytest.fixture
+def certs(signing_keys):
+    """The certificates the fake Google endpoint currently publishes, and how often it was hit."""
+    return {"published": {"key-1": signing_keys["key-1"][1]}, "fetches": 0}
+
+
+@pytest.fixture
+def verifier(certs):
+    def fetch():
+        certs["fetches"] += 1
+        return dict(certs["published"]), 3600.0
+
+    return LocalTokenVerifier(keys=GooglePublicKeys(fetch=fetch), revoked=RevokedUids(), project_id=PROJECT_ID)
+
+
+def _token(signing_keys, kid="key-1", **overrides):
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "firebase-uid",
+        "iat": now - 10,
+        "auth_time": now - 10,
+        "exp": now + 3600,
+        "email": "user@example.com",
+        "email_verified": True,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, signing_keys[kid][0], algorithm="RS256", headers={"kid": kid})
+
+
+def test_valid_token_is_verified_locally(verifier, signing_keys):
+    claims = verifier.verify(_token(signing_keys))
+
+    assert claims["uid"] == "firebase-uid"
+    assert claims["email"] == "user@example.com"
+
+
+def test_certificates_are_fetched_once(verifier, signing_keys, certs):
+    for _ in range(5):
+        verifier.verify(_token(signing_keys))
+
+    assert certs["fetches"] == 1
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "other-project"},
+        {"iss": "https://securetoken.google.com/other-project"},
+        {"sub": ""},
+        {"auth_time": int(time.time()) + 3600},
+    ],
+)
+def test_tokens_with_invalid_claims_are_rejected(verifier, signing_keys, overrides):
+    with pytest.raises(firebase_admin.auth.InvalidIdTokenError):
+        verifier.verify(_token(signing_keys, **overrides))
+
+
+def test_expired_token_is_rejected(verifier, signing_keys):
+    with pytest.raises(firebase_admin.auth.ExpiredIdTokenError):
+        verifier.verify(_token(signing_keys, exp=int(time.time()) - 1))
+
+
+def test_token_signed_with_another_key_is_rejected(verifier, signing_keys):
+    # Signed by key-2 but claiming key-1's id
+    forged = jwt.encode(
+        jwt.decode(_token(signing_keys), options={"verify_signature": False}),
+        signing_keys["key-2"][0],
+        algorithm="RS256",
+        headers={"kid": "key-1"},
+    )
+
+    with pytest.raises(firebase_admin.auth.InvalidIdTokenError):
+        verifier.verify(forged)
+
+
+def test_rotated_key_is_picked_up_once_published(verifier, signing_keys, certs):
+    verifier.verify(_token(signing_keys))
+    verifier.keys.min_refresh_seconds = 0
+    certs["published"]["key-2"] = signing_keys["key-2"][1]
+
+    assert verifier.verify(_token(signing_keys, kid="key-2"))["uid"] == "firebase-uid"
+    assert certs["fetches"] == 2
+
+
+def test_unknown_key_id_does_not_refetch_within_min_interval(verifier, signing_keys, certs):
+    verifier.verify(_token(signing_keys))
+
+    with pytest.raises(firebase_admin.auth.InvalidIdTokenError):
+        verifier.verify(_token(signing_keys, kid="key-2"))
+    assert certs["fetches"] == 1
+
+
+def test_failed_refresh_keeps_serving_cached_keys(verifier, signing_keys):
+    verifier.verify(_token(signing_keys))
+
+    def failing_fetch():
+        raise ConnectionError("googleapis.com unreachable")
+
+    verifier.keys.fetch = failing_fetch
+    verifier.keys.refresh()
+
+    assert verifier.verify(_token(signing_keys))["uid"] == "firebase-uid"
+
+
+def test_tokens_issued_before_revocation_are_rejected(verifier, signing_keys):
+    issued_at = int(time.time()) - 10
+    verifier.revoked.revoke("firebase-uid", revoked_at=issued_at + 1)
+
+    with pytest.raises(firebase_admin.auth.RevokedIdTokenError):
+        verifier.verify(_token(signing_keys, iat=issued_at))
+    assert verifier.verify(_token(signing_keys, iat=issued_at + 1))["uid"] == "firebase-uid"
+
+
+@pytest.fixture
+def revocation_sessions():
+    engine = create_engine(POSTGRES_TEST_DATABASE_URL)
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM token_revocations"))
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.mark.skipif(not POSTGRES_TEST_DATABASE_URL, reason="POSTGRES_TEST_DATABASE_URL not set")
+def test_revocations_are_shared_between_processes(revocation_sessions):
+    issued_at = int(time.time()) - 10
+    worker_a, worker_b = RevokedUids(revocation_sessions), RevokedUids(revocation_sessions)
+
+    worker_a.revoke("firebase-uid", revoked_at=issued_at + 1)
+    assert not worker_b.is_revoked("firebase-uid", issued_at)
+
+    worker_b.refresh()
+    assert worker_b.is_revoked("firebase-uid", issued_at)
+    # A restarted process loads it too
+    restarted = RevokedUids(revocation_sessions)
+    restarted.refresh()
+    assert restarted.is_revoked("firebase-uid", issued_at)
+
+
+@pytest.mark.skipif(not POSTGRES_TEST_DATABASE_URL, reason="POSTGRES_TEST_DATABASE_URL not set")
+def test_revocations_keep_the_latest_time_and_expire_with_the_tokens(revocation_sessions):
+    now = int(time.time())
+    revoked = RevokedUids(revocation_sessions)
+    revoked.revoke("firebase-uid", revoked_at=now)
+    revoked.revoke("firebase-uid", revoked_at=now - 5)
+    revoked.revoke("old-uid", revoked_at=now - MAX_TOKEN_LIFETIME_SECONDS - 10)
+
+    revoked.refresh()
+
+    assert revoked.is_revoked("firebase-uid", now - 1)
+    assert not revoked.is_revoked("old-uid", now - MAX_TOKEN_LIFETIME_SECONDS - 20)
+    with revocation_sessions() as db:
+        assert [row.auth_id for row in db.query(TokenRevocation).all()] == ["firebase-uid"]
+
+
+def test_token_cache_uses_local_verifier_without_firebase_calls(verifier, signing_keys, monkeypatch):
+    def remote_call(*args, **kwargs):
+        raise AssertionError("Firebase admin API should not be called")
+
+    monkeypatch.setattr(firebase_admin.auth, "verify_id_token", remote_call)
+    monkeypatch.setattr(firebase_admin.auth, "get_user", remote_call)
+    cache = TokenVerificationCache(revocation_check_seconds=60, max_entries=10, local_verifier=verifier)
+
+    verified = cache.verify(_token(signing_keys, email_verified=False))
+
+    assert verified.uid == "firebase-uid"
+    assert verified.email_verified is False
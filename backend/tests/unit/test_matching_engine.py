@@ -0,0 +1,203 @@
+"""Unit tests for the vectorized matching engine.
+
+The engine must return exactly the scores produced by
+MatchingService._calculate_match_score, so these tests compare the two on
+randomly generated participants, volunteers and preference lists.
+"""
+
+import pickle
+import random
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.models import Experience, Quality, Treatment, UserData
+from app.services.implementations.matching_service import MatchingService
+from app.utilities import matching_engine
+from app.utilities.matching_engine import (
+    CandidateFeatures,
+    CandidatePool,
+    ParticipantProfile,
+    detach_preferences,
+    pickle_pool,
+    rank_batch,
+    rank_batch_in_worker,
+    rank_candidates,
+)
+
+QUALITY_SLUGS = [
+    "same_age",
+    "same_gender_identity",
+    "same_ethnic_or_cultural_group",
+    "same_marital_status",
+    "same_parental_status",
+    "same_diagnosis",
+]
+TREATMENTS = [Treatment(id=i, name=name) for i, name in enumerate(["Chemotherapy", "Radiation", "CAR-T", "Unknown"])]
+EXPERIENCES = [Experience(id=i, name=name) for i, name in enumerate(["Fatigue", "Anxiety", "Relapse"])]
+QUALITIES = [Quality(id=i, slug=slug, label=slug) for i, slug in enumerate(QUALITY_SLUGS)]
+
+GENDERS = [None, "Woman", "woman ", "Man", "Non-binary"]
+DIAGNOSES = [None, "CLL", "cll", "AML", "Hodgkin Lymphoma"]
+MARITAL = [None, "Single", "Married", "married"]
+YES_NO = [None, "Yes", "No", "yes"]
+AGES = [None, "", "0", "34", " 45 ", "60", "abc", "30-40"]
+ETHNIC = [None, [], ["Asian"], ["asian ", "Black"], "Black", ["Indigenous", ""]]
+
+
+def _random_user_data(rng: random.Random) -> UserData:
+    dob = rng.choice([None, date(1960, 5, 1), date(1985, 12, 31), date(2000, 1, 1), date(date.today().year, 1, 1)])
+    return UserData(
+        user_id=uuid4(),
+        gender_identity=rng.choice(GENDERS),
+        diagnosis=rng.choice(DIAGNOSES),
+        marital_status=rng.choice(MARITAL),
+        has_kids=rng.choice(YES_NO),
+        date_of_birth=dob,
+        ethnic_group=rng.choice(ETHNIC),
+        has_blood_cancer=rng.choice(YES_NO),
+        caring_for_someone=rng.choice(YES_NO),
+        loved_one_gender_identity=rng.choice(GENDERS),
+        loved_one_diagnosis=rng.choice(DIAGNOSES),
+        loved_one_age=rng.choice(AGES),
+        treatments=rng.sample(TREATMENTS, rng.randint(0, 3)),
+        experiences=rng.sample(EXPERIENCES, rng.randint(0, 2)),
+        loved_one_treatments=rng.sample(TREATMENTS, rng.randint(0, 2)),
+        loved_one_experiences=rng.sample(EXPERIENCES, rng.randint(0, 2)),
+    )
+
+
+def _random_preferences(rng: random.Random) -> list:
+    preferences = []
+    for rank in range(1, rng.randint(1, 6)):
+        kind = rng.choice(["quality", "treatment", "experience"])
+        obj = rng.choice({"quality": QUALITIES, "treatment": TREATMENTS, "experience": EXPERIENCES}[kind])
+        preferences.append(
+            {
+                "target_role": rng.choice(["patient", "caregiver"]),
+                "kind": kind,
+                "scope": rng.choice(["self", "loved_one"]),
+                "rank": rank,
+                "object": obj,
+            }
+        )
+    return preferences
+
+
+@pytest.fixture
+def matching_service():
+    return MatchingService(db=None)
+
+
+def test_engine_matches_reference_scores(matching_service):
+    rng = random.Random(1234)
+    volunteers = [_random_user_data(rng) for _ in range(150)]
+    pool = CandidatePool([CandidateFeatures.from_user_data(v) for v in volunteers])
+
+    for _ in range(300):
+        participant = _random_user_data(rng)
+        preferences = _random_preferences(rng)
+
+        scores = pool.score(participant, preferences).tolist()
+        expected = [matching_service._calculate_match_score(participant, v, preferences) for v in volunteers]
+
+        assert scores == expected
+
+
+def test_engine_handles_empty_pool():
+    pool = CandidatePool([])
+    participant = UserData(has_blood_cancer="yes", caring_for_someone="no")
+    preferences = [{"target_role": "patient", "kind": "quality", "scope": "self", "rank": 1, "object": QUALITIES[1]}]
+
+    assert pool.score(participant, preferences).tolist() == []
+
+
+def test_engine_scores_zero_without_applicable_preferences():
+    rng = random.Random(7)
+    volunteers = [_random_user_data(rng) for _ in range(10)]
+    pool = CandidatePool([CandidateFeatures.from_user_data(v) for v in volunteers])
+    # A patient participant with only caregiver preferences has no applicable case
+    participant = UserData(has_blood_cancer="yes", caring_for_someone="no")
+    preferences = [
+        {"target_role": "caregiver", "kind": "treatment", "scope": "self", "rank": 1, "object": TREATMENTS[0]}
+    ]
+
+    assert pool.score(participant, preferences).tolist() == [0.0] * 10
+
+
+def test_engine_bitmasks_span_multiple_words():
+    treatments = [Treatment(id=i, name=f"Treatment {i}") for i in range(130)]
+    volunteers = [
+        UserData(user_id=uuid4(), has_blood_cancer="yes", caring_for_someone="no", treatments=[treatments[i]])
+        for i in range(130)
+    ]
+    pool = CandidatePool([CandidateFeatures.from_user_data(v) for v in volunteers])
+    participant = UserData(has_blood_cancer="yes", caring_for_someone="no")
+    preferences = [
+        {"target_role": "patient", "kind": "treatment", "scope": "self", "rank": 1, "object": treatments[128]}
+    ]
+
+    scores = pool.score(participant, preferences).tolist()
+
+    assert scores[128] == 1.0
+    assert sum(scores) == 1.0
+
+
+def test_rank_candidates_orders_by_score_then_user_id():
+    rng = random.Random(99)
+    volunteers = [_random_user_data(rng) for _ in range(60)]
+    pool = CandidatePool([CandidateFeatures.from_user_data(v) for v in volunteers])
+    participant = UserData(has_blood_cancer="yes", caring_for_someone="no", gender_identity="Woman")
+    preferences = [
+        {"target_role": "patient", "kind": "quality", "scope": "self", "rank": 1, "object": QUALITIES[1]},
+        {"target_role": "patient", "kind": "treatment", "scope": "self", "rank": 2, "object": TREATMENTS[0]},
+    ]
+
+    scores = pool.score(participant, preferences).tolist()
+    expected = sorted(range(60), key=lambda i: (-scores[i], str(volunteers[i].user_id)))
+
+    assert rank_candidates(pool, participant, preferences, limit=10) == [(i, scores[i]) for i in expected[:10]]
+    assert all(score * 100 >= 50 for _, score in rank_candidates(pool, participant, preferences, 60, min_score=50))
+
+
+def test_detached_batch_scores_match_and_survive_pickling():
+    rng = random.Random(5)
+    pool = CandidatePool([CandidateFeatures.from_user_data(_random_user_data(rng)) for _ in range(40)])
+    jobs = []
+    expected = []
+    for _ in range(20):
+        participant = _random_user_data(rng)
+        preferences = _random_preferences(rng)
+        job = (
+            participant.user_id,
+            "pool",
+            ParticipantProfile.from_user_data(participant),
+            detach_preferences(preferences),
+        )
+        jobs.append(pickle.loads(pickle.dumps(job)))
+        expected.append((participant.user_id, rank_candidates(pool, participant, preferences, limit=5)))
+
+    assert rank_batch({"pool": pool}, jobs, limit=5) == expected
+    assert rank_batch_in_worker({"pool": pickle_pool(pool)}, jobs, limit=5) == expected
+
+
+def test_pools_are_pickled_once_and_unpickled_once_per_worker(monkeypatch):
+    rng = random.Random(6)
+    pool = CandidatePool([CandidateFeatures.from_user_data(_random_user_data(rng)) for _ in range(10)])
+    participant = _random_user_data(rng)
+    jobs = [(participant.user_id, "pool", ParticipantProfile.from_user_data(participant), [])]
+    loads = []
+    real_loads = pickle.loads
+
+    def counting_loads(payload):
+        loads.append(payload)
+        return real_loads(payload)
+
+    monkeypatch.setattr(matching_engine.pickle, "loads", counting_loads)
+
+    assert pickle_pool(pool) is pickle_pool(pool)
+    rank_batch_in_worker({"pool": pickle_pool(pool)}, jobs, limit=3)
+    rank_batch_in_worker({"pool": pickle_pool(pool)}, jobs, limit=3)
+
+    assert len(loads) == 1
@@ -0,0 +1,237 @@
+"""Unit tests for MatchingService query helpers (no database required)."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import Treatment, User, UserData
+from app.models.User import Language
+from app.schemas.user import UserRole
+from app.services.implementations import matching_service as matching_service_module
+from app.services.implementations.matching_service import MatchingService
+from app.utilities.matching_engine import CandidateFeatures, CandidatePool
+from app.utilities.volunteer_index import IndexedVolunteer
+
+
+def test_active_match_counts_use_one_grouped_query(monkeypatch):
+    volunteer_a, volunteer_b = uuid4(), uuid4()
+    monkeypatch.setattr(matching_service_module.reference_data, "get_ids", lambda db, model, names: [1, 2])
+    db = MagicMock()
+    db.query.return_value.filter.return_value.group_by.return_value.all.return_value = [(volunteer_a, 3)]
+
+    counts = MatchingService(db)._get_active_match_counts([volunteer_a, volunteer_b])
+
+    assert counts == {volunteer_a: 3}
+    assert counts.get(volunteer_b, 0) == 0
+    assert db.query.call_count == 1
+
+
+def test_active_match_counts_skip_query_for_no_volunteers():
+    db = MagicMock()
+
+    assert MatchingService(db)._get_active_match_counts([]) == {}
+    db.query.assert_not_called()
+
+
+def _indexed_volunteer(user_id, user_data=None):
+    features = CandidateFeatures.from_user_data(user_data or UserData(user_id=user_id))
+    return IndexedVolunteer(features=features, first_name="Vol", last_name=str(user_id)[:4], email=f"{user_id}@x.com")
+
+
+@pytest.fixture
+def admin_service(monkeypatch):
+    """MatchingService with the participant lookups and volunteer scoring stubbed out."""
+    db = MagicMock()
+    participant = db.query.return_value.filter.return_value.first.return_value
+    participant.role.name = UserRole.PARTICIPANT
+
+    volunteer_ids = sorted(uuid4() for _ in range(5))
+    scores = [0.5, 0.9, 0.5, 0.0, 0.7]
+    scored = [(_indexed_volunteer(vid), score) for vid, score in zip(volunteer_ids, scores)]
+    users = {vid: User(id=vid, email=f"{vid}@x.com", user_data=UserData(user_id=vid)) for vid in volunteer_ids}
+
+    def load_users(*args, **kwargs):
+        loaded = db.loaded_ids.pop(0)
+        return [users[vid] for vid in loaded]
+
+    db.loaded_ids = []
+    original_filter = db.query.return_value.options.return_value.filter
+
+    def capture_filter(clause):
+        db.loaded_ids.append([value for value in clause.right.value])
+        return original_filter.return_value
+
+    db.query.return_value.options.return_value.filter = capture_filter
+    original_filter.return_value.all.side_effect = load_users
+
+    service = MatchingService(db)
+    monkeypatch.setattr(service, "_get_user_preferences", lambda user_id: [{"rank": 1}])
+    monkeypatch.setattr(service, "_score_volunteer_pool", lambda *args: list(scored))
+    monkeypatch.setattr(service, "_get_active_match_counts", lambda ids: {})
+    service.expected_order = [vid for vid, _ in sorted(zip(volunteer_ids, scores), key=lambda x: (-x[1], str(x[0])))]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_admin_matches_without_page_size_returns_all_sorted(admin_service):
+    page = await admin_service.get_admin_matches(uuid4())
+
+    assert [c["volunteer_id"] for c in page["matches"]] == admin_service.expected_order
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_admin_matches_cursor_pagination_walks_all_candidates(admin_service):
+    seen = []
+    cursor = None
+    while True:
+        page = await admin_service.get_admin_matches(uuid4(), page_size=2, cursor=cursor)
+        assert len(page["matches"]) <= 2
+        seen.extend(c["volunteer_id"] for c in page["matches"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == admin_service.expected_order
+
+
+@pytest.mark.asyncio
+async def test_admin_matches_min_score_skips_low_scores(admin_service):
+    page = await admin_service.get_admin_matches(uuid4(), min_score=50)
+
+    assert [c["match_score"] for c in page["matches"]] == [90.0, 70.0, 50.0, 50.0]
+
+
+@pytest.mark.asyncio
+async def test_admin_matches_rejects_malformed_cursor(admin_service):
+    with pytest.raises(HTTPException) as exc_info:
+        await admin_service.get_admin_matches(uuid4(), page_size=2, cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.fixture
+def batch_service(monkeypatch):
+    """MatchingService with three pending participants, a patient volunteer pool and no database."""
+    treatment = Treatment(id=1, name="Chemotherapy")
+    patient_volunteers = []
+    for has_chemo in [False, True, True, False]:
+        user_id = uuid4()
+        user_data = UserData(user_id=user_id, has_blood_cancer="yes", treatments=[treatment] if has_chemo else [])
+        patient_volunteers.append(_indexed_volunteer(user_id, user_data))
+    segments = {"patient": (patient_volunteers, CandidatePool([v.features for v in patient_volunteers]))}
+    monkeypatch.setattr(matching_service_module.volunteer_index, "get_segments", lambda db, language: segments)
+
+    matched, unranked, no_preferences = (User(id=uuid4(), language=Language.ENGLISH) for _ in range(3))
+    rows = [
+        (matched, UserData(user_id=matched.id, has_blood_cancer="yes")),
+        (unranked, UserData(user_id=unranked.id, has_blood_cancer="no", caring_for_someone="no")),
+        (no_preferences, UserData(user_id=no_preferences.id, has_blood_cancer="yes")),
+    ]
+    db = MagicMock()
+    participant_query = db.query.return_value.join.return_value.outerjoin.return_value.filter.return_value
+    participant_query.filter.return_value.all.return_value = rows
+    participant_query.filter.return_value.order_by.return_value.all.return_value = rows
+
+    preference = {"target_role": "patient", "kind": "treatment", "scope": "self", "rank": 1, "object": treatment}
+    service = MatchingService(db)
+    monkeypatch.setattr(
+        service,
+        "_get_preferences_for_users",
+        lambda user_ids: {matched.id: [preference], unranked.id: [preference]},
+    )
+    monkeypatch.setattr(service, "_get_active_match_counts", lambda ids: {patient_volunteers[2].user_id: 4})
+    service.active_matches = {}
+    monkeypatch.setattr(service, "_get_active_matched_volunteers", lambda ids: service.active_matches)
+    service.participants = (matched, unranked, no_preferences)
+    service.busy_volunteer = patient_volunteers[2].user_id
+    service.expected_matches = sorted([v.user_id for v in patient_volunteers[1:3]], key=str)
+    return service
+
+
+def test_batch_matches_rank_each_pending_participant(batch_service):
+    matched, unranked, no_preferences = batch_service.participants
+
+    results = list(batch_service.get_batch_matches(limit=2))
+
+    assert [r["participant_id"] for r in results] == [matched.id, unranked.id, no_preferences.id]
+    assert [c["volunteer_id"] for c in results[0]["matches"]] == batch_service.expected_matches
+    assert [c["match_score"] for c in results[0]["matches"]] == [100.0, 100.0]
+    assert {c["match_count"] for c in results[0]["matches"]} == {0, 4}
+    # Not eligible for any volunteer type: no candidates, but not an error either
+    assert results[1] == {"participant_id": unranked.id, "matches": [], "error": None}
+    assert results[2]["error"] == f"User with ID {no_preferences.id} has no ranking form data"
+
+
+def test_batch_matches_report_unknown_participants(batch_service):
+    matched = batch_service.participants[0]
+    unknown = uuid4()
+
+    results = list(batch_service.get_batch_matches(participant_ids=[unknown, matched.id], limit=1))
+
+    assert results[0]["error"] == f"User with ID {unknown} not found or not a participant"
+    assert len(results[1]["matches"]) == 1
+
+
+def test_batch_matches_process_pool_matches_in_process(batch_service, monkeypatch):
+    monkeypatch.setattr(matching_service_module, "BATCH_CHUNK_SIZE", 1)
+    monkeypatch.setattr(matching_service_module, "BATCH_PROCESS_WORKERS", 2)
+
+    participant_ids = [batch_service.participants[0].id] * 3
+
+    in_process = list(batch_service.get_batch_matches(participant_ids, limit=3))
+    try:
+        pooled = list(batch_service.get_batch_matches(participant_ids, limit=3, use_process_pool=True))
+        executor = matching_service_module.batch_executor.get()
+        pooled_again = list(batch_service.get_batch_matches(participant_ids, limit=3, use_process_pool=True))
+        # Later batches reuse the worker processes
+        assert matching_service_module.batch_executor.get() is executor
+    finally:
+        matching_service_module.batch_executor.shutdown()
+
+    assert pooled == pooled_again == in_process
+    assert len(pooled[0]["matches"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_propose_assignments_respects_existing_matches(batch_service):
+    matched, unranked, no_preferences = batch_service.participants
+    # Volunteer with 4 active matches is already over a capacity of 3; the other chemo volunteer is free
+    free_volunteer = next(v for v in batch_service.expected_matches if v != batch_service.busy_volunteer)
+
+    result = await batch_service.propose_assignments(capacity=3)
+
+    assert [(p["participant_id"], p["volunteer_id"]) for p in result["proposals"]] == [(matched.id, free_volunteer)]
+    assert result["match_requests"] == [{"participant_id": matched.id, "volunteer_ids": [free_volunteer]}]
+    assert result["unassigned_participant_ids"] == [unranked.id, no_preferences.id]
+    assert result["total_score"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_propose_assignments_skips_volunteers_already_matched_with_the_participant(batch_service):
+    matched = batch_service.participants[0]
+    free_volunteer = next(v for v in batch_service.expected_matches if v != batch_service.busy_volunteer)
+    batch_service.active_matches = {matched.id: {free_volunteer}}
+
+    result = await batch_service.propose_assignments(capacity=5, candidates_per_participant=1)
+
+    assert [(p["participant_id"], p["volunteer_id"]) for p in result["proposals"]] == [
+        (matched.id, batch_service.busy_volunteer)
+    ]
+
+
+def test_active_matched_volunteers_are_grouped_by_participant(monkeypatch):
+    participant, volunteer_a, volunteer_b = uuid4(), uuid4(), uuid4()
+    monkeypatch.setattr(matching_service_module.reference_data, "get_ids", lambda db, model, names: [1, 2])
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        (participant, volunteer_a),
+        (participant, volunteer_b),
+    ]
+
+    assert MatchingService(db)._get_active_matched_volunteers([participant]) == {
+        participant: {volunteer_a, volunteer_b}
+    }
+    assert MatchingService(db)._get_active_matched_volunteers([]) == {}
@@ -0,0 +1,151 @@
+"""Unit tests for the startup schema version check and the migrate-once command."""
+
+import os
+import textwrap
+import threading
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+from app.utilities.migrations import SchemaVersionError, check_schema_version, head_revisions, migrate_once
+
+POSTGRES_TEST_DATABASE_URL = os.getenv("POSTGRES_TEST_DATABASE_URL")
+
+ENV_PY = """
+from alembic import context
+from sqlalchemy import create_engine
+
+engine = create_engine(context.config.get_main_option("sqlalchemy.url"))
+with engine.connect() as connection:
+    context.configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+engine.dispose()
+"""
+
+# Slow enough that the second migrate_once is waiting for the lock when the index build starts
+CONCURRENT_INDEX_MIGRATION = """
+import sqlalchemy as sa
+from alembic import op
+
+revision = "a1b2c3d4e5f6"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table("items", sa.Column("id", sa.Integer, primary_key=True), sa.Column("name", sa.Text))
+    op.execute("SELECT pg_sleep(1)")
+    with op.get_context().autocommit_block():
+        op.create_index("ix_items_name", "items", ["name"], postgresql_concurrently=True)
+"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _stamp(engine, revision):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        connection.execute(text("DELETE FROM alembic_version"))
+        connection.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": revision})
+
+
+def test_database_at_head_passes(engine):
+    (head,) = head_revisions()
+    _stamp(engine, head)
+
+    assert check_schema_version(engine) is True
+
+
+def test_unmigrated_database_fails_the_check(engine):
+    with pytest.raises(SchemaVersionError, match="pdm run migrate"):
+        check_schema_version(engine)
+
+    _stamp(engine, "c4a9e2f1b7d3")
+    with pytest.raises(SchemaVersionError, match="c4a9e2f1b7d3"):
+        check_schema_version(engine)
+
+
+def test_database_ahead_of_the_code_only_warns(engine):
+    _stamp(engine, "ffffffffffff")
+
+    assert check_schema_version(engine) is False
+
+
+def test_migrate_once_skips_a_migrated_database(engine, monkeypatch):
+    (head,) = head_revisions()
+    _stamp(engine, head)
+    monkeypatch.setattr("app.models.run_migrations", lambda: pytest.fail("migrations should not run"))
+
+    assert migrate_once(engine) is False
+
+
+def test_migrate_once_fails_if_migrations_do_not_reach_head(engine, monkeypatch):
+    _stamp(engine, "c4a9e2f1b7d3")
+    monkeypatch.setattr("app.models.run_migrations", lambda: None)
+
+    with pytest.raises(SchemaVersionError):
+        migrate_once(engine)
+
+
+@pytest.fixture
+def scratch_postgres_url():
+    """A new, empty Postgres database, dropped after the test."""
+    admin = create_engine(POSTGRES_TEST_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    name = f"llsc_migrate_{uuid4().hex[:12]}"
+    with admin.connect() as connection:
+        connection.execute(text(f"CREATE DATABASE {name}"))
+    yield make_url(POSTGRES_TEST_DATABASE_URL).set(database=name).render_as_string(hide_password=False)
+    with admin.connect() as connection:
+        connection.execute(text(f"DROP DATABASE IF EXISTS {name} WITH (FORCE)"))
+    admin.dispose()
+
+
+@pytest.mark.skipif(not POSTGRES_TEST_DATABASE_URL, reason="POSTGRES_TEST_DATABASE_URL not set")
+def test_concurrent_migrate_once_runs_a_concurrent_index_migration_once(scratch_postgres_url, tmp_path, monkeypatch):
+    (tmp_path / "versions").mkdir()
+    (tmp_path / "env.py").write_text(textwrap.dedent(ENV_PY))
+    (tmp_path / "versions" / "a1b2c3d4e5f6_items.py").write_text(textwrap.dedent(CONCURRENT_INDEX_MIGRATION))
+    alembic_cfg = Config()
+    alembic_cfg.set_main_option("script_location", str(tmp_path))
+    alembic_cfg.set_main_option("sqlalchemy.url", scratch_postgres_url)
+    monkeypatch.setattr("app.models.run_migrations", lambda: command.upgrade(alembic_cfg, "head"))
+    monkeypatch.setenv("DB_PGBOUNCER", "false")
+
+    engine = create_engine(scratch_postgres_url)
+    results = []
+
+    def migrate():
+        results.append(migrate_once(engine, alembic_cfg, poll_seconds=0.1))
+
+    threads = [threading.Thread(target=migrate, daemon=True) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert not any(thread.is_alive() for thread in threads), "migrate_once deadlocked"
+    assert sorted(results) == [False, True]
+    with engine.connect() as connection:
+        assert connection.execute(
+            text("SELECT indisvalid FROM pg_index WHERE indexrelid = 'ix_items_name'::regclass")
+        ).scalar()
+    engine.dispose()
+
+
+def test_migrate_once_refuses_pgbouncer(monkeypatch):
+    monkeypatch.setenv("DB_PGBOUNCER", "true")
+    engine = create_engine("postgresql+psycopg2://postgres@localhost/llsc")
+
+    with pytest.raises(SchemaVersionError, match="PgBouncer"):
+        migrate_once(engine)
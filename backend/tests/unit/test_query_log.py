@@ -0,0 +1,113 @@
+"""Unit tests for N+1 query detection and query budgets."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base, relationship, selectinload
+
+from app.utilities.query_log import QueryBudgetExceeded, QueryLogMiddleware, capture_queries, statement_shape
+
+Base = declarative_base()
+
+
+class Author(Base):
+    __tablename__ = "query_log_authors"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    books = relationship("Book")
+
+
+class Book(Base):
+    __tablename__ = "query_log_books"
+
+    id = Column(Integer, primary_key=True)
+    author_id = Column(Integer, ForeignKey("query_log_authors.id"), nullable=False)
+    title = Column(String, nullable=False)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # Route handlers run on worker threads
+    engine = create_engine(f"sqlite:///{tmp_path / 'query_log.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add_all(
+            Author(id=i, name=f"author {i}", books=[Book(title=f"book {i}-{j}") for j in range(2)]) for i in range(10)
+        )
+        db.commit()
+    yield engine
+    engine.dispose()
+
+
+def _titles(db, authors):
+    return [book.title for author in authors for book in author.books]
+
+
+def test_statement_shape_ignores_literals_and_parameter_lists():
+    assert statement_shape("SELECT * FROM users WHERE id = 1 AND name = 'a''b'") == statement_shape(
+        "SELECT *\n  FROM users WHERE id = 22 AND name = 'c'"
+    )
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == statement_shape(
+        "SELECT * FROM t WHERE id IN (?)"
+    )
+    assert statement_shape("SELECT * FROM t WHERE id = %(id_1)s") == "SELECT * FROM t WHERE id = ?"
+    assert statement_shape("SELECT anon_1.id FROM t AS anon_1") == "SELECT anon_1.id FROM t AS anon_1"
+
+
+def test_lazy_loading_per_row_is_reported_as_repeated(engine):
+    with Session(engine) as db, capture_queries() as query_log:
+        _titles(db, db.scalars(select(Author)).all())
+
+    assert query_log.count == 11
+    [(shape, count)] = query_log.repeated(threshold=5)
+    assert count == 10
+    assert "FROM query_log_books" in shape
+
+
+def test_budget_fails_on_n_plus_one(engine, query_budget):
+    with Session(engine) as db, pytest.raises(QueryBudgetExceeded, match="possible N\\+1"):
+        with query_budget():
+            _titles(db, db.scalars(select(Author)).all())
+
+
+def test_budget_fails_when_exceeded(engine, query_budget):
+    with Session(engine) as db, pytest.raises(QueryBudgetExceeded, match="budget of 1 exceeded"):
+        with query_budget(max_queries=1):
+            db.scalars(select(Author)).all()
+            db.scalars(select(Book)).all()
+
+
+def test_eager_loading_stays_within_budget(engine, query_budget):
+    with Session(engine) as db, query_budget(max_queries=2) as query_log:
+        titles = _titles(db, db.scalars(select(Author).options(selectinload(Author.books))).all())
+
+    assert len(titles) == 20
+    assert query_log.count == 2
+
+
+def test_middleware_warns_about_repeated_statements(engine, caplog):
+    app = FastAPI()
+    app.add_middleware(QueryLogMiddleware, threshold=5)
+
+    @app.get("/authors")
+    def get_authors():
+        with Session(engine) as db:
+            return _titles(db, db.scalars(select(Author)).all())
+
+    @app.get("/authors/eager")
+    def get_authors_eager():
+        with Session(engine) as db:
+            return _titles(db, db.scalars(select(Author).options(selectinload(Author.books))).all())
+
+    client = TestClient(app)
+    with caplog.at_level(logging.WARNING):
+        client.get("/authors/eager")
+        assert "N+1" not in caplog.text
+        client.get("/authors")
+
+    assert "Possible N+1 queries in GET /authors: 11 statements" in caplog.text
+    assert "10x SELECT" in caplog.text
@@ -0,0 +1,103 @@
+"""Unit tests for the in-process reference data cache (SQLite, no Postgres required)."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.models import Experience, MatchStatus, Quality, Role, Treatment
+from app.schemas.user import UserRole
+from app.utilities.reference_data import ReferenceDataCache
+
+REFERENCE_MODELS = (Quality, Treatment, Experience, Role, MatchStatus)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    for model in REFERENCE_MODELS:
+        model.__table__.create(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Quality(id=1, slug="same_age", label="the same age as me"),
+                Treatment(id=1, name="Chemotherapy"),
+                Treatment(id=2, name="Radiation"),
+                Experience(id=1, name="Fatigue", scope="both"),
+                Role(id=1, name=UserRole.PARTICIPANT.value),
+                MatchStatus(id=1, name="pending"),
+                MatchStatus(id=2, name="confirmed"),
+            ]
+        )
+        session.commit()
+    engine.statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: engine.statements.append(args[2]))
+    return engine
+
+
+@pytest.fixture
+def cache():
+    return ReferenceDataCache(miss_reload_seconds=60)
+
+
+def test_lookups_are_served_from_memory_after_refresh(engine, cache):
+    with Session(engine) as session:
+        cache.refresh(session)
+        assert len(engine.statements) == len(REFERENCE_MODELS)
+
+        assert cache.get_by_name(session, Treatment, "Radiation").id == 2
+        assert cache.get_by_id(session, Quality, 1).slug == "same_age"
+        assert cache.get_id(session, Role, UserRole.PARTICIPANT) == 1
+        assert cache.get_ids(session, MatchStatus, ["confirmed", "unknown", "pending"]) == [2, 1]
+        rows = cache.get_by_names(session, Treatment, ["Radiation", "unknown", "Chemotherapy", "Radiation"])
+        assert [t.id for t in rows] == [2, 1]
+        assert all(row in session for row in rows)
+        assert [t.name for t in cache.get_all(session, Treatment)] == ["Chemotherapy", "Radiation"]
+
+    assert len(engine.statements) == len(REFERENCE_MODELS)
+
+
+def test_tables_load_lazily_one_at_a_time(engine, cache):
+    with Session(engine) as session:
+        assert cache.get_by_name(session, Treatment, "Chemotherapy").id == 1
+        assert cache.get_by_name(session, Treatment, "Radiation").id == 2
+
+    assert len(engine.statements) == 1
+
+
+def test_lookups_return_instances_bound_to_the_session(engine, cache):
+    with Session(engine) as session:
+        existing = session.get(Treatment, 1)
+        cached = cache.get_by_name(session, Treatment, "Chemotherapy")
+
+        # The row the session already had is reused rather than detached or duplicated
+        assert cached is existing
+        assert cache.get_by_name(session, MatchStatus, "confirmed") in session
+
+    with Session(engine) as other_session:
+        assert cache.get_by_name(other_session, MatchStatus, "confirmed") in other_session
+
+
+def test_miss_reloads_at_most_once_per_interval(engine, cache):
+    with Session(engine) as session:
+        cache.refresh(session)
+        session.add(Treatment(id=3, name="CAR-T"))
+        session.commit()
+
+        # Within the interval a miss does not hit the database
+        assert cache.get_by_name(session, Treatment, "CAR-T") is None
+
+        cache.miss_reload_seconds = -1
+        assert cache.get_by_name(session, Treatment, "CAR-T").id == 3
+
+
+def test_refresh_and_invalidate(engine, cache):
+    with Session(engine) as session:
+        counts = cache.refresh(session)
+        assert counts["treatments"] == 2
+        assert counts["match_status"] == 2
+
+        statements = len(engine.statements)
+        cache.invalidate()
+        cache.get_by_name(session, Role, UserRole.PARTICIPANT.value)
+
+    assert len(engine.statements) == statements + 1
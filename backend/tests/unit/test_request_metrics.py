@@ -0,0 +1,148 @@
+"""Unit tests for request latency, query-count and external call metrics."""
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from app.routes import metrics
+from app.utilities.request_metrics import (
+    MetricsMiddleware,
+    RequestTimings,
+    _current_timings,
+    current_timings,
+    external_call,
+    instrument_boto_client,
+    instrument_engine_queries,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    instrument_engine_queries(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def app(engine):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, server_timing=True)
+    app.include_router(metrics.router)
+
+    @app.get("/metrics-test/items/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(text("SELECT 1"))
+        with external_call("firebase", "get_user"):
+            pass
+        return {"item_id": item_id, "queries": current_timings().queries}
+
+    return app
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_server_timing_reports_queries_and_external_calls(app):
+    response = TestClient(app).get("/metrics-test/items/7")
+
+    assert response.json() == {"item_id": 7, "queries": 3}
+    server_timing = response.headers["server-timing"]
+    assert 'desc="3 queries"' in server_timing
+    assert "firebase;dur=" in server_timing
+    assert "total;dur=" in server_timing
+
+
+def test_requests_are_labelled_with_the_route_template(app):
+    route = "/metrics-test/items/{item_id}"
+    before = _sample("http_request_duration_seconds_count", method="GET", route=route, status="200")
+    queries_before = _sample("http_request_db_queries_sum", route=route)
+
+    client = TestClient(app)
+    client.get("/metrics-test/items/1")
+    client.get("/metrics-test/items/2")
+
+    assert _sample("http_request_duration_seconds_count", method="GET", route=route, status="200") == before + 2
+    assert _sample("http_request_db_queries_sum", route=route) == queries_before + 6
+
+
+def test_unmatched_paths_share_one_label(app):
+    before = _sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+
+    TestClient(app).get("/metrics-test/no-such-path")
+
+    assert _sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") == before + 1
+
+
+def test_metrics_endpoint_is_not_timed_and_serves_prometheus_text(app, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-token")
+    response = TestClient(app).get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert "http_request_duration_seconds_bucket" in response.text
+
+
+def test_metrics_endpoint_requires_the_scrape_token(app, monkeypatch):
+    client = TestClient(app)
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-token")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_queries_outside_a_request_are_not_attributed(engine):
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    finally:
+        _current_timings.reset(token)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert timings.queries == 1
+    assert current_timings() is None
+
+
+def test_failed_query_is_still_counted(engine):
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        with engine.connect() as connection, pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing_table"))
+    finally:
+        _current_timings.reset(token)
+
+    assert timings.queries == 1
+
+
+def test_boto_client_calls_are_timed_by_operation():
+    client = instrument_boto_client(
+        boto3.client("ses", region_name="ca-central-1", aws_access_key_id="x", aws_secret_access_key="y"), "ses"
+    )
+    before = _sample("external_call_duration_seconds_count", service="ses", operation="ListVerifiedEmailAddresses")
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        with Stubber(client) as stubber:
+            stubber.add_response("list_verified_email_addresses", {"VerifiedEmailAddresses": []})
+            stubber.add_client_error("list_verified_email_addresses", "Throttling")
+            client.list_verified_email_addresses()
+            with pytest.raises(client.exceptions.ClientError):
+                client.list_verified_email_addresses()
+    finally:
+        _current_timings.reset(token)
+
+    after = _sample("external_call_duration_seconds_count", service="ses", operation="ListVerifiedEmailAddresses")
+    assert after == before + 2
+    assert set(timings.external_seconds) == {"ses"}
@@ -0,0 +1,99 @@
+"""Unit tests for the process-wide SES client registry, with boto3.client patched."""
+
+import threading
+
+import pytest
+
+from app.utilities.ses.ses_clients import SESClientRegistry
+
+
+class FakeSESClient:
+    def __init__(self):
+        self.list_calls = 0
+        self.verification_requests = []
+
+    def list_verified_email_addresses(self):
+        self.list_calls += 1
+        return {"VerifiedEmailAddresses": ["verified@example.com"]}
+
+    def verify_email_identity(self, EmailAddress):
+        self.verification_requests.append(EmailAddress)
+
+
+@pytest.fixture
+def created(monkeypatch):
+    created = []
+
+    def fake_client(service, **kwargs):
+        created.append(kwargs)
+        return FakeSESClient()
+
+    monkeypatch.setattr("app.utilities.ses.ses_clients.boto3.client", fake_client)
+    return created
+
+
+@pytest.fixture
+def registry():
+    return SESClientRegistry(verified_emails_ttl_seconds=300, max_pool_connections=10)
+
+
+def test_one_client_per_credentials_across_threads(created, registry):
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(registry.client("ca-central-1", "key", "secret")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert len({id(client) for client in clients}) == 1
+    assert created[0]["config"].max_pool_connections == 10
+
+    assert registry.client("us-east-1", "key", "secret") is not clients[0]
+    assert len(created) == 2
+
+
+def test_no_client_without_credentials(created, registry, monkeypatch):
+    monkeypatch.delenv("AWS_SECRET_KEY", raising=False)
+
+    assert registry.client("ca-central-1", "key") is None
+    assert created == []
+
+
+def test_verified_emails_are_cached_until_the_ttl(created, registry, monkeypatch):
+    client = registry.client("ca-central-1", "key", "secret")
+    now = [1000.0]
+    monkeypatch.setattr("app.utilities.ses.ses_clients.time.monotonic", lambda: now[0])
+
+    assert registry.verified_emails(client) == {"verified@example.com"}
+    assert registry.verified_emails(client) == {"verified@example.com"}
+    assert client.list_calls == 1
+
+    now[0] += 301
+    registry.verified_emails(client)
+    assert client.list_calls == 2
+
+
+def test_verification_is_requested_once_per_ttl(created, registry, monkeypatch):
+    client = registry.client("ca-central-1", "key", "secret")
+    now = [1000.0]
+    monkeypatch.setattr("app.utilities.ses.ses_clients.time.monotonic", lambda: now[0])
+
+    assert registry.request_verification(client, "new@example.com")
+    assert not registry.request_verification(client, "new@example.com")
+    assert registry.request_verification(client, "other@example.com")
+
+    now[0] += 301
+    assert registry.request_verification(client, "new@example.com")
+    assert client.verification_requests == ["new@example.com", "other@example.com", "new@example.com"]
+
+
+def test_invalidate_recreates_clients(created, registry):
+    client = registry.client("ca-central-1", "key", "secret")
+    registry.invalidate()
+
+    assert registry.client("ca-central-1", "key", "secret") is not client
+    assert len(created) == 2
@@ -0,0 +1,86 @@
+"""Unit tests for the manifest-based SES template sync, with a fake SES client."""
+
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.utilities.ses.ses_init import MANIFEST_TEMPLATE_NAME, sync_ses_templates
+
+
+class FakeSESClient:
+    def __init__(self):
+        self.templates = {}
+        self.calls = []
+
+    def get_template(self, TemplateName):
+        self.calls.append(("get", TemplateName))
+        if TemplateName not in self.templates:
+            raise ClientError({"Error": {"Code": "TemplateDoesNotExist", "Message": ""}}, "GetTemplate")
+        return {"Template": self.templates[TemplateName]}
+
+    def create_template(self, Template):
+        self.calls.append(("create", Template["TemplateName"]))
+        self.templates[Template["TemplateName"]] = Template
+
+    def update_template(self, Template):
+        self.calls.append(("update", Template["TemplateName"]))
+        if Template["TemplateName"] not in self.templates:
+            raise ClientError({"Error": {"Code": "TemplateDoesNotExist", "Message": ""}}, "UpdateTemplate")
+        self.templates[Template["TemplateName"]] = Template
+
+
+@pytest.fixture
+def templates_file(tmp_path):
+    metadata = []
+    for name in ["Welcome", "Goodbye"]:
+        (tmp_path / f"{name}.txt").write_text(f"{name} text")
+        (tmp_path / f"{name}.html").write_text(f"<p>{name}</p>")
+        metadata.append(
+            {
+                "TemplateName": name,
+                "SubjectPart": name,
+                "TextPart": str(tmp_path / f"{name}.txt"),
+                "HtmlPart": str(tmp_path / f"{name}.html"),
+            }
+        )
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps(metadata))
+    return path
+
+
+def test_first_sync_creates_every_template_and_the_manifest(templates_file):
+    ses = FakeSESClient()
+
+    assert sync_ses_templates(ses, str(templates_file)) == ["Welcome", "Goodbye"]
+
+    assert set(ses.templates) == {"Welcome", "Goodbye", MANIFEST_TEMPLATE_NAME}
+    assert set(json.loads(ses.templates[MANIFEST_TEMPLATE_NAME]["TextPart"])) == {"Welcome", "Goodbye"}
+
+
+def test_unchanged_templates_cost_one_call(templates_file):
+    ses = FakeSESClient()
+    sync_ses_templates(ses, str(templates_file))
+    ses.calls.clear()
+
+    assert sync_ses_templates(ses, str(templates_file)) == []
+    assert ses.calls == [("get", MANIFEST_TEMPLATE_NAME)]
+
+
+def test_only_changed_templates_are_uploaded(templates_file, tmp_path):
+    ses = FakeSESClient()
+    sync_ses_templates(ses, str(templates_file))
+    (tmp_path / "Goodbye.html").write_text("<p>See you soon</p>")
+    ses.calls.clear()
+
+    assert sync_ses_templates(ses, str(templates_file)) == ["Goodbye"]
+    assert ses.templates["Goodbye"]["HtmlPart"] == "<p>See you soon</p>"
+    assert ("update", "Welcome") not in ses.calls
+    assert sync_ses_templates(ses, str(templates_file)) == []
+
+
+def test_force_update_uploads_every_template(templates_file):
+    ses = FakeSESClient()
+    sync_ses_templates(ses, str(templates_file))
+
+    assert sync_ses_templates(ses, str(templates_file), force_update=True) == ["Welcome", "Goodbye"]
@@ -0,0 +1,80 @@
+"""Unit tests for the synthetic large-scale seed generator (no database required)."""
+
+import csv
+import uuid
+from datetime import date, datetime
+
+from app.models.Match import Match
+from app.models.RankingPreference import RankingPreference
+from app.models.Task import Task, TaskStatus
+from app.models.User import User
+from app.models.UserData import UserData, user_treatments
+from app.seeds.synthetic import ReferenceIds, copy_csv, generate_synthetic_data
+
+REFS = ReferenceIds(
+    treatments=list(range(1, 15)),
+    experiences=list(range(1, 13)),
+    qualities=list(range(1, 7)),
+    match_statuses=list(range(1, 11)),
+    participant_form_id=uuid.uuid4(),
+    volunteer_form_id=uuid.uuid4(),
+)
+
+
+def test_generates_every_user_with_consistent_related_rows():
+    data = generate_synthetic_data(1000, REFS)
+
+    users = data[User.__table__]
+    roles = {row["id"]: row["role_id"] for row in users}
+    assert len(users) == 1000
+    assert len({row["email"] for row in users}) == 1000
+    assert {1, 2, 3} == set(roles.values())
+
+    user_data_ids = {row["id"] for row in data[UserData.__table__]}
+    assert {row["user_id"] for row in data[UserData.__table__]} <= set(roles)
+    assert {row["user_data_id"] for row in data[user_treatments]} <= user_data_ids
+
+    for match in data[Match.__table__]:
+        assert roles[match["participant_id"]] == 1
+        assert roles[match["volunteer_id"]] == 2
+    for task in data[Task.__table__]:
+        assert task["assignee_id"] is None or roles[task["assignee_id"]] == 3
+
+
+def test_matches_cover_every_status():
+    data = generate_synthetic_data(200, REFS)
+
+    assert {match["match_status_id"] for match in data[Match.__table__]} == set(REFS.match_statuses)
+
+
+def test_ranking_preferences_are_unique_per_rank():
+    data = generate_synthetic_data(500, REFS)
+
+    keys = [(row["user_id"], row["target_role"], row["rank"]) for row in data[RankingPreference.__table__]]
+    assert len(keys) == len(set(keys))
+
+
+def test_same_seed_generates_the_same_rows():
+    now = datetime(2025, 6, 1, 12, 0)
+    first = generate_synthetic_data(100, REFS, seed=7, now=now)
+    second = generate_synthetic_data(100, REFS, seed=7, now=now)
+
+    assert first[User.__table__] == second[User.__table__]
+    assert first[Match.__table__] == second[Match.__table__]
+
+
+def test_rows_of_a_table_share_columns():
+    for rows in generate_synthetic_data(300, REFS).values():
+        assert len({tuple(row) for row in rows}) <= 1
+
+
+def test_copy_csv_distinguishes_null_from_empty_values():
+    rows = [
+        {"a": None, "b": "", "c": ["she", "her"], "d": TaskStatus.PENDING, "e": True, "f": date(2024, 1, 2)},
+        {"a": 'say "hi", ok', "b": "x", "c": None, "d": None, "e": False, "f": None},
+    ]
+
+    lines = copy_csv(rows, list(rows[0])).read().splitlines()
+
+    assert lines[0] == '\\N,,"[""she"", ""her""]",pending,True,2024-01-02'
+    assert next(csv.reader([lines[1]])) == ['say "hi", ok', "x", "\\N", "\\N", "False", "\\N"]
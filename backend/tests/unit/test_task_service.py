@@ -0,0 +1,119 @@
+"""
+Tests for TaskService on the async session layer (asyncpg).
+"""
+
+import os
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Role, TaskStatus, User
+from app.schemas.task import TaskCreateRequest, TaskUpdateRequest
+from app.schemas.user import UserRole
+from app.services.implementations.task_service import TaskService
+from app.utilities.db_utils import to_async_url
+
+# Test DB Configuration
+POSTGRES_DATABASE_URL = os.getenv("POSTGRES_TEST_DATABASE_URL")
+
+if not POSTGRES_DATABASE_URL:
+    # Skip all tests in this file if Postgres isn't available
+    pytest.skip(
+        "POSTGRES_TEST_DATABASE_URL not set. "
+        "These tests require a Postgres database. Set POSTGRES_TEST_DATABASE_URL to run them.",
+        allow_module_level=True,
+    )
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Provide a clean async database session for each test"""
+    engine = create_async_engine(to_async_url(POSTGRES_DATABASE_URL))
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async with session_factory() as session:
+        await session.execute(text("TRUNCATE TABLE tasks, users RESTART IDENTITY CASCADE"))
+        existing = set((await session.scalars(text("SELECT id FROM roles"))).all())
+        for role in [
+            Role(id=1, name=UserRole.PARTICIPANT),
+            Role(id=2, name=UserRole.VOLUNTEER),
+            Role(id=3, name=UserRole.ADMIN),
+        ]:
+            if role.id not in existing:
+                session.add(role)
+        await session.commit()
+
+        yield session
+
+        await session.rollback()
+    await engine.dispose()
+
+
+async def _add_user(session, role_id: int) -> User:
+    user = User(
+        id=uuid4(),
+        first_name="Test",
+        last_name="User",
+        email=f"{uuid4()}@example.com",
+        role_id=role_id,
+        auth_id=str(uuid4()),
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_task(db_session):
+    participant = await _add_user(db_session, role_id=1)
+    admin = await _add_user(db_session, role_id=3)
+    service = TaskService(db_session)
+
+    created = await service.create_task(
+        TaskCreateRequest(participant_id=participant.id, type="matching", assignee_id=admin.id)
+    )
+    fetched = await service.get_task_by_id(created.id)
+
+    assert fetched.participant_email == participant.email
+    assert fetched.assignee_name == "Test User"
+
+
+@pytest.mark.asyncio
+async def test_create_task_rejects_non_admin_assignee(db_session):
+    participant = await _add_user(db_session, role_id=1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await TaskService(db_session).create_task(TaskCreateRequest(type="matching", assignee_id=participant.id))
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_filters_by_status(db_session):
+    service = TaskService(db_session)
+    pending = await service.create_task(TaskCreateRequest(type="matching"))
+    done = await service.create_task(TaskCreateRequest(type="profile_update"))
+    await service.complete_task(done.id)
+
+    tasks = await service.get_all_tasks(status=TaskStatus.PENDING.value)
+
+    assert [task.id for task in tasks] == [pending.id]
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_task(db_session):
+    service = TaskService(db_session)
+    task = await service.create_task(TaskCreateRequest(type="matching"))
+
+    updated = await service.update_task(task.id, TaskUpdateRequest(priority="high", description="Call back"))
+    assert updated.priority == "high"
+    assert updated.description == "Call back"
+
+    await service.delete_task(task.id)
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_task_by_id(task.id)
+    assert exc_info.value.status_code == 404
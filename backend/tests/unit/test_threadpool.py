@@ -0,0 +1,51 @@
+"""Unit tests for running blocking service methods in the threadpool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.utilities.threadpool import in_threadpool
+
+
+class BlockingService:
+    def __init__(self):
+        self.threads = []
+
+    @in_threadpool
+    def query(self, value, delay=0.1):
+        self.threads.append(threading.get_ident())
+        time.sleep(delay)
+        return value * 2
+
+
+@pytest.mark.asyncio
+async def test_blocking_method_runs_off_the_event_loop():
+    service = BlockingService()
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    assert await service.query(21) == 42
+    ticker.cancel()
+
+    assert service.threads != [threading.get_ident()]
+    # The loop kept running while the method slept
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_exceptions_reach_the_caller():
+    class FailingService:
+        @in_threadpool
+        def query(self):
+            raise ValueError("no such row")
+
+    with pytest.raises(ValueError, match="no such row"):
+        await FailingService().query()
@@ -0,0 +1,100 @@
+"""Unit tests for the verified Firebase ID token cache."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import firebase_admin.auth
+import pytest
+
+from app.utilities.token_cache import TokenVerificationCache
+
+
+@pytest.fixture
+def firebase():
+    with (
+        patch("firebase_admin.auth.verify_id_token") as mock_verify,
+        patch("firebase_admin.auth.get_user") as mock_get_user,
+    ):
+        mock_verify.side_effect = lambda token, check_revoked: {
+            "uid": f"uid-{token}",
+            "email": f"{token}@example.com",
+            "exp": time.time() + 3600,
+        }
+        mock_get_user.return_value = MagicMock(email_verified=True)
+        yield mock_verify, mock_get_user
+
+
+def test_repeated_verification_is_served_from_cache(firebase):
+    mock_verify, mock_get_user = firebase
+    cache = TokenVerificationCache(revocation_check_seconds=60, max_entries=10)
+
+    results = [cache.verify("token") for _ in range(10)]
+
+    assert {r.uid for r in results} == {"uid-token"}
+    assert all(r.email_verified for r in results)
+    assert mock_verify.call_count == 1
+    assert mock_get_user.call_count == 1
+    mock_verify.assert_called_with("token", check_revoked=True)
+
+
+def test_token_is_rechecked_after_revocation_window(firebase):
+    mock_verify, _ = firebase
+    cache = TokenVerificationCache(revocation_check_seconds=0, max_entries=10)
+
+    cache.verify("token")
+    cache.verify("token")
+
+    assert mock_verify.call_count == 2
+
+
+def test_expired_token_is_not_served_from_cache(firebase):
+    mock_verify, _ = firebase
+    mock_verify.side_effect = None
+    mock_verify.return_value = {"uid": "uid", "exp": time.time() - 1}
+    cache = TokenVerificationCache(revocation_check_seconds=60, max_entries=10)
+
+    cache.verify("token")
+    mock_verify.side_effect = firebase_admin.auth.ExpiredIdTokenError(message="Token expired", cause="test")
+
+    with pytest.raises(firebase_admin.auth.ExpiredIdTokenError):
+        cache.verify("token")
+
+
+def test_failed_verification_is_not_cached(firebase):
+    mock_verify, _ = firebase
+    cache = TokenVerificationCache(revocation_check_seconds=60, max_entries=10)
+    side_effect = mock_verify.side_effect
+    mock_verify.side_effect = firebase_admin.auth.RevokedIdTokenError(message="Token revoked")
+
+    with pytest.raises(firebase_admin.auth.RevokedIdTokenError):
+        cache.verify("token")
+
+    mock_verify.side_effect = side_effect
+    assert cache.verify("token").uid == "uid-token"
+
+
+def test_least_recently_used_token_is_evicted(firebase):
+    mock_verify, _ = firebase
+    cache = TokenVerificationCache(revocation_check_seconds=60, max_entries=2)
+
+    cache.verify("a")
+    cache.verify("b")
+    cache.verify("a")
+    cache.verify("c")
+    cache.verify("a")
+    cache.verify("b")
+
+    assert [call.args[0] for call in mock_verify.call_args_list] == ["a", "b", "c", "b"]
+
+
+def test_invalidate_user_drops_their_tokens(firebase):
+    mock_verify, _ = firebase
+    cache = TokenVerificationCache(revocation_check_seconds=60, max_entries=10)
+    cache.verify("a")
+    cache.verify("b")
+
+    cache.invalidate_user("uid-a")
+    cache.verify("a")
+    cache.verify("b")
+
+    assert [call.args[0] for call in mock_verify.call_args_list] == ["a", "b", "a"]
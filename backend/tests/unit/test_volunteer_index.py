@@ -0,0 +1,147 @@
+"""Unit tests for the in-memory volunteer feature index.
+
+The database fetch is replaced with an in-memory list of (User, UserData) rows so the
+segmenting and incremental refresh logic can be tested without Postgres.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.models import User, UserData
+from app.models.User import Language
+from app.utilities.volunteer_index import VolunteerFeatureIndex
+
+
+def _volunteer(language=Language.ENGLISH, has_blood_cancer="yes", caring_for_someone="no"):
+    user_id = uuid4()
+    user = User(id=user_id, first_name="Vol", last_name="Unteer", email=f"{user_id}@example.com", language=language)
+    user_data = UserData(user_id=user_id, has_blood_cancer=has_blood_cancer, caring_for_someone=caring_for_someone)
+    return user, user_data
+
+
+@pytest.fixture
+def rows():
+    return []
+
+
+@pytest.fixture
+def index(monkeypatch, rows):
+    index = VolunteerFeatureIndex(ttl_seconds=300)
+    fetch_calls = []
+
+    def fake_fetch(db, user_id=None):
+        fetch_calls.append(user_id)
+        return [row for row in rows if user_id is None or row[0].id == user_id]
+
+    monkeypatch.setattr(index, "_fetch_rows", fake_fetch)
+    index.fetch_calls = fetch_calls
+    return index
+
+
+def _segment_ids(index, language):
+    return {
+        volunteer_type: [v.user_id for v in volunteers]
+        for volunteer_type, (volunteers, _) in index.get_segments(None, language).items()
+    }
+
+
+def test_segments_by_language_and_type(index, rows):
+    patient = _volunteer()
+    caregiver = _volunteer(has_blood_cancer="no", caring_for_someone="yes")
+    french = _volunteer(language=Language.FRENCH)
+    rows.extend([patient, caregiver, french])
+
+    assert _segment_ids(index, Language.ENGLISH) == {"patient": [patient[0].id], "caregiver": [caregiver[0].id]}
+    assert _segment_ids(index, Language.FRENCH) == {"patient": [french[0].id]}
+
+
+def test_segments_are_served_from_memory(index, rows):
+    rows.append(_volunteer())
+
+    index.get_segments(None, Language.ENGLISH)
+    index.get_segments(None, Language.ENGLISH)
+
+    assert index.fetch_calls == [None]
+
+
+def test_pool_is_reused_until_segment_changes(index, rows):
+    rows.append(_volunteer())
+    _, pool = index.get_segments(None, Language.ENGLISH)["patient"]
+    assert index.get_segments(None, Language.ENGLISH)["patient"][1] is pool
+
+    new_volunteer = _volunteer()
+    rows.append(new_volunteer)
+    index.refresh_user(None, new_volunteer[0].id)
+
+    volunteers, new_pool = index.get_segments(None, Language.ENGLISH)["patient"]
+    assert new_pool is not pool
+    assert new_pool.size == 2
+    assert [v.user_id for v in volunteers][-1] == new_volunteer[0].id
+
+
+def test_refresh_moves_volunteer_between_segments(index, rows):
+    user, user_data = _volunteer()
+    rows.append((user, user_data))
+    index.get_segments(None, Language.ENGLISH)
+
+    user.language = Language.FRENCH
+    user_data.has_blood_cancer = "no"
+    user_data.caring_for_someone = "yes"
+    index.refresh_user(None, str(user.id))
+
+    assert _segment_ids(index, Language.ENGLISH) == {"patient": []}
+    assert _segment_ids(index, Language.FRENCH) == {"caregiver": [user.id]}
+
+
+def test_refresh_removes_ineligible_volunteer(index, rows):
+    volunteer = _volunteer()
+    rows.append(volunteer)
+    index.get_segments(None, Language.ENGLISH)
+
+    # Deactivated volunteers no longer come back from the eligibility query
+    rows.clear()
+    index.refresh_user(None, volunteer[0].id)
+
+    assert _segment_ids(index, Language.ENGLISH) == {"patient": []}
+
+
+def test_refresh_before_load_is_a_noop(index, rows):
+    rows.append(_volunteer())
+
+    index.refresh_user(None, rows[0][0].id)
+
+    assert index.fetch_calls == []
+
+
+def test_refresh_failure_invalidates_index(index, rows, monkeypatch):
+    rows.append(_volunteer())
+    index.get_segments(None, Language.ENGLISH)
+
+    def failing_fetch(db, user_id=None):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(index, "_fetch_rows", failing_fetch)
+    index.refresh_user(None, rows[0][0].id)
+
+    assert index._loaded_at is None
+
+
+def test_remove_user(index, rows):
+    volunteer = _volunteer()
+    rows.append(volunteer)
+    index.get_segments(None, Language.ENGLISH)
+
+    index.remove_user(volunteer[0].id)
+
+    assert _segment_ids(index, Language.ENGLISH) == {"patient": []}
+
+
+def test_expired_index_is_reloaded(index, rows):
+    rows.append(_volunteer())
+    index.get_segments(None, Language.ENGLISH)
+    index.ttl_seconds = -1
+
+    index.get_segments(None, Language.ENGLISH)
+
+    assert index.fetch_calls == [None, None]
@@ -3,7 +3,7 @@
 Script to update SES email templates in AWS.
 Run this script to:
 1. Compile Jinja2 templates (.j2) to HTML files
-2. Update existing templates with the latest HTML/text content in AWS SES
+2. Upload the templates whose HTML/text content changed to AWS SES
 """
 
 import os
@@ -99,6 +99,6 @@ if __name__ == "__main__":
     compile_jinja_templates()
 
     print("\n=== Updating SES Templates in AWS ===\n")
-    ensure_ses_templates(force_update=True)
+    ensure_ses_templates()
 
     print("\n✓ Done!")
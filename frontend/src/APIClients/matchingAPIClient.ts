@@ -3,6 +3,7 @@
  */
 
 import baseAPIClient from './baseAPIClient';
+import { MatchCreateRequest } from './matchAPIClient';
 
 export interface AdminMatchCandidate {
   volunteerId: string;
@@ -31,17 +32,69 @@ export interface AdminMatchCandidate {
 
 export interface AdminMatchesResponse {
   matches: AdminMatchCandidate[];
+  nextCursor?: string | null;
+}
+
+export interface AdminMatchesQuery {
+  pageSize?: number;
+  minScore?: number;
+  cursor?: string;
+}
+
+export interface AssignmentRequest {
+  participantIds?: string[];
+  allPending?: boolean;
+  capacity?: number;
+  candidatesPerParticipant?: number;
+  minScore?: number;
+  useProcessPool?: boolean;
+}
+
+export interface AssignmentProposal {
+  participantId: string;
+  volunteerId: string;
+  firstName: string | null;
+  lastName: string | null;
+  email: string;
+  matchScore: number;
+  matchCount: number;
+}
+
+export interface AssignmentProposalResponse {
+  proposals: AssignmentProposal[];
+  matchRequests: MatchCreateRequest[];
+  unassignedParticipantIds: string[];
+  totalScore: number;
 }
 
 export const matchingAPIClient = {
   /**
    * Get potential volunteer matches for a participant (admin only)
    * @param participantId Participant user ID
+   * @param query Optional page size, minimum score (0-100) and cursor from a previous page
    * @returns List of volunteer matches with full details and scores
    */
-  getAdminMatches: async (participantId: string): Promise<AdminMatchesResponse> => {
+  getAdminMatches: async (
+    participantId: string,
+    query: AdminMatchesQuery = {},
+  ): Promise<AdminMatchesResponse> => {
     const response = await baseAPIClient.get<AdminMatchesResponse>(
       `/matching/admin/${participantId}`,
+      { params: query },
+    );
+    return response.data;
+  },
+
+  /**
+   * Propose one volunteer per participant, maximizing the total match score (admin only).
+   * Nothing is saved; approve proposals by passing matchRequests to matchAPIClient.createMatches.
+   * @param request Participant ids (or allPending) and the per-volunteer capacity
+   * @returns Proposed matches and the participants left unassigned
+   */
+  proposeAssignments: async (request: AssignmentRequest): Promise<AssignmentProposalResponse> => {
+    const response = await baseAPIClient.post<AssignmentProposalResponse>(
+      '/matching/admin/assignments',
+      request,
     );
     return response.data;
   },